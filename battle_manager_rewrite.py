@@ -3,11 +3,12 @@ import random
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 
-from typing import Tuple, Optional
+from typing import Callable, Tuple, Optional
 from src.actions.actions import Action, SwitchIn
 from src.actions.choose_action import ChooseAction
 from src.events.event_queue import EventQueue
-from src.events.listener import Listener, ListenerManager
+from src.events.listener import Listener, ListenerFilter, ListenerManager
+from src.events.phases import Phase
 from src.events.priority import Priority, MAX_PRIORITY, MIN_PRIORITY
 from src.state.pokestate import (
     PokemonState,
@@ -17,24 +18,35 @@ from src.state.pokestate import (
     print_battle_state,
 )
 from src.events.game_state import GameState
+from src.events.battle_log import log
+from src.state.rng import BattleRng, GLOBAL_RNG
 
 
 class DeathListener(Listener[BattleState]):
     datatype = BattleState
 
-    def __init__(self, player: Player, slot: int):
+    def __init__(
+        self,
+        player: Player,
+        slot: int,
+        choose_action: Callable[[Player], Action] = ChooseAction,
+    ):
         self.player = player
         self.slot = slot
+        self.choose_action = choose_action
+
+    def listener_filter(self) -> ListenerFilter:
+        return ListenerFilter(phases=(Phase.FAINT_REPLACEMENT,))
 
-    # TODO: Listener needs to make sure it doesn't get put in listen loop.
     def on_event(self, input: BattleState, event_queue: EventQueue) -> bool:
         mon = input.get_player(self.player).get_active_mon(self.slot)
         if mon and mon.fainted:
-            print(f"{mon.name} fainted!")
+            log("faint", "%s fainted!", mon.name)
             # TODO: incorporate source slot into the action (as it will be needed)
-            event_queue.remove_event(lambda event: event.player == self.player)
+            # Anything still queued for the fainted side is stale.
+            event_queue.cancel(self.player)
             event_queue.add_event(
-                ChooseAction(self.player), Priority(MIN_PRIORITY, mon.speed)
+                self.choose_action(self.player), Priority(MIN_PRIORITY, mon.speed)
             )
         return True
 
@@ -47,27 +59,115 @@ class DeathListener(Listener[BattleState]):
 
 
 class BattleManager:
-    def __init__(self, battle_state: BattleState):
+    """
+    Runs a battle to completion.
+
+    `choose_action` builds the decision action for a player (stdin-driven
+    ChooseAction by default). With `verbose=False` the board is not reprinted
+    every turn, and `max_turns` caps the battle length (None = no cap).
+    Every random draw comes from `rng`.
+
+    Pass an existing `game_state` (e.g. a copy taken for search) instead of
+    building one, and call resume() to play it on from its current turn.
+    """
+
+    def __init__(
+        self,
+        battle_state: BattleState,
+        choose_action: Callable[[Player], Action] = ChooseAction,
+        verbose: bool = True,
+        max_turns: Optional[int] = None,
+        rng: BattleRng = GLOBAL_RNG,
+        game_state: Optional[GameState] = None,
+    ):
         self._turn_counter = -1
-        self._game_state = GameState(
-            battle_state,
-            EventQueue[Action, Priority](),
-            ListenerManager(),
-        )
+        self._choose_action = choose_action
+        self._verbose = verbose
+        self._max_turns = max_turns
+        # Phases whose hooks already fired this turn. Lead-in switches count as "all".
+        self._phases_run = set(Phase)
+        if game_state is None:
+            game_state = GameState(
+                battle_state,
+                EventQueue[Action, Priority](),
+                ListenerManager(),
+                rng=rng,
+            )
+        self._game_state = game_state
+
+    @property
+    def game_state(self) -> GameState:
+        return self._game_state
+
+    @property
+    def turn_counter(self) -> int:
+        return self._turn_counter
 
     def _turn_ended(self) -> bool:
         return self._game_state.event_queue.empty()
 
+    def _run_phase_hooks(self, phase: Phase):
+        self._game_state.phase = phase
+        self._game_state.listener_manager.listen(
+            self._game_state.battle_state, self._game_state.event_queue, phase=phase
+        )
+
+    def _enter_phase(self, phase: Phase) -> bool:
+        """
+        Fire `phase`'s hooks the first time an action of that phase is due this
+        turn; True if they ran.
+        """
+        if phase not in self._phases_run:
+            self._phases_run.add(phase)
+            self._run_phase_hooks(phase)
+            return True
+        self._game_state.phase = phase
+        return False
+
+    def _end_turn(self):
+        """Residual effects once, then faint replacement (repeated until nobody needs one)."""
+        if Phase.RESIDUAL not in self._phases_run:
+            self._phases_run.add(Phase.RESIDUAL)
+            self._run_phase_hooks(Phase.RESIDUAL)
+        # Replacement switches run outside the regular phases, without re-firing their hooks.
+        self._phases_run.update(Phase)
+        self._run_phase_hooks(Phase.FAINT_REPLACEMENT)
+
     def _add_death_listeners(self):
         for player in [Player.PLAYER_1, Player.PLAYER_2]:
             # Register death listeners for each player's Pokemon
             for slot in range(len(self._game_state.battle_state.get_player(player).active_mons)):
                 pokemon_id = (player, self._game_state.battle_state.get_player(player).active_mons[slot])
                 self._game_state.listener_manager.add_listener(
-                    pokemon_id, DeathListener(player, slot)
+                    pokemon_id, DeathListener(player, slot, self._choose_action)
                 )
 
+    def _turn_limit_reached(self) -> bool:
+        return self._max_turns is not None and self._turn_counter + 1 >= self._max_turns
+
+    def _start_turn(self):
+        self._phases_run = set()
+        self._turn_counter += 1
+        self._game_state.battle_state.turn_count = self._turn_counter
+        self._game_state.event_queue.add_event(
+            self._choose_action(Player.PLAYER_1), Priority(MAX_PRIORITY, 0)
+        )
+        self._game_state.event_queue.add_event(
+            self._choose_action(Player.PLAYER_2), Priority(MAX_PRIORITY, 0)
+        )
+        if self._verbose:
+            print(f"Turn {self._turn_counter} starts!")
+            print_battle_state(
+                self._game_state.battle_state, f"Turn {self._turn_counter}",
+                self._game_state.field_state,
+            )
+            print("=========")
+
     def execution_loop(self):
+        self._lead_in()
+        self._run()
+
+    def _lead_in(self):
         self._add_death_listeners()
 
         self._game_state.event_queue.add_event(
@@ -76,35 +176,48 @@ class BattleManager:
         self._game_state.event_queue.add_event(
             SwitchIn(Player.PLAYER_2, 0), Priority(0, 0)
         )
+
+    def resume(self):
+        """
+        Play on from a position taken at a decision point: pending faint
+        replacements first if an active Pokemon is down, else the current turn's
+        choices again. Expects no DeathListeners and an empty queue.
+        """
+        self._prepare_resume()
+        self._run()
+
+    def _prepare_resume(self):
+        self._add_death_listeners()
+        battle_state = self._game_state.battle_state
+        self._turn_counter = battle_state.turn_count
+        replacing = any(
+            battle_state.get_player(player).get_active_mon(0).fainted
+            for player in (Player.PLAYER_1, Player.PLAYER_2)
+        )
+        if not replacing:
+            self._turn_counter -= 1  # _start_turn re-opens turn_count
+
+    def _run(self):
         # Implement the logic for executing a turn in the battle
-        while not self._game_state.battle_state.is_finished():
-            if self._turn_ended():
-                self._turn_counter += 1
-                self._game_state.event_queue.add_event(
-                    ChooseAction(Player.PLAYER_1), Priority(MAX_PRIORITY, 0)
-                )
-                self._game_state.event_queue.add_event(
-                    ChooseAction(Player.PLAYER_2), Priority(MAX_PRIORITY, 0)
-                )
-                print(f"Turn {self._turn_counter} starts!")
-                print_battle_state(
-                    self._game_state.battle_state, f"Turn {self._turn_counter}",
-                    self._game_state.field_state,
-                )
-                print("=========")
-            priority, next_action = self._game_state.event_queue.get_next_event()
-            if not isinstance(next_action, Action):
-                self._game_state.listener_manager.listen(
-                    self._game_state.battle_state, self._game_state.event_queue
-                )
+        while (next_action := self._next_action()) is not None:
             next_action.execute(self._game_state)
-            if not isinstance(next_action, ChooseAction):
-                self._game_state.listener_manager.listen(
-                    self._game_state.battle_state, self._game_state.event_queue
-                )
 
-            # TODO : Reorder action queue based on new priorities
-            self._game_state.event_queue.reorder()
+    def _next_action(self) -> Optional[Action]:
+        """Pop the next action to execute, entering its phase; None once the battle stops."""
+        while not self._game_state.battle_state.is_finished():
+            if self._turn_ended():
+                self._end_turn()
+                if not self._turn_ended():
+                    continue  # faint replacements were queued
+                if self._game_state.battle_state.is_finished() or self._turn_limit_reached():
+                    return None
+                self._start_turn()
+            event_queue = self._game_state.event_queue
+            if self._enter_phase(event_queue.peek()[1].phase):
+                continue  # the hooks ran with the head action still queued and may have cancelled it
+            priority, next_action = event_queue.get_next_event()
+            return next_action
+        return None
 
 
 if __name__ == "__main__":
@@ -1,7 +1,12 @@
-from src.actions.actions import Action
+from src.actions.base_actions import Action, EffectAction
+from src.actions.effects import PokemonEffect
+from src.dex.abilitydex import get_ability_by_name
+from src.events.ability_listeners import FlashFireListener, LevitateListener, VoltAbsorbListener
 from src.events.game_state import GameState
 from src.state.pokestate_defs import Player
 from src.events.priority import Priority
+from src.events.battle_log import log
+from src.events.phases import Phase
 
 
 def _normalize(name: str) -> str:
@@ -16,13 +21,13 @@ class AbilityRegisterAction(Action):
     Flash Fire, Levitate).
     """
 
+    phase = Phase.ABILITY_ENTRY
+
     def __init__(self, player: Player, slot: int = 0):
         super().__init__(player)
         self.slot = slot
 
     def execute(self, game_state: GameState):
-        from src.dex.abilitydex import get_ability_by_name
-
         mon = game_state.battle_state.get_player(self.player).get_active_mon(self.slot)
         if mon is None or mon.fainted or mon.ability is None:
             return
@@ -31,7 +36,7 @@ class AbilityRegisterAction(Action):
         if ability is None:
             return
 
-        print(f"{mon.name}'s ability: {ability.name}!")
+        log("ability", "%s's ability: %s!", mon.name, ability.name)
         normalized = _normalize(mon.ability)
 
         if normalized == "intimidate":
@@ -46,40 +51,31 @@ class AbilityRegisterAction(Action):
             self._register_levitate(game_state)
 
     def _apply_intimidate(self, game_state: GameState, mon) -> None:
-        from src.actions.actions import EffectAction
-        from src.actions.effects import PokemonEffect
-
         opponent = Player.opponent(self.player)
         opp_mon = game_state.battle_state.get_player(opponent).get_active_mon(0)
-        print(f"{mon.name}'s Intimidate lowered {opp_mon.name}'s Attack!")
-        game_state.event_queue.add_event(
-            EffectAction(opponent, PokemonEffect("attack", "-1"), 0),
-            Priority(4, 0),
-        )
+        log("ability", "%s's Intimidate lowered %s's Attack!", mon.name, opp_mon.name)
+        effect = EffectAction(opponent, PokemonEffect("attack", "-1"), 0)
+        effect.phase = Phase.ABILITY_ENTRY
+        game_state.event_queue.add_event(effect, Priority(4, 0))
 
     def _apply_drought(self, game_state: GameState, mon) -> None:
+        game_state.battle_state.record(game_state.field_state)
         game_state.field_state.weather = "sun"
-        print(f"The sunlight turned harsh due to {mon.name}'s Drought!")
+        log("ability", "The sunlight turned harsh due to %s's Drought!", mon.name)
 
     def _register_volt_absorb(self, game_state: GameState) -> None:
-        from src.events.ability_listeners import VoltAbsorbListener
-
         game_state.listener_manager.add_listener(
             (self.player, self.slot),
             VoltAbsorbListener(self.player, self.slot, game_state),
         )
 
     def _register_flash_fire(self, game_state: GameState) -> None:
-        from src.events.ability_listeners import FlashFireListener
-
         game_state.listener_manager.add_listener(
             (self.player, self.slot),
             FlashFireListener(self.player, self.slot, game_state),
         )
 
     def _register_levitate(self, game_state: GameState) -> None:
-        from src.events.ability_listeners import LevitateListener
-
         game_state.listener_manager.add_listener(
             (self.player, self.slot),
             LevitateListener(self.player, self.slot, game_state),
@@ -1,23 +1,19 @@
-from abc import ABC, abstractmethod
-
-from src.events.event_queue import EventQueue
+from src.actions.ability_register_action import AbilityRegisterAction
+from src.actions.base_actions import Action, DamageAction, EffectAction, HealAction  # noqa: F401 (re-exported)
+from src.actions.status_actions import ApplyStatusAction
 from src.events.game_state import GameState
-from src.state.pokestate import BattleState, PlayerState, PokemonState
 from src.state.pokestate import Player
 from src.state.pokestate_defs import MoveHitEvent, SwitchInEvent
-from src.state.field import apply_hazards_on_entry
-from src.actions.effects import Effect, from_move
+from src.state.field import HAZARD_DEFS
+from src.state.type_chart import dual_effectiveness
 from src.events.priority import Priority
+from src.events.battle_log import log
+from src.events.phases import Phase
 
-class Action(ABC):
-    def __init__(self, player: Player):
-        self.player = player
-
-    @abstractmethod
-    def execute(self, game_state: GameState):
-        pass
 
 class SwitchIn(Action):
+    phase = Phase.SWITCH
+
     def __init__(self, player: 'Player', new_idx: int):
         super().__init__(player)
         self.pokemon_idx = new_idx
@@ -38,13 +34,19 @@ class SwitchIn(Action):
         game_state.listener_manager.listen(
             SwitchInEvent(self.player, 0), game_state.event_queue
         )
-        outgoing_mon = game_state.battle_state.get_player(self.player).get_active_mon(0)
+        player_state = game_state.battle_state.get_player(self.player)
+        outgoing_mon = player_state.get_active_mon(0)
+        battle_state = game_state.battle_state
+        battle_state.record(outgoing_mon)
+        battle_state.record(player_state.pk_list[self.pokemon_idx])  # hazards hit it on entry
+        battle_state.record(player_state)
+        battle_state.record(game_state.field_state.get_side(self.player).hazards)
         outgoing_mon.reset_boosts()
-        game_state.battle_state.get_player(self.player).switch_pokemon(0, self.pokemon_idx)
+        player_state.switch_pokemon(0, self.pokemon_idx)
+        player_state.pk_list[self.pokemon_idx].revealed = True  # the opponent has now seen it
         apply_hazards_on_entry(self.player, game_state)
 
         # Queue ability registration — fires at priority 5, after hazards but before moves.
-        from src.actions.ability_register_action import AbilityRegisterAction
         incoming_mon = game_state.battle_state.get_player(self.player).get_active_mon(0)
         game_state.event_queue.add_event(
             AbilityRegisterAction(self.player, 0),
@@ -52,49 +54,64 @@ class SwitchIn(Action):
         )
 
 
-class HealAction(Action):
-    def __init__(self, player: 'Player', amount: int, target_idx: int):
-        super().__init__(player)
-        self.amount = amount
-        self.target_idx = target_idx
-
-    def execute(self, game_state: GameState):
-        target_mon = game_state.battle_state.get_player(self.player).get_active_mon(self.target_idx)
-        if target_mon and not target_mon.fainted:
-            old_hp = target_mon.hp
-            target_mon.hp = target_mon.hp + self.amount
-            actual = target_mon.hp - old_hp
-            print(f"{target_mon.name} restored {actual} HP!")
+# ---------------------------------------------------------------------------
+# Hazard application
+# ---------------------------------------------------------------------------
+
+def apply_hazards_on_entry(player: Player, game_state) -> None:
+    """
+    Apply all active hazards on `player`'s side to the Pokemon that just switched in.
+    Must be called after switch_pokemon() so the incoming mon is already active.
+    """
+    player_state = game_state.battle_state.get_player(player)
+    incoming_mon = player_state.get_active_mon(0)
+    side = game_state.field_state.get_side(player)
+
+    to_remove = []
+    for hazard_name, layers in list(side.hazards.items()):
+        hazard_def = HAZARD_DEFS.get(hazard_name)
+        if hazard_def is None:
+            continue
+
+        incoming_types = [t for t in (incoming_mon.type1, incoming_mon.type2) if t is not None]
+
+        # Check immunity: if the incoming Pokemon has any immune type, skip entirely.
+        if any(t in hazard_def.immune_types for t in incoming_types):
+            continue
+
+        # Check cleanse: if the incoming Pokemon has a cleanse type, absorb the hazard.
+        if any(t in hazard_def.cleanse_types for t in incoming_types):
+            to_remove.append(hazard_name)
+            log("hazard", "%s absorbed the %s!", incoming_mon.name, hazard_name)
+            continue
+
+        # Calculate flat damage from damage_per_layer.
+        flat_fraction = 0.0
+        if isinstance(hazard_def.damage_per_layer, list):
+            idx = min(layers, len(hazard_def.damage_per_layer)) - 1
+            flat_fraction = hazard_def.damage_per_layer[idx]
         else:
-            print("Heal had no target!")
-
-
-class EffectAction(Action):
-    def __init__(self, player: 'Player', effect: 'Effect', target_idx: int):
-        super().__init__(player)
-        self.effect = effect
-        self.target_idx = target_idx
-
-    def execute(self, game_state: GameState):
-        target = game_state.battle_state.get_player(self.player).get_active_mon(self.target_idx)
-        if target:
-            # Apply the effect to the target
-            self.effect.apply(target)
-            print(f"Applied {self.effect} to {target.name}!")
-
-class DamageAction(Action):
-    def __init__(self, player: 'Player', damage: int, src_idx: int, target_idx: int):
-        super().__init__(player)
-        self.player = player
-        self.damage = damage
-        self.src_idx = src_idx
-        self.target_idx = target_idx
-
-    def execute(self, game_state: GameState):
-        target_mon = game_state.battle_state.get_opponent(self.player).get_active_mon(self.target_idx)
-        if target_mon and not target_mon.fainted:
-            target_mon.hp = target_mon.hp - self.damage
-            print(f"Dealt {self.damage} damage!")
-        else:
-            print("Damage had no target!")
-
+            flat_fraction = hazard_def.damage_per_layer * layers
+
+        # Calculate type-scaled damage (e.g. Stealth Rock).
+        type_fraction = 0.0
+        if hazard_def.type_scaled_damage > 0:
+            effectiveness = dual_effectiveness(
+                hazard_def.type, incoming_mon.type1, incoming_mon.type2
+            )
+            type_fraction = hazard_def.type_scaled_damage * effectiveness
+
+        total_damage = int((flat_fraction + type_fraction) * incoming_mon.hp_max)
+        if total_damage > 0:
+            log("hazard", "%s was hurt by %s! (-%d HP)", incoming_mon.name, hazard_name, total_damage)
+            incoming_mon.hp = max(incoming_mon.hp - total_damage, 0)
+
+        # Apply status if defined for this layer count.
+        if hazard_def.status_by_layer and not incoming_mon.fainted:
+            status_idx = min(layers, len(hazard_def.status_by_layer)) - 1
+            status = hazard_def.status_by_layer[status_idx]
+            if status is not None and not incoming_mon.statused:
+                ApplyStatusAction(player, 0, status).execute(game_state)
+
+    for hazard_name in to_remove:
+        del side.hazards[hazard_name]
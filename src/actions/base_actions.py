@@ -0,0 +1,76 @@
+"""
+Primitive actions: the Action base class and the HP / effect changes that
+every other action and listener builds on. They depend only on state and
+event modules, so anything can import them without an import cycle.
+"""
+
+from abc import ABC, abstractmethod
+
+from src.events.game_state import GameState
+from src.state.pokestate import Player
+from src.actions.effects import Effect
+from src.events.battle_log import log
+from src.events.phases import Phase
+
+
+class Action(ABC):
+    # Turn phase the action belongs to; an instance may override it.
+    phase: Phase = Phase.MOVE
+
+    def __init__(self, player: Player):
+        self.player = player
+
+    @abstractmethod
+    def execute(self, game_state: GameState):
+        pass
+
+
+class HealAction(Action):
+    def __init__(self, player: 'Player', amount: int, target_idx: int):
+        super().__init__(player)
+        self.amount = amount
+        self.target_idx = target_idx
+
+    def execute(self, game_state: GameState):
+        target_mon = game_state.battle_state.get_player(self.player).get_active_mon(self.target_idx)
+        if target_mon and not target_mon.fainted:
+            game_state.battle_state.record(target_mon)
+            old_hp = target_mon.hp
+            target_mon.hp = target_mon.hp + self.amount
+            actual = target_mon.hp - old_hp
+            log("heal", "%s restored %d HP!", target_mon.name, actual)
+        else:
+            log("heal", "Heal had no target!")
+
+
+class EffectAction(Action):
+    def __init__(self, player: 'Player', effect: 'Effect', target_idx: int):
+        super().__init__(player)
+        self.effect = effect
+        self.target_idx = target_idx
+
+    def execute(self, game_state: GameState):
+        target = game_state.battle_state.get_player(self.player).get_active_mon(self.target_idx)
+        if target:
+            game_state.battle_state.record(target)
+            # Apply the effect to the target
+            self.effect.apply(target)
+            log("effect", "Applied %s to %s!", self.effect, target.name)
+
+class DamageAction(Action):
+    def __init__(self, player: 'Player', damage: int, src_idx: int, target_idx: int):
+        super().__init__(player)
+        self.player = player
+        self.damage = damage
+        self.src_idx = src_idx
+        self.target_idx = target_idx
+
+    def execute(self, game_state: GameState):
+        target_mon = game_state.battle_state.get_opponent(self.player).get_active_mon(self.target_idx)
+        if target_mon and not target_mon.fainted:
+            game_state.battle_state.record(target_mon)
+            target_mon.hp = target_mon.hp - self.damage
+            log("damage", "Dealt %d damage!", self.damage)
+        else:
+            log("damage", "Damage had no target!")
+
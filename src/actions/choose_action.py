@@ -1,104 +1,94 @@
+from typing import List, Optional, Union
+
 from src.actions.actions import Action, SwitchIn
+from src.actions.decision import (  # noqa: F401 (Choice, ChoiceKind, Policy are re-exported)
+    Choice,
+    ChoiceKind,
+    DecisionProvider,
+    Policy,
+    StdinProvider,
+    as_provider,
+    legal_choices,
+)
 from src.actions.move_action import MoveAction
 from src.events.game_state import GameState
 from src.events.event_queue import EventQueue
+from src.events.phases import Phase
 from src.events.priority import Priority
+from src.events.pursuit_listener import PursuitListener
 from src.state.pokestate import PlayerState
 from src.state.pokestate_defs import Player
 
 
 class ChooseAction(Action):
-    def __init__(self, player: "Player"):
+    """
+    Asks a DecisionProvider (stdin by default) to pick among the legal choices
+    for each active slot, then queues the resulting actions.
+    """
+
+    phase = Phase.DECISION
+
+    def __init__(
+        self,
+        player: "Player",
+        provider: Optional[Union[DecisionProvider, Policy]] = None,
+    ):
         super().__init__(player)
+        self.provider = as_provider(provider) if provider is not None else StdinProvider()
+        self.chosen: List[Choice] = []
 
     def execute(self, game_state: GameState):
-        print(f"Player {self.player}")
-        turn_count = game_state.battle_state.turn_count
-        # Get options
-        switch_options = game_state.battle_state.get_player(
-            self.player
-        ).get_available_pokemon()
-        if switch_options:
-            print("Switch options:")
-            for i in switch_options:
-                pokemon = game_state.battle_state.get_player(self.player).pk_list[i]
-                print(f"{i + 1}. {pokemon.name} (HP: {pokemon.hp}/{pokemon.hp_max})")
         player_state = game_state.battle_state.get_player(self.player)
-        for active_idx in player_state.active_mons:
-            active_mon = player_state.pk_list[active_idx]
-            if active_mon.fainted:
+        for slot in range(len(player_state.active_mons)):
+            choices = legal_choices(player_state, slot)
+            if not choices:
+                # Nothing usable (e.g. out of PP with no bench): the slot passes.
                 continue
-            move_options = active_mon.moves
-            print(f"{active_mon.name} can use the following moves:")
-            for i, move in enumerate(move_options):
-                disabled = " (DISABLED)" if move.disabled else ""
-                print(f"  {i + 1}. {move.name} (PP: {move.pp}/{move.pp_max}){disabled}")
-        print()
-        self.choose_move(player_state, game_state.event_queue, turn_count, game_state)
+            choice = self.provider.choose(game_state, self.player, choices, slot)
+            if choice not in choices:
+                raise ValueError(f"Provider returned illegal choice {choice} for {self.player}")
+            self.chosen.append(choice)
+            self.queue_choice(choice, slot, player_state, game_state.event_queue, game_state)
 
-    def choose_move(
+    def queue_choice(
         self,
+        choice: Choice,
+        slot: int,
         player_state: PlayerState,
         event_loop: EventQueue["Action", "Priority"],
-        turn_count: int,
         game_state: GameState = None,
     ):
-        print(f"Choose one of the above moves (either move <x> or switch <x>)")
-        move_success = False
-        while not move_success:
-            try:
-                for i in range(len(player_state.active_mons)):
-                    choice = input(f"Your choice for mon {i}: ")
-                    active_mon = player_state.get_active_mon(i)
-                    if choice.startswith("move"):
-                        if active_mon.fainted:
-                            raise ValueError(
-                                f"Cannot use moves on {active_mon.name} as it is fainted."
-                            )
-                        _, move_str = choice.split()
-                        move_idx = int(move_str) - 1
-                        if active_mon.valid_move(move_idx):
-                            # TODO: Edit target for double battles.
-                            move = active_mon.moves[move_idx]
-                            event_loop.add_event(
-                                MoveAction(self.player, move_idx, i, i),
-                                Priority(
-                                    move.move_info.priority if move.move_info else 0,
-                                    active_mon.speed,
-                                ),
-                            )
-                            # Register PursuitListener immediately so it is in place
-                            # before SwitchIn (priority 6) can fire this same turn.
-                            if move.name == "Pursuit" and game_state is not None:
-                                from src.events.pursuit_listener import PursuitListener
-                                game_state.listener_manager.add_listener(
-                                    (self.player, i),
-                                    PursuitListener(
-                                        self.player, game_state, move_idx, i, i
-                                    ),
-                                )
-                        else:
-                            raise ValueError(
-                                f"Cannot use move {move_idx + 1} on {active_mon.name}."
-                            )
-                    elif choice.startswith("switch"):
-                        _, switch_str = choice.split()
-                        switch_idx = int(switch_str) - 1
-                        if switch_idx not in player_state.get_available_pokemon():
-                            raise ValueError(
-                                f"Cannot switch to {switch_idx + 1} as it is not available."
-                            )
+        """Queue the action for an already-validated choice made for active `slot`."""
+        active_mon = player_state.get_active_mon(slot)
+        if choice.kind == ChoiceKind.MOVE:
+            # TODO: Edit target for double battles.
+            move = active_mon.moves[choice.index]
+            event_loop.add_event(
+                MoveAction(self.player, choice.index, slot, slot),
+                Priority(
+                    move.move_info.priority if move.move_info else 0,
+                    active_mon.speed,
+                ),
+            )
+            # Register PursuitListener immediately so it is in place
+            # before SwitchIn (priority 6) can fire this same turn.
+            if move.name == "Pursuit" and game_state is not None:
+                game_state.listener_manager.add_listener(
+                    (self.player, slot),
+                    PursuitListener(
+                        self.player, game_state, choice.index, slot, slot
+                    ),
+                )
+        else:
+            event_loop.add_event(
+                SwitchIn(self.player, choice.index),
+                Priority(6, active_mon.speed),
+            )
+
+
+class PolicyChooseAction(ChooseAction):
+    """ChooseAction driven by a policy callable; kept for existing callers."""
 
-                        event_loop.add_event(
-                            SwitchIn(self.player, switch_idx),
-                            Priority(6, active_mon.speed),
-                        )
-                    else:
-                        raise ValueError(
-                            f"Invalid choice: {choice}. Please use 'move <x>' or 'switch <x>'."
-                        )
-                move_success = True
-            except ValueError as e:
-                print(e)
-            except IndexError as e:
-                print(e)
+    def __init__(self, player: "Player", policy: Policy):
+        super().__init__(player, policy)
+        self.policy = policy
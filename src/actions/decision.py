@@ -0,0 +1,136 @@
+"""
+Decision providers.
+
+A ChooseAction no longer reads or parses anything itself: for each active slot
+it computes the legal choices, hands them to a DecisionProvider and queues
+whatever structured Choice comes back. Built-in providers:
+
+  - RandomProvider        uniform over the legal choices (battle rng)
+  - ScriptedProvider      replays a fixed sequence of choices
+  - GreedyDamageProvider  move with the highest expected damage on the target
+  - StdinProvider         prompts a human; the only place text is parsed
+
+Any plain Policy callable can be used wherever a provider is expected; see
+as_provider().
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Optional, Sequence, Union
+
+from src.events.game_state import GameState
+from src.state.damage_calc import damage_distribution
+from src.state.legal_actions import Choice, ChoiceKind, legal_choices  # noqa: F401 (re-exported)
+from src.state.pokestate_defs import Player
+
+
+# A policy picks one of the legal choices for `player`'s active slot.
+Policy = Callable[[GameState, Player, Sequence[Choice]], Choice]
+
+
+class DecisionProvider(ABC):
+    """
+    Picks one Choice out of a non-empty list of legal choices for `player`'s
+    active `slot`. Providers are also Policies: calling one is choose() for slot 0.
+    """
+
+    @abstractmethod
+    def choose(
+        self, game_state: GameState, player: Player, choices: Sequence[Choice], slot: int = 0
+    ) -> Choice:
+        pass
+
+    def __call__(self, game_state: GameState, player: Player, choices: Sequence[Choice]) -> Choice:
+        return self.choose(game_state, player, choices)
+
+
+class PolicyProvider(DecisionProvider):
+    """Adapts a plain Policy callable."""
+
+    def __init__(self, policy: Policy):
+        self.policy = policy
+
+    def choose(self, game_state, player, choices, slot=0):
+        return self.policy(game_state, player, choices)
+
+
+def as_provider(provider: Union[DecisionProvider, Policy]) -> DecisionProvider:
+    return provider if isinstance(provider, DecisionProvider) else PolicyProvider(provider)
+
+
+class RandomProvider(DecisionProvider):
+    def choose(self, game_state, player, choices, slot=0):
+        return game_state.rng.choice(choices)
+
+
+class ScriptedProvider(DecisionProvider):
+    """
+    Returns the scripted choices in order. A scripted choice that is not legal
+    when its turn comes, or running out of script, defers to `fallback`; with
+    no fallback either one is an error.
+    """
+
+    def __init__(self, script: Iterable[Choice], fallback: Optional[DecisionProvider] = None):
+        self._script = iter(script)
+        self.fallback = fallback
+
+    def choose(self, game_state, player, choices, slot=0):
+        choice = next(self._script, None)
+        if choice in choices:
+            return choice
+        if self.fallback is not None:
+            return self.fallback.choose(game_state, player, choices, slot)
+        if choice is None:
+            raise ValueError(f"Script for {player} ran out of choices")
+        raise ValueError(f"Scripted choice {choice} is not legal for {player}")
+
+
+class GreedyDamageProvider(DecisionProvider):
+    """Use the move with the highest expected damage on the opposing slot; switch only when forced."""
+
+    def choose(self, game_state, player, choices, slot=0):
+        battle_state = game_state.battle_state
+        active_mon = battle_state.get_player(player).get_active_mon(slot)
+        target_mon = battle_state.get_player(Player.opponent(player)).get_active_mon(slot)
+        best, best_damage = choices[0], -1.0
+        for choice in choices:
+            if choice.kind != ChoiceKind.MOVE:
+                continue
+            move_info = active_mon.moves[choice.index].move_info
+            damage = damage_distribution(move_info, active_mon, target_mon).expected if move_info else 0.0
+            if damage > best_damage:
+                best, best_damage = choice, damage
+        return best
+
+
+class StdinProvider(DecisionProvider):
+    """
+    Shows the legal choices and reads "move <x>" / "switch <x>" (1-based) until
+    the answer names one of them. `read` and `write` default to input/print.
+    """
+
+    def __init__(self, read: Callable[[str], str] = input, write: Callable[[str], None] = print):
+        self.read = read
+        self.write = write
+
+    def choose(self, game_state, player, choices, slot=0):
+        player_state = game_state.battle_state.get_player(player)
+        active_mon = player_state.get_active_mon(slot)
+        by_command = {}
+        for choice in choices:
+            if choice.kind == ChoiceKind.MOVE:
+                move = active_mon.moves[choice.index]
+                label = f"{move.name} (PP: {move.pp}/{move.pp_max})"
+                command = f"move {choice.index + 1}"
+            else:
+                mon = player_state.pk_list[choice.index]
+                label = f"{mon.name} (HP: {mon.hp}/{mon.hp_max})"
+                command = f"switch {choice.index + 1}"
+            by_command[command] = choice
+            self.write(f"  {command}: {label}")
+
+        while True:
+            answer = " ".join(self.read(f"Player {player}, choice for {active_mon.name}: ").split())
+            choice = by_command.get(answer.lower())
+            if choice is not None:
+                return choice
+            self.write(f"Invalid choice: {answer!r}. Enter one of: {', '.join(by_command)}.")
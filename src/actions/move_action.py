@@ -1,4 +1,4 @@
-from src.actions.actions import Action, DamageAction
+from src.actions.base_actions import Action, DamageAction
 from src.actions.status_actions import ApplyStatusAction
 from src.state.pokestate import Player, BattleState, PokemonState
 from src.state.pokestate_defs import (
@@ -7,14 +7,21 @@ from src.state.pokestate_defs import (
     Status,
     Category,
     Target,
-    get_effectiveness,
+    MoveHitEvent,
+    SwitchInEvent,
     calculate_damage,
 )
 from src.state.field import HAZARD_DEFS
 from src.events.game_state import GameState
 from src.dex.moves import get_move_by_name
 from src.actions.effects import from_move
+from src.events.event_queue import FOLLOW_UP
 from src.events.priority import Priority
+from src.events.pursuit_listener import PursuitListener
+from src.events.battle_log import log
+from src.state.rng import BattleRng, GLOBAL_RNG
+from src.state.type_chart import dual_effectiveness
+from src.state.damage_calc import fixed_damage, stab_multiplier
 
 
 class MoveAction(Action):
@@ -26,48 +33,39 @@ class MoveAction(Action):
         self.target_idx = target_idx
 
     def calculate_move_damage(
-        self, move: Move, src_mon: PokemonState, target_mon: PokemonState
+        self,
+        move: Move,
+        src_mon: PokemonState,
+        target_mon: PokemonState,
+        rng: BattleRng = GLOBAL_RNG,
     ) -> int:
         if move.fixed_damage is not None:
-            effectiveness = 1.0
-            if target_mon.type1:
-                effectiveness *= get_effectiveness(move.type, target_mon.type1)
-            if target_mon.type2:
-                effectiveness *= get_effectiveness(move.type, target_mon.type2)
-            if effectiveness == 0:
-                return 0
-            if move.fixed_damage == "level":
-                return src_mon.level
-            return 0
+            return fixed_damage(move, src_mon, target_mon)
 
         base_power = move.power
         if base_power is None:
             return 0
-        effectiveness = 1.0
-        if target_mon.type1:
-            effectiveness *= get_effectiveness(move.type, target_mon.type1)
-        if target_mon.type2:
-            effectiveness *= get_effectiveness(move.type, target_mon.type2)
+        effectiveness = dual_effectiveness(move.type, target_mon.type1, target_mon.type2)
         if effectiveness < 1.0:
-            print("It's not very effective...")
+            log("move", "It's not very effective...")
         elif effectiveness > 1.0:
-            print("It's super effective!")
+            log("move", "It's super effective!")
         if effectiveness == 0:
             return 0
-        stab_multiplier = 1.0
-        if move.type == src_mon.type1 or move.type == src_mon.type2:
-            stab_multiplier = 1.5
         offensive_stat = src_mon.get_offensive_stat(move.category)
         defensive_stat = target_mon.get_defensive_stat(move.category)
         return calculate_damage(
-            base_power, offensive_stat, defensive_stat, effectiveness, stab_multiplier
+            base_power, offensive_stat, defensive_stat, effectiveness,
+            stab_multiplier(move.type, src_mon), rng,
         )
 
     def execute(self, game_state: GameState):
         player = game_state.battle_state.get_player(self.player)
         src_mon = player.get_active_mon(self.src_idx)
+        if src_mon.fainted:
+            return  # fainted earlier this turn; its replacement comes at end of turn
         move = src_mon.moves[self.move_idx]
-        dex_entry = get_move_by_name(move.name)
+        dex_entry = move.move_info or get_move_by_name(move.name)
         if move.disabled:
             return
         if not dex_entry:
@@ -78,8 +76,13 @@ class MoveAction(Action):
             target = game_state.battle_state.get_opponent(self.player).get_active_mon(
                 self.target_idx
             )
-        target_str = "" if dex_entry.target == Target.SELF else f" on {target.name}"
-        print(f"{src_mon.name} used {dex_entry.name}{target_str}!")
+        if not move.known:
+            game_state.battle_state.record(move)
+            move.known = True  # using a move reveals it to the opponent
+        if dex_entry.target == Target.SELF:
+            log("move", "%s used %s!", src_mon.name, dex_entry.name)
+        else:
+            log("move", "%s used %s on %s!", src_mon.name, dex_entry.name, target.name)
 
         if dex_entry.category != Category.STATUS:
             # TODO: Handle damage / healing to self target moves
@@ -87,15 +90,16 @@ class MoveAction(Action):
                 raise NotImplementedError(
                     "Currently only opponent targeting moves are implemented."
                 )
-            damage = self.calculate_move_damage(dex_entry, src_mon, target)
+            damage = self.calculate_move_damage(dex_entry, src_mon, target, game_state.rng)
             if damage > 0:
-                from src.state.pokestate_defs import MoveHitEvent
                 hit_event = MoveHitEvent(
                     attacker=self.player,
                     move=dex_entry,
                     src_mon=src_mon,
                     target_mon=target,
                     damage=damage,
+                    src_slot=self.src_idx,
+                    target_slot=self.target_idx,
                 )
                 game_state.listener_manager.listen(hit_event, game_state.event_queue)
                 if not hit_event.absorbed:
@@ -103,12 +107,11 @@ class MoveAction(Action):
                     game_state.event_queue.add_event(
                         DamageAction(self.player, actual_damage, self.src_idx, self.target_idx),
                         Priority(dex_entry.priority, src_mon.speed),
+                        FOLLOW_UP,
                     )
                 if dex_entry.name == "Pursuit":
                     # Pursuit fired normally (opponent didn't switch) — clean up the
                     # PursuitListener so it doesn't fire on a future opponent switch.
-                    from src.state.pokestate_defs import SwitchInEvent
-                    from src.events.pursuit_listener import PursuitListener
                     game_state.listener_manager.remove_listener_if(
                         SwitchInEvent,
                         lambda lst: (
@@ -118,11 +121,11 @@ class MoveAction(Action):
                         ),
                     )
             else:
-                print(f"It had no effect on {target.name}.")
+                log("move", "It had no effect on %s.", target.name)
         else:
             for effect in from_move(dex_entry):
                 if effect.property.name == "status":
-                    print(f"Applying status effect {effect.value}...")
+                    log("status", "Applying status effect %s...", effect.value)
                     # Currently only support inflicting status on target
                     game_state.event_queue.add_event(
                         ApplyStatusAction(
@@ -131,6 +134,7 @@ class MoveAction(Action):
                             Status(effect.value.lower()),
                         ),
                         Priority(dex_entry.priority, src_mon.speed),
+                        FOLLOW_UP,
                     )
                 else:
                     # TODO: Separate stat boosting effects from other effects
@@ -138,13 +142,16 @@ class MoveAction(Action):
                         "boosted" if effect.value.startswith("+") else "lowered"
                     )
                     if dex_entry.target == Target.SELF:
-                        print(
-                            f"{src_mon.name} {boost_name} its {effect.property.name} by {int(effect.value)}!"
+                        log(
+                            "effect", "%s %s its %s by %d!",
+                            src_mon.name, boost_name, effect.property.name, int(effect.value),
                         )
                     else:
-                        print(
-                            f"{src_mon.name} {boost_name} {target.name}'s {effect.property.name} by {effect.value}!"
+                        log(
+                            "effect", "%s %s %s's %s by %s!",
+                            src_mon.name, boost_name, target.name, effect.property.name, effect.value,
                         )
+                    game_state.battle_state.record(target)
                     effect.apply(target)
 
         # Hazard setting: place a hazard layer on the opponent's side.
@@ -154,15 +161,17 @@ class MoveAction(Action):
             if hazard_def:
                 current = opponent_side.hazards.get(dex_entry.hazard_set, 0)
                 if current < hazard_def.max_layers:
+                    game_state.battle_state.record(opponent_side.hazards)
                     opponent_side.hazards[dex_entry.hazard_set] = current + 1
-                    print(f"{dex_entry.hazard_set} was set on the opposing side! (layer {current + 1})")
+                    log("hazard", "%s was set on the opposing side! (layer %d)", dex_entry.hazard_set, current + 1)
                 else:
-                    print(f"{dex_entry.hazard_set} is already at maximum layers!")
+                    log("hazard", "%s is already at maximum layers!", dex_entry.hazard_set)
 
         # Hazard removal: clear all hazards from the user's own side.
         if dex_entry.hazard_remove:
             my_side = game_state.field_state.get_side(self.player)
             if my_side.hazards:
+                game_state.battle_state.record(my_side.hazards)
                 removed = list(my_side.hazards.keys())
                 my_side.hazards.clear()
-                print(f"{src_mon.name} cleared {', '.join(removed)} from the field!")
+                log("hazard", "%s cleared %s from the field!", src_mon.name, ", ".join(removed))
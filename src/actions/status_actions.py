@@ -7,12 +7,14 @@ particularly for moves like Thunder Wave that apply status conditions.
 
 from typing import Optional
 
-from src.actions.actions import Action
+from src.actions.base_actions import Action
 from src.state.pokestate import Player, BattleState, PokemonState
 from src.state.pokestate_defs import PokemonId, Status
 from src.events.event_queue import EventQueue
 from src.events.game_state import GameState
 from src.events.listener import ListenerManager, Listener
+from src.events.battle_log import log
+from src.events.phases import Phase
 from src.events.status_listeners import (
     StatusListener, 
     ParalysisListener, 
@@ -23,70 +25,94 @@ from src.events.status_listeners import (
     FreezeListener
 )
 from src.dex.moves import get_move_by_name
+from src.state.rng import BattleRng, GLOBAL_RNG
 
 class ApplyStatusAction(Action):
-    """Manages status effect listeners for Pokemon"""
+    """
+    Manages status effect listeners for Pokemon.
+
+    `pokemon_idx` is the target's active slot; the listener it creates is keyed
+    by the team index of the Pokemon in that slot, so it stays with that Pokemon.
+    """
     
     def __init__(self, player: Player, pokemon_idx: int, status: Status):
         self.status = status
         self.player = player
         self.pokemon_idx = pokemon_idx
+        self.team_idx: Optional[int] = None
         self.listener_manager: Optional[ListenerManager] = None
         self.battle_state: Optional[BattleState] = None
+        self.event_queue: Optional[EventQueue] = None
+        self.current_phase: Optional[Phase] = None
+        self.rng: BattleRng = GLOBAL_RNG
 
     def _can_apply_status(self, pokemon: 'PokemonState') -> bool:
         """Check if a status can be applied (prevents multiple status conditions)"""
         if pokemon.status != Status.NONE and pokemon.status != Status.FAINTED:
-            print(f"{pokemon.name} already has a status condition!")
+            log("status", "%s already has a status condition!", pokemon.name)
             return False
         return True
 
     def _apply_status(self, pokemon_id: PokemonId, status: Status, listener: Listener, message: str = "") -> bool:
         if not self.listener_manager or not self.battle_state:
             raise LookupError("ListenerManager or BattleState not set")
-        pokemon = self.battle_state.get_pokemon(pokemon_id)
+        pokemon = self.battle_state.get_player(pokemon_id[0]).pk_list[pokemon_id[1]]
         if not self._can_apply_status(pokemon):
             return False
+        self.battle_state.record(pokemon)
         pokemon.status = status
-        print(message.format(pokemon.name))
-        self.listener_manager.add_listener(pokemon_id, listener)
+        log("status", message, pokemon.name)
+        handle = self.listener_manager.add_listener(pokemon_id, listener)
+        if (
+            self.current_phase == Phase.MOVE
+            and Phase.MOVE in listener.listener_filter().phases
+            and self.event_queue.find(self.player, self.pokemon_idx, "MoveAction")
+        ):
+            # The MOVE-phase hooks already ran this turn; catch up so the status
+            # affects the target's still-pending move.
+            if not listener.on_phase(Phase.MOVE, self.battle_state, self.event_queue):
+                self.listener_manager.remove_handle(handle)
         return True
 
     def apply_paralysis(self, pokemon_id: PokemonId) -> bool:
         """Apply paralysis status and create listener"""
-        return self._apply_status(pokemon_id, Status.PARALYZED, ParalysisListener(self.player, self.pokemon_idx),
-                                   "{} is paralyzed! It may be unable to move!")
+        return self._apply_status(pokemon_id, Status.PARALYZED, ParalysisListener(self.player, self.team_idx, self.rng),
+                                   "%s is paralyzed! It may be unable to move!")
 
     def apply_poison(self, pokemon_id: PokemonId) -> bool:
         """Apply poison status and create listener"""
-        return self._apply_status(pokemon_id, Status.POISONED, PoisonListener(self.player, self.pokemon_idx),
-                                   "{} was poisoned!")
+        return self._apply_status(pokemon_id, Status.POISONED, PoisonListener(self.player, self.team_idx),
+                                   "%s was poisoned!")
 
     def apply_toxic(self, pokemon_id: PokemonId) -> bool:
         """Apply toxic status and create listener"""
-        return self._apply_status(pokemon_id, Status.TOXIC, ToxicListener(self.player, self.pokemon_idx),
-                                   "{} was badly poisoned!")
+        return self._apply_status(pokemon_id, Status.TOXIC, ToxicListener(self.player, self.team_idx),
+                                   "%s was badly poisoned!")
 
     def apply_burn(self, pokemon_id: PokemonId) -> bool:
         """Apply burn status and create listener"""
-        return self._apply_status(pokemon_id, Status.BURNED, BurnListener(self.player, self.pokemon_idx),
-                                   "{} was burned!")
+        return self._apply_status(pokemon_id, Status.BURNED, BurnListener(self.player, self.team_idx),
+                                   "%s was burned!")
 
     def apply_sleep(self, pokemon_id: PokemonId) -> bool:
         """Apply sleep status and create listener"""
-        return self._apply_status(pokemon_id, Status.SLEEP, SleepListener(self.player, self.pokemon_idx),
-                                   "{} fell asleep!")
+        return self._apply_status(pokemon_id, Status.SLEEP, SleepListener(self.player, self.team_idx, self.rng),
+                                   "%s fell asleep!")
 
     def apply_freeze(self, pokemon_id: PokemonId) -> bool:
         """Apply freeze status and create listener"""
-        return self._apply_status(pokemon_id, Status.FROZEN, FreezeListener(self.player, self.pokemon_idx),
-                                   "{} was frozen solid!")
+        return self._apply_status(pokemon_id, Status.FROZEN, FreezeListener(self.player, self.team_idx, self.rng),
+                                   "%s was frozen solid!")
                                 
     # TODO: Make this step a little cleaner.
     def execute(self, game_state: GameState):
         self.listener_manager = game_state.listener_manager
         self.battle_state = game_state.battle_state
-        pokemon_id = (self.player, self.pokemon_idx)
+        self.event_queue = game_state.event_queue
+        self.current_phase = game_state.phase
+        self.rng = game_state.rng
+        self.team_idx = self.battle_state.get_player(self.player).active_mons[self.pokemon_idx]
+        pokemon_id = (self.player, self.team_idx)
         if self.status == Status.PARALYZED:
             self.apply_paralysis(pokemon_id)
         elif self.status == Status.POISONED:
@@ -1,5 +1,6 @@
 from typing import Dict, Optional
 
+from src.dex.dex_index import NameIndex
 from src.state.pokestate_defs import Ability
 
 ABILITY_DEX: Dict[str, Ability] = {
@@ -26,9 +27,14 @@ ABILITY_DEX: Dict[str, Ability] = {
 }
 
 
-def _normalize(name: str) -> str:
-    return name.replace(" ", "").replace("-", "").lower()
+ABILITY_INDEX: NameIndex[Ability] = NameIndex(
+    enumerate(ABILITY_DEX.values()), lambda ability: ability.name
+)
 
 
 def get_ability_by_name(name: str) -> Optional[Ability]:
-    return ABILITY_DEX.get(_normalize(name))
+    return ABILITY_INDEX.get(name)
+
+
+def get_ability_index_by_name(name: str) -> Optional[int]:
+    return ABILITY_INDEX.id_of(name)
@@ -0,0 +1,385 @@
+"""
+Compiled dex data, memory-mapped and unpacked lazily.
+
+The Python data modules (gen1_moves.GEN1_MOVES, gen1_species.GEN1_POKEMON)
+remain the source of truth, but importing them evaluates hundreds of
+constructor calls. build() packs one generation into a binary file of
+fixed-size little-endian records, kept in a cache directory (cache_dir():
+$POKEMON_SIM_DEX_DIR if set, else pokemon-sim under $XDG_CACHE_HOME or
+~/.cache) as gen<N>-<checkout>.dex, so checkouts sharing a cache do not
+overwrite each other's files:
+
+  header    magic, format version, generation, source key, section table
+  moves     MOVE records in source order (a move's id is its position)
+  effects   EFFECT records (property, value), referenced by move
+  species   SPECIES records keyed by Pokédex number
+  strings   UTF-8 text; records refer to it by (offset, length), offset NONE for None
+  names     normalized move names, then species names, newline-separated in record order
+            (so the name indexes are built without unpacking any record)
+
+A GenerationDex maps its file on first access, so importing the dex costs
+nothing and process-pool workers share the pages through the OS page cache.
+Each Move / PokemonInfo is unpacked the first time it is asked for and then
+reused, so lookups keep returning the same object.
+
+The file is (re)built on first access when it is missing or its source key
+no longer matches the data modules. The key covers the size and modification
+time of each source file, so checking it costs a few stat() calls rather than
+reading the sources. If the file cannot be written, the packed data is used
+from memory instead. `python -m src.dex.compiled` rebuilds every
+generation ahead of time.
+"""
+
+import importlib
+import mmap
+import os
+import struct
+import sys
+import zlib
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.dex.dex_index import NameIndex, normalize_name
+from src.state.pokestate_defs import Category, Move, PokemonEffect, PokemonInfo, Target, Type
+
+MAGIC = b"PDEX"
+FORMAT_VERSION = 1  # bump whenever the record layout changes
+NONE = 0xFFFFFFFF  # string offset of None
+NO_TYPE = 0xFF
+
+# generation -> (moves module, attribute, species module, attribute); modules live in this package
+SOURCES: Dict[int, Tuple[str, str, str, str]] = {
+    1: ("gen1_moves", "GEN1_MOVES", "gen1_species", "GEN1_POKEMON"),
+}
+_HERE = os.path.dirname(os.path.abspath(__file__))
+DEX_DIR_ENV = "POKEMON_SIM_DEX_DIR"
+# Definitions the records depend on (enum values, dataclass fields).
+_LAYOUT_FILE = sys.modules[Move.__module__].__file__
+
+SECTIONS = ("moves", "effects", "species", "strings", "move_names", "species_names")
+HEADER = struct.Struct("<4sHHI" + "II" * len(SECTIONS))  # (offset, records or bytes) per section
+# name, description, type, category, power (-1: None), accuracy, pp, priority, target,
+# hazard_set, hazard_remove, fixed_damage, first effect, effect count
+MOVE = struct.Struct("<IHIHBBhBBbBIH?IHHB")
+EFFECT = struct.Struct("<IHIH")  # property, value
+# dex number, species, type1, type2 (NO_TYPE: None), hp, attack, defense, sp. attack, sp. defense,
+# speed, ability
+SPECIES = struct.Struct("<HIHBB6HIH")
+RECORDS = {"moves": MOVE, "effects": EFFECT, "species": SPECIES}
+
+
+def cache_dir() -> str:
+    """Directory the compiled files go in: $POKEMON_SIM_DEX_DIR, else pokemon-sim in the user cache."""
+    override = os.environ.get(DEX_DIR_ENV)
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "pokemon-sim")
+
+
+def default_path(generation: int) -> str:
+    """Where GenerationDex keeps `generation`'s file unless given a path."""
+    checkout = zlib.crc32(_HERE.encode("utf-8"))
+    return os.path.join(cache_dir(), f"gen{generation}-{checkout:08x}.dex")
+
+
+def _source_key(generation: int) -> int:
+    """CRC-32 of each source file's size and modification time; stats the files, never reads them."""
+    moves_module, _, species_module, _ = SOURCES[generation]
+    key = 0
+    paths = (os.path.join(_HERE, f"{moves_module}.py"), os.path.join(_HERE, f"{species_module}.py"), _LAYOUT_FILE)
+    for path in paths:
+        stat = os.stat(path)
+        key = zlib.crc32(struct.pack("<qq", stat.st_size, stat.st_mtime_ns), key)
+    return key
+
+
+class _Strings:
+    def __init__(self):
+        self.blob = bytearray()
+        self._offsets: Dict[str, int] = {}
+
+    def ref(self, text: Optional[str]) -> Tuple[int, int]:
+        if text is None:
+            return NONE, 0
+        data = text.encode("utf-8")
+        if text not in self._offsets:
+            self._offsets[text] = len(self.blob)
+            self.blob += data
+        return self._offsets[text], len(data)
+
+
+def pack(generation: int) -> bytes:
+    """The compiled file contents for `generation`, from its data modules."""
+    moves_module, moves_attr, species_module, species_attr = SOURCES[generation]
+    package = __package__  # also "src.dex" when run with -m
+    moves: List[Move] = getattr(importlib.import_module(f"{package}.{moves_module}"), moves_attr)
+    species: Dict[int, PokemonInfo] = getattr(importlib.import_module(f"{package}.{species_module}"), species_attr)
+    # Reject duplicate names up front, as the eager indexes did.
+    NameIndex(enumerate(moves), lambda move: move.name)
+    NameIndex(species.items(), lambda info: info.species)
+
+    strings = _Strings()
+    move_records, effect_records = bytearray(), bytearray()
+    n_effects = 0
+    for move in moves:
+        move_records += MOVE.pack(
+            *strings.ref(move.name), *strings.ref(move.description),
+            move.type.value, move.category.value, -1 if move.power is None else move.power,
+            move.accuracy, move.pp, move.priority, move.target.value,
+            *strings.ref(move.hazard_set), move.hazard_remove, *strings.ref(move.fixed_damage),
+            n_effects, len(move.target_effects),
+        )
+        for effect in move.target_effects:
+            effect_records += EFFECT.pack(*strings.ref(effect.property), *strings.ref(effect.value))
+            n_effects += 1
+    species_records = bytearray()
+    for dex_num, info in species.items():
+        species_records += SPECIES.pack(
+            dex_num, *strings.ref(info.species), info.type1.value,
+            NO_TYPE if info.type2 is None else info.type2.value,
+            info.hp, info.attack, info.defense, info.special_attack, info.special_defense, info.speed,
+            *strings.ref(info.ability),
+        )
+
+    move_names = "\n".join(normalize_name(move.name) for move in moves).encode("utf-8")
+    species_names = "\n".join(normalize_name(info.species) for info in species.values()).encode("utf-8")
+    bodies = (move_records, effect_records, species_records, strings.blob, move_names, species_names)
+    counts = (len(moves), n_effects, len(species), len(strings.blob), len(move_names), len(species_names))
+    section_table, offset = [], HEADER.size
+    for body, count in zip(bodies, counts):
+        section_table += [offset, count]
+        offset += len(body)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, generation, _source_key(generation), *section_table)
+    return header + b"".join(bodies)
+
+
+def build(generation: int, path: str) -> bytes:
+    """Pack `generation` and write it to `path` atomically, creating its directory; returns the contents."""
+    data = pack(generation)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"  # workers starting together each write their own
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return data
+
+
+def _map(path: str, generation: int):
+    """The file's mapped contents if it is current for `generation`, else None."""
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # missing, unreadable or empty
+        return None
+    if len(buffer) >= HEADER.size:
+        magic, version, file_generation, key = HEADER.unpack_from(buffer)[:4]
+        if (magic, version, file_generation, key) == (
+            MAGIC, FORMAT_VERSION, generation, _source_key(generation)
+        ):
+            return buffer
+    buffer.close()
+    return None
+
+
+class _Section:
+    """One kind of record in a GenerationDex, unpacked into entries as they are asked for."""
+
+    def __init__(self, dex: "GenerationDex", name: str, names: str, unpack: Callable[[tuple], Any],
+                 keyed: bool = False):
+        self._dex = dex
+        self._name = name
+        self._names = names  # section of normalized names
+        self._unpack = unpack
+        self._keyed = keyed  # ids are the records' first field rather than their positions
+        self._entries: Dict[int, Any] = {}
+        self._positions: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return self._dex.section(self._name)[2]
+
+    def record(self, position: int) -> tuple:
+        buffer, offset, _ = self._dex.section(self._name)
+        record = RECORDS[self._name]
+        return record.unpack_from(buffer, offset + position * record.size)
+
+    def ids(self) -> List[int]:
+        if self._positions is None:
+            if self._keyed:
+                buffer, offset, count = self._dex.section(self._name)
+                record = RECORDS[self._name]
+                records = record.iter_unpack(buffer[offset: offset + count * record.size])
+                self._positions = {fields[0]: i for i, fields in enumerate(records)}
+            else:
+                self._positions = {i: i for i in range(len(self))}
+        return list(self._positions)
+
+    def names(self) -> List[str]:
+        """Normalized names in record order."""
+        buffer, offset, size = self._dex.section(self._names)
+        return bytes(buffer[offset: offset + size]).decode("utf-8").split("\n")
+
+    def position_of(self, entry_id: int) -> Optional[int]:
+        if self._positions is None:
+            self.ids()
+        return self._positions.get(entry_id)
+
+    def at(self, position: int) -> Any:
+        try:
+            return self._entries[position]
+        except KeyError:
+            entry = self._entries[position] = self._unpack(self.record(position))
+            return entry
+
+
+class DexList(Sequence):
+    """Read-only list view of a section (moves: id = position)."""
+
+    def __init__(self, section: _Section):
+        self._section = section
+
+    def __len__(self) -> int:
+        return len(self._section)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._section.at(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._section.at(index)
+
+
+class DexMapping(Mapping):
+    """Read-only dict view of a section keyed by id (species: Pokédex number)."""
+
+    def __init__(self, section: _Section):
+        self._section = section
+
+    def __len__(self) -> int:
+        return len(self._section)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._section.ids())
+
+    def __getitem__(self, entry_id: int):
+        position = self._section.position_of(entry_id)
+        if position is None:
+            raise KeyError(entry_id)
+        return self._section.at(position)
+
+
+class SectionIndex(NameIndex):
+    """NameIndex over a compiled section: built on the first lookup, entries unpacked on demand."""
+
+    def __init__(self, view, section: _Section):
+        self._view = view
+        self._section = section
+        self._ids: Optional[Dict[str, int]] = None
+        self._memo: Dict[str, int] = {}
+
+    def id_of(self, name: str) -> Optional[int]:
+        if self._ids is None:
+            self._ids = dict(zip(self._section.names(), self._section.ids()))
+        return super().id_of(name)
+
+    def get(self, name: str):
+        entry_id = self.id_of(name)
+        return None if entry_id is None else self._view[entry_id]
+
+    def by_id(self, entry_id: int):
+        try:
+            return self._view[entry_id]
+        except (IndexError, KeyError):
+            return None
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+
+class GenerationDex:
+    """One generation's compiled moves and species, mapped from `path` on first access."""
+
+    def __init__(self, generation: int, path: Optional[str] = None):
+        self.generation = generation
+        self.path = path or default_path(generation)
+        self._buffer = None
+        self._sections: Dict[str, Tuple[int, int]] = {}
+        moves = _Section(self, "moves", "move_names", self._unpack_move)
+        species = _Section(self, "species", "species_names", self._unpack_species, keyed=True)
+        self.moves: Sequence[Move] = DexList(moves)
+        self.species: Mapping[int, PokemonInfo] = DexMapping(species)
+        self.move_index: NameIndex[Move] = SectionIndex(self.moves, moves)
+        self.species_index: NameIndex[PokemonInfo] = SectionIndex(self.species, species)
+
+    def _open(self):
+        buffer = _map(self.path, self.generation)
+        if buffer is None:
+            try:
+                packed = build(self.generation, self.path)
+            except OSError:  # read-only install: keep the packed data in memory
+                packed = pack(self.generation)
+            buffer = _map(self.path, self.generation)
+            if buffer is None:  # unwritable, or swapped by another process since we wrote it
+                buffer = packed
+        fields = HEADER.unpack_from(buffer)
+        self._sections = {name: fields[4 + 2 * i: 6 + 2 * i] for i, name in enumerate(SECTIONS)}
+        self._buffer = buffer
+
+    def section(self, name: str) -> Tuple[Any, int, int]:
+        """(buffer, byte offset, record count) of a section, opening the file if needed."""
+        if self._buffer is None:
+            self._open()
+        offset, count = self._sections[name]
+        return self._buffer, offset, count
+
+    def string(self, offset: int, length: int) -> Optional[str]:
+        if offset == NONE:
+            return None
+        buffer, base, _ = self.section("strings")
+        return bytes(buffer[base + offset: base + offset + length]).decode("utf-8")
+
+    def _unpack_move(self, record: tuple) -> Move:
+        (name, name_len, description, description_len, move_type, category, power, accuracy, pp,
+         priority, target, hazard_set, hazard_set_len, hazard_remove, fixed_damage, fixed_damage_len,
+         first_effect, n_effects) = record
+        buffer, offset, _ = self.section("effects")
+        effects = []
+        for i in range(first_effect, first_effect + n_effects):
+            prop, prop_len, value, value_len = EFFECT.unpack_from(buffer, offset + i * EFFECT.size)
+            effects.append(PokemonEffect(self.string(prop, prop_len), self.string(value, value_len)))
+        return Move(
+            self.string(name, name_len), Type(move_type), None if power < 0 else power,
+            Category(category), accuracy, pp, self.string(description, description_len),
+            priority=priority,
+            target=Target(target),
+            target_effects=effects,
+            hazard_set=self.string(hazard_set, hazard_set_len),
+            hazard_remove=hazard_remove,
+            fixed_damage=self.string(fixed_damage, fixed_damage_len),
+        )
+
+    def _unpack_species(self, record: tuple) -> PokemonInfo:
+        (_, species, species_len, type1, type2, hp, attack, defense, special_attack, special_defense,
+         speed, ability, ability_len) = record
+        return PokemonInfo(
+            self.string(species, species_len), Type(type1), None if type2 == NO_TYPE else Type(type2),
+            hp, attack, defense, special_attack, special_defense, speed,
+            self.string(ability, ability_len),
+        )
+
+
+GEN1 = GenerationDex(1)
+
+
+if __name__ == "__main__":
+    for generation in SOURCES:
+        dex = GenerationDex(generation)
+        size = len(build(generation, dex.path))
+        print(f"{dex.path}: {len(dex.moves)} moves, {len(dex.species)} species, {size} bytes")
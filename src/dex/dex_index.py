@@ -0,0 +1,57 @@
+"""
+Normalized-name index for dex lookups.
+
+Each dex (moves, species, abilities) builds one NameIndex at import time. A
+lookup is a dict hit on the raw name; the first time an unseen spelling of a
+known entry is asked for it is normalized once and memoized, so repeated
+lookups never redo the string munging or scan the dex. Misses are not
+memoized: the memo only ever holds spellings of real entries, however many
+unknown names callers try.
+"""
+
+from typing import Callable, Dict, Generic, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def normalize_name(name: str) -> str:
+    """Canonical lookup key: no spaces or hyphens, lowercase ("Thunder-Wave" -> "thunderwave")."""
+    return name.replace(" ", "").replace("-", "").lower()
+
+
+class NameIndex(Generic[T]):
+    """Maps names (any spelling normalize_name accepts) to dex entries and their integer ids."""
+
+    def __init__(self, entries: Iterable[Tuple[int, T]], name_of: Callable[[T], str]):
+        self._by_id: Dict[int, T] = {}
+        self._ids: Dict[str, int] = {}
+        for entry_id, entry in entries:
+            key = normalize_name(name_of(entry))
+            if key in self._ids:
+                raise ValueError(f"Duplicate dex name: {name_of(entry)}")
+            self._by_id[entry_id] = entry
+            self._ids[key] = entry_id
+        # Raw spelling -> id, filled lazily with hits only.
+        self._memo: Dict[str, int] = {}
+
+    def id_of(self, name: str) -> Optional[int]:
+        try:
+            return self._memo[name]
+        except KeyError:
+            entry_id = self._ids.get(normalize_name(name))
+            if entry_id is not None:
+                self._memo[name] = entry_id
+            return entry_id
+
+    def get(self, name: str) -> Optional[T]:
+        entry_id = self.id_of(name)
+        return None if entry_id is None else self._by_id[entry_id]
+
+    def by_id(self, entry_id: int) -> Optional[T]:
+        return self._by_id.get(entry_id)
+
+    def __contains__(self, name: str) -> bool:
+        return self.id_of(name) is not None
+
+    def __len__(self) -> int:
+        return len(self._by_id)
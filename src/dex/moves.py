@@ -1,20 +1,20 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
-from src.dex.gen1_moves import GEN1_MOVES, Move
+from src.dex.compiled import GEN1
+from src.dex.dex_index import NameIndex, normalize_name
+from src.state.pokestate_defs import Move
 
-ALL_MOVES = GEN1_MOVES
+# Loaded from the compiled dex on first access (source: gen1_moves.GEN1_MOVES).
+ALL_MOVES: Sequence[Move] = GEN1.moves
+MOVE_INDEX: NameIndex[Move] = GEN1.move_index
 
 def normalize_move_name(name: str) -> str:
     """Transform a move name by removing spaces and converting to lowercase."""
-    return name.replace(" ", "").replace("-", "").lower()
+    return normalize_name(name)
 
 def get_move_by_name(name: str) -> Optional[Move]:
     """Get a specific move by name (handles both spaced and non-spaced names)."""
-    normalized_search = normalize_move_name(name)
-    for move in ALL_MOVES:
-        if normalize_move_name(move.name) == normalized_search:
-            return move
-    return None
+    return MOVE_INDEX.get(name)
 
 def get_move_name_by_index(index: int) -> Optional[str]:
     """Get the name of a move by its index."""
@@ -24,11 +24,7 @@ def get_move_name_by_index(index: int) -> Optional[str]:
 
 def get_move_index_by_name(name: str) -> Optional[int]:
     """Get the index of a move by name (handles both spaced and non-spaced names)."""
-    normalized_search = normalize_move_name(name)
-    for index, move in enumerate(ALL_MOVES):
-        if normalize_move_name(move.name) == normalized_search:
-            return index
-    return None
+    return MOVE_INDEX.id_of(name)
 
 def get_all_move_names() -> List[str]:
     """Get a list of all move names."""
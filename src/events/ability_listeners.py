@@ -1,5 +1,8 @@
-from src.events.listener import Listener
+from src.actions.base_actions import HealAction
+from src.events.listener import Listener, ListenerFilter
 from src.events.event_queue import EventQueue
+from src.events.battle_log import log
+from src.events.priority import Priority
 from src.state.pokestate_defs import MoveHitEvent, Player, Type
 
 
@@ -15,28 +18,19 @@ class VoltAbsorbListener(Listener[MoveHitEvent]):
         self.slot = slot
         self._game_state = game_state
 
-    def on_event(self, event: MoveHitEvent, event_queue: EventQueue) -> bool:
-        if event.attacker == self.player:
-            return True  # We're the attacker, not the target
-        if event.move.type != Type.ELECTRIC:
-            return True
-        my_mon = (
-            self._game_state.battle_state
-            .get_player(self.player)
-            .get_active_mon(self.slot)
-        )
-        if event.target_mon is not my_mon:
-            return True
+    def listener_filter(self) -> ListenerFilter:
+        # Only Electric hits aimed at this slot are dispatched here.
+        return ListenerFilter(player=self.player, slot=self.slot, move_type=Type.ELECTRIC)
 
+    def on_event(self, event: MoveHitEvent, event_queue: EventQueue) -> bool:
+        my_mon = event.target_mon
         event.absorbed = True
         heal_amount = int(my_mon.hp_max * 0.25)
-        from src.actions.actions import HealAction
-        from src.events.priority import Priority
         event_queue.add_event(
             HealAction(self.player, heal_amount, self.slot),
             Priority(0, 0),
         )
-        print(f"{my_mon.name}'s Volt Absorb absorbed the Electric move!")
+        log("ability", "%s's Volt Absorb absorbed the Electric move!", my_mon.name)
         return True  # Stay registered
 
 
@@ -52,21 +46,13 @@ class LevitateListener(Listener[MoveHitEvent]):
         self.slot = slot
         self._game_state = game_state
 
-    def on_event(self, event: MoveHitEvent, event_queue: EventQueue) -> bool:
-        if event.attacker == self.player:
-            return True  # We're the attacker, not the target
-        if event.move.type != Type.GROUND:
-            return True
-        my_mon = (
-            self._game_state.battle_state
-            .get_player(self.player)
-            .get_active_mon(self.slot)
-        )
-        if event.target_mon is not my_mon:
-            return True
+    def listener_filter(self) -> ListenerFilter:
+        return ListenerFilter(player=self.player, slot=self.slot, move_type=Type.GROUND)
 
+    def on_event(self, event: MoveHitEvent, event_queue: EventQueue) -> bool:
+        my_mon = event.target_mon
         event.absorbed = True
-        print(f"{my_mon.name} is floating — it's unaffected by Ground moves!")
+        log("ability", "%s is floating — it's unaffected by Ground moves!", my_mon.name)
         return True  # Stay registered
 
 
@@ -84,31 +70,29 @@ class FlashFireListener(Listener[MoveHitEvent]):
         self._game_state = game_state
         self.flash_fire_active = False
 
-    def on_event(self, event: MoveHitEvent, event_queue: EventQueue) -> bool:
-        my_mon = (
-            self._game_state.battle_state
-            .get_player(self.player)
-            .get_active_mon(self.slot)
-        )
-        if event.move.type != Type.FIRE:
-            return True
+    def listener_filter(self) -> ListenerFilter:
+        # Fire moves either side uses: absorbed when hit, boosted when attacking.
+        return ListenerFilter(move_type=Type.FIRE)
 
+    def on_event(self, event: MoveHitEvent, event_queue: EventQueue) -> bool:
         if event.attacker != self.player:
             # Defensive: we're being hit by a Fire move
-            if event.target_mon is not my_mon:
+            if event.target_slot != self.slot:
                 return True
+            my_mon = event.target_mon
             event.absorbed = True
             if not self.flash_fire_active:
                 self.flash_fire_active = True
-                print(f"{my_mon.name}'s Flash Fire absorbed the Fire move and powered up!")
+                log("ability", "%s's Flash Fire absorbed the Fire move and powered up!", my_mon.name)
             else:
-                print(f"{my_mon.name}'s Flash Fire absorbed the Fire move!")
+                log("ability", "%s's Flash Fire absorbed the Fire move!", my_mon.name)
         else:
             # Offensive: we're using a Fire move while Flash Fire is active
-            if event.src_mon is not my_mon:
+            if event.src_slot != self.slot:
                 return True
+            my_mon = event.src_mon
             if self.flash_fire_active:
                 event.damage_multiplier *= 1.5
-                print(f"{my_mon.name}'s Flash Fire boosted the move's power!")
+                log("ability", "%s's Flash Fire boosted the move's power!", my_mon.name)
 
         return True  # Stay registered
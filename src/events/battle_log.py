@@ -0,0 +1,94 @@
+"""
+Battle log sinks.
+
+Engine code reports what happens with `log(kind, fmt, *args)` instead of
+print(). The message is only formatted (`fmt % args`) when the active sink
+actually wants text, so under NullSink a call costs little more than the call
+itself. Three sinks are provided:
+
+  - NullSink:   drops everything (bulk simulation).
+  - MemorySink: keeps structured LogRecords for later inspection.
+  - TextSink:   writes human-readable lines to a stream (stdout by default).
+
+The active sink is process-wide; swap it with set_log_sink() or the
+use_log_sink() context manager.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+
+@dataclass
+class LogRecord:
+    kind: str  # e.g. "move", "damage", "status", "hazard", "ability", "faint"
+    fmt: str
+    args: Tuple
+
+    @property
+    def message(self) -> str:
+        return self.fmt % self.args if self.args else self.fmt
+
+
+class LogSink(ABC):
+    @abstractmethod
+    def emit(self, kind: str, fmt: str, args: Tuple) -> None:
+        pass
+
+
+class NullSink(LogSink):
+    def emit(self, kind: str, fmt: str, args: Tuple) -> None:
+        pass
+
+
+class MemorySink(LogSink):
+    def __init__(self):
+        self.records: List[LogRecord] = []
+
+    def emit(self, kind: str, fmt: str, args: Tuple) -> None:
+        self.records.append(LogRecord(kind, fmt, args))
+
+    def messages(self) -> List[str]:
+        return [record.message for record in self.records]
+
+    def clear(self):
+        self.records.clear()
+
+
+class TextSink(LogSink):
+    def __init__(self, stream: Optional[TextIO] = None):
+        # None means "whatever sys.stdout is at emit time", so redirection works.
+        self.stream = stream
+
+    def emit(self, kind: str, fmt: str, args: Tuple) -> None:
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write((fmt % args if args else fmt) + "\n")
+
+
+_sink: LogSink = TextSink()
+
+
+def log(kind: str, fmt: str, *args) -> None:
+    _sink.emit(kind, fmt, args)
+
+
+def get_log_sink() -> LogSink:
+    return _sink
+
+
+def set_log_sink(sink: LogSink) -> LogSink:
+    """Install `sink` as the active sink and return the previous one."""
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+@contextmanager
+def use_log_sink(sink: LogSink) -> Iterator[LogSink]:
+    previous = set_log_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_log_sink(previous)
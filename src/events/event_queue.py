@@ -1,46 +1,199 @@
+import heapq
 from dataclasses import dataclass, field
-from queue import PriorityQueue
-from typing import Tuple, List, Callable
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from src.state.rng import BattleRng, GLOBAL_RNG
+
+# Wildcard for EventQueue.cancel / find.
+ANY: Any = object()
+
+# Tiebreak for an action queued by the one being executed (a move's damage or
+# status): below every drawn tiebreak, so it resolves before anything else
+# queued at its priority, in the order it was queued.
+FOLLOW_UP = -1.0
+
+IndexKey = Tuple[Hashable, Hashable, str]
+
 
 class EventQueue[EventType, PriorityType]:
-    @dataclass
+    """
+    Single-threaded priority queue of pending actions, built on heapq.
+
+    Heap entries are plain tuples (priority, tiebreak, seq, item), so ordering
+    is decided by C-level tuple comparison. `tiebreak` is drawn once per queued
+    action from `tie_rng` (the battle's rng when owned by a GameState), which
+    settles speed ties reproducibly; `seq` keeps the order total and stable.
+
+    Removal is lazy: a removed item is only marked dead and skipped when it
+    reaches the top of the heap, so nothing is ever rebuilt. Live items are also
+    indexed by (player, src_idx, action type name), which lets listeners find
+    or cancel e.g. "Player 1's slot 0 MoveAction" without scanning the queue.
+
+    With a `journal` (an UndoLog) every insertion and removal, including pops,
+    is recorded so it can be unmade.
+    """
+
+    @dataclass(eq=False)
     class PriorityItem:
         priority: PriorityType
-        event: EventType=field(compare=False)
+        event: EventType
+        tiebreak: float = field(default=0.0, repr=False)
+        removed: bool = field(default=False, repr=False)
+        seq: int = field(default=0, repr=False)
+        in_heap: bool = field(default=True, repr=False)  # False once popped or compacted away
+
+    def __init__(self, maxsize=0, tie_rng: BattleRng = GLOBAL_RNG):
+        # maxsize is accepted for compatibility with the old queue.PriorityQueue API.
+        self.tie_rng = tie_rng
+        self._heap: List[Tuple[PriorityType, float, int, EventQueue.PriorityItem]] = []
+        self._seq = 0
+        # Buckets are insertion-ordered dicts used as sets, so find() is deterministic.
+        self._index: Dict[IndexKey, Dict[EventQueue.PriorityItem, None]] = {}
+        self._live = 0
+        self.journal = None
+
+    @staticmethod
+    def index_key(event: EventType) -> IndexKey:
+        return (
+            getattr(event, "player", None),
+            getattr(event, "src_idx", None),
+            type(event).__name__,
+        )
+
+    def add_event(
+        self, event: EventType, priority: PriorityType, tiebreak: Optional[float] = None
+    ) -> "PriorityItem":
+        if tiebreak is None:
+            tiebreak = self.tie_rng.tiebreak(priority, event)
+        seq = self._seq
+        self._seq += 1
+        item = self.PriorityItem(priority, event, tiebreak, seq=seq)
+        heapq.heappush(self._heap, (priority, tiebreak, seq, item))
+        self._index.setdefault(self.index_key(event), {})[item] = None
+        self._live += 1
+        if self.journal is not None:
+            self.journal.push(self._unlink, item)
+        return item
+
+    def _discard(self, item: "PriorityItem"):
+        self._unlink(item)
+        if self.journal is not None:
+            self.journal.push(self._relink, item)
 
-        def __lt__(self, other: 'PriorityItem') -> bool:
-            return self.priority < other.priority
-    
-    def __init__(self, maxsize=0):
-        self._queue = PriorityQueue(maxsize)
+    def _unlink(self, item: "PriorityItem"):
+        item.removed = True
+        self._live -= 1
+        key = self.index_key(item.event)
+        bucket = self._index[key]
+        del bucket[item]
+        if not bucket:
+            del self._index[key]
 
-    def add_event(self, event: EventType, priority: PriorityType):
-        self._queue.put(self.PriorityItem(priority, event))
+    def _relink(self, item: "PriorityItem"):
+        # Undo of _unlink: the item goes back in its index bucket at its original position.
+        item.removed = False
+        self._live += 1
+        bucket = self._index.setdefault(self.index_key(item.event), {})
+        bucket[item] = None
+        if len(bucket) > 1 and any(other.seq > item.seq for other in bucket):
+            ordered = sorted(bucket, key=lambda other: other.seq)
+            bucket.clear()
+            bucket.update(dict.fromkeys(ordered))
+        if not item.in_heap:
+            item.in_heap = True
+            heapq.heappush(self._heap, (item.priority, item.tiebreak, item.seq, item))
+
+    def _maybe_compact(self):
+        # Keep tombstones from dominating the heap when many items are cancelled.
+        if len(self._heap) > 2 * self._live + 32:
+            self.reorder()
+
+    def remove_item(self, item: "PriorityItem") -> bool:
+        """Remove one queued item (as returned by add_event / find). False if already gone."""
+        if item.removed:
+            return False
+        self._discard(item)
+        self._maybe_compact()
+        return True
 
     def remove_event(self, predicate: Callable[[EventType], bool]):
-        # Create a new queue without the event to be removed
-        new_queue = PriorityQueue()
-        while not self._queue.empty():
-            item = self._queue.get()
-            if not predicate(item.event):
-                new_queue.put(item)
-        self._queue = new_queue
-    
+        for item in self.get_all_events():
+            if predicate(item.event):
+                self._discard(item)
+        self._maybe_compact()
+
+    def find(
+        self, player: Hashable = ANY, src_idx: Hashable = ANY, action_type: str = ANY
+    ) -> List["PriorityItem"]:
+        """Live items whose (player, src_idx, type name) match; ANY matches everything."""
+        if player is not ANY and src_idx is not ANY and action_type is not ANY:
+            return list(self._index.get((player, src_idx, action_type), ()))
+        return [
+            item
+            for (p, s, t), bucket in self._index.items()
+            if (player is ANY or p == player)
+            and (src_idx is ANY or s == src_idx)
+            and (action_type is ANY or t == action_type)
+            for item in bucket
+        ]
+
+    def cancel(
+        self,
+        player: Hashable = ANY,
+        src_idx: Hashable = ANY,
+        action_type: str = ANY,
+        predicate: Optional[Callable[[EventType], bool]] = None,
+    ) -> int:
+        """Remove every matching item (optionally narrowed by `predicate`); returns how many."""
+        removed = 0
+        for item in self.find(player, src_idx, action_type):
+            if predicate is None or predicate(item.event):
+                self._discard(item)
+                removed += 1
+        self._maybe_compact()
+        return removed
+
+    def reprioritize(self, item: "PriorityItem", priority: PriorityType) -> "PriorityItem":
+        """Move a queued item to a new priority; returns the item that replaces it."""
+        if item.removed:
+            raise ValueError(f"{item.event} is no longer queued")
+        self._discard(item)
+        # The speed-tie draw belongs to the action, so it survives the move.
+        return self.add_event(item.event, priority, item.tiebreak)
+
     def reorder(self):
-        items = []
-        while not self._queue.empty():
-            items.append(self._queue.get())
-        items.sort(key=lambda item: item.priority)
-        for item in items:
-            self._queue.put(item)
+        """Drop dead entries and restore the heap invariant."""
+        heap = []
+        for entry in self._heap:
+            if entry[3].removed:
+                entry[3].in_heap = False
+            else:
+                heap.append(entry)
+        heapq.heapify(heap)
+        self._heap = heap
 
-    def get_next_event(self) -> Tuple[PriorityType, EventType]:
-        item = self._queue.get()
+    def peek(self) -> Tuple[PriorityType, EventType]:
+        """The item get_next_event would return, left in the queue."""
+        heap = self._heap
+        while heap[0][3].removed:  # IndexError when empty, like get_next_event
+            heapq.heappop(heap)[3].in_heap = False
+        item = heap[0][3]
         return item.priority, item.event
-    
+
+    def get_next_event(self) -> Tuple[PriorityType, EventType]:
+        heap = self._heap
+        while True:
+            item = heapq.heappop(heap)[3]  # IndexError when empty, like an exhausted queue
+            item.in_heap = False
+            if not item.removed:
+                self._discard(item)
+                return item.priority, item.event
+
     def empty(self) -> bool:
-        return self._queue.empty()
-    
-    def get_all_events(self) -> List[EventType]:
-        return [item for item in list(self._queue.queue)]
-        
\ No newline at end of file
+        return self._live == 0
+
+    def __len__(self) -> int:
+        return self._live
+
+    def get_all_events(self) -> List["PriorityItem"]:
+        return [entry[3] for entry in self._heap if not entry[3].removed]
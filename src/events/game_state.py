@@ -1,10 +1,13 @@
 
 from dataclasses import dataclass, field
+from typing import Optional
 
 from src.events.event_queue import EventQueue
 from src.events.listener import ListenerManager
+from src.events.phases import Phase
 from src.state.pokestate import BattleState
 from src.state.field import FieldState
+from src.state.rng import BattleRng, GLOBAL_RNG
 
 
 '''
@@ -13,10 +16,19 @@ from src.state.field import FieldState
     - event_queue: The queue of events to be processed (TODO: could be more of a list, priority is always reassigned).
     - listener_manager: The set of all active listeners.
     - field_state: Active field hazards for each player's side.
+    - rng: Source of every random draw in the battle, including queue speed ties
+      (seed it for reproducible runs).
+    - phase: The turn phase currently running (None outside BattleManager).
 '''
 @dataclass
 class GameState:
     battle_state: BattleState
     event_queue: EventQueue
     listener_manager: ListenerManager
-    field_state: FieldState = field(default_factory=FieldState)
\ No newline at end of file
+    field_state: FieldState = field(default_factory=FieldState)
+    rng: BattleRng = GLOBAL_RNG
+    phase: Optional[Phase] = None
+
+    def __post_init__(self):
+        # Speed ties in the queue are drawn from the battle's rng.
+        self.event_queue.tie_rng = self.rng
\ No newline at end of file
@@ -1,12 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Any, Generic, Type, Callable
 from collections import defaultdict
+from dataclasses import dataclass
+from typing import TypeVar, Any, Callable, Dict, Generic, Hashable, List, Optional, Tuple, Type
 
 from src.events.event_queue import EventQueue
-from src.state.pokestate_defs import PokemonId
+from src.events.battle_log import log
+from src.state.pokestate_defs import MoveHitEvent, Player, PokemonId, SwitchInEvent
+from src.state.pokestate_defs import Type as PokeType
 
 DataType = TypeVar("DataType")
 
+ListenerHandle = int
+
+
+@dataclass(frozen=True)
+class ListenerFilter:
+    """
+    What a listener can react to; None means "any". Filters are indexed when the
+    listener is registered, so events that can't concern it never reach on_event.
+    """
+
+    player: Optional[Player] = None  # player the event concerns (e.g. the defender of a hit)
+    slot: Optional[int] = None
+    move_type: Optional[PokeType] = None
+    phases: Tuple[Hashable, ...] = ()  # turn phases to be called in; () = every phase
+
 
 class Listener(Generic[DataType], ABC):
     datatype: Type[DataType]
@@ -15,37 +33,166 @@ class Listener(Generic[DataType], ABC):
     def on_event(self, input: DataType, event_queue: EventQueue) -> bool:
         pass
 
+    def listener_filter(self) -> ListenerFilter:
+        """Read once at registration; the default hears every event of `datatype`."""
+        return ListenerFilter()
+
+    def on_phase(self, phase: Hashable, input: DataType, event_queue: EventQueue) -> bool:
+        """Called instead of on_event when `input` is dispatched for a turn phase."""
+        return self.on_event(input, event_queue)
+
+
+# (player, slot, move type) an event concerns, per event type; None = not specific.
+EventKeys = Tuple[Optional[Player], Optional[int], Optional[PokeType]]
+
+_EVENT_KEYS: Dict[type, Callable[[Any], EventKeys]] = {
+    MoveHitEvent: lambda event: (Player.opponent(event.attacker), event.target_slot, event.move.type),
+    SwitchInEvent: lambda event: (event.player, event.slot, None),
+}
+
+
+def register_event_keys(datatype: type, keys: Callable[[Any], EventKeys]):
+    """Teach the dispatcher which (player, slot, move type) an event type concerns."""
+    _EVENT_KEYS[datatype] = keys
+
+
+class _Registration:
+    __slots__ = ("handle", "id", "listener", "filter", "buckets")
+
+    def __init__(self, handle, id, listener, filter, buckets):
+        self.handle = handle
+        self.id = id
+        self.listener = listener
+        self.filter = filter
+        self.buckets = buckets
+
 
 class ListenerManager:
+    """
+    Dispatches events to listeners registered for the event's type.
+
+    Registrations are bucketed by datatype -> phase -> (player, move type), so
+    listen() only visits buckets that can match the event and checks the slot
+    inline. Listeners run in registration order. add_listener returns a handle
+    for O(1) removal.
+
+    With a `journal` (an UndoLog), registrations, removals and each listener's
+    attributes (saved just before it is called) can be unmade.
+    """
+
     def __init__(self):
-        self.listeners = defaultdict(list[Listener])
-        self.ids = defaultdict(list[PokemonId])
+        self._next_handle = 0
+        self._registrations: Dict[ListenerHandle, _Registration] = {}
+        self._buckets: Dict[type, Dict[Hashable, Dict[Tuple, Dict[ListenerHandle, _Registration]]]] = {}
+        self.journal = None
+
+    @property
+    def listeners(self) -> Dict[type, List[Listener]]:
+        """Registered listeners by datatype, in registration order (a fresh copy)."""
+        by_type = defaultdict(list)
+        for registration in self._registrations.values():
+            by_type[registration.listener.datatype].append(registration.listener)
+        return by_type
+
+    def add_listener(self, id: PokemonId, listener: Listener[DataType]) -> ListenerHandle:
+        log("listener", "Adding listener: %s to %s", listener, listener.datatype)
+        listener_filter = listener.listener_filter()
+        handle = self._next_handle
+        self._next_handle += 1
+        by_phase = self._buckets.setdefault(listener.datatype, {})
+        key = (listener_filter.player, listener_filter.move_type)
+        buckets = [
+            by_phase.setdefault(phase, {}).setdefault(key, {})
+            for phase in (listener_filter.phases or (None,))
+        ]
+        registration = _Registration(handle, id, listener, listener_filter, buckets)
+        for bucket in buckets:
+            bucket[handle] = registration
+        self._registrations[handle] = registration
+        if self.journal is not None:
+            self.journal.push(self._unregister, registration)
+        return handle
 
-    def add_listener(self, id: PokemonId, listener: Listener[DataType]):
-        print(f"Adding listener: {listener} to {listener.datatype}")
-        self.listeners[listener.datatype].append(listener)
-        self.ids[listener.datatype].append(id)
+    def remove_handle(self, handle: ListenerHandle) -> bool:
+        registration = self._registrations.get(handle)
+        if registration is None:
+            return False
+        self._unregister(registration)
+        if self.journal is not None:
+            self.journal.push(self._reregister, registration)
+        return True
+
+    def _unregister(self, registration: _Registration):
+        del self._registrations[registration.handle]
+        for bucket in registration.buckets:
+            del bucket[registration.handle]
+
+    def _reregister(self, registration: _Registration):
+        # Undo of _unregister: back in place, in handle (registration) order.
+        for mapping in (self._registrations, *registration.buckets):
+            mapping[registration.handle] = registration
+            if registration.handle < max(mapping):
+                ordered = sorted(mapping.items())
+                mapping.clear()
+                mapping.update(ordered)
 
     def remove_listener(self, input_id: PokemonId, pred: Callable[[Listener], bool]):
-        for id, listener in zip(self.ids, self.listeners):
-            if id == input_id and pred(listener):
-                self.listeners[listener.datatype].remove(listener)
-                self.ids[listener.datatype].remove(id)
+        """Remove listeners registered for `input_id` that match pred."""
+        for registration in list(self._registrations.values()):
+            if registration.id == input_id and pred(registration.listener):
+                self.remove_handle(registration.handle)
 
     def remove_listener_if(self, datatype: type, pred: Callable[[Listener], bool]):
         """Remove all listeners of the given datatype that match pred."""
-        keep = [
-            (listener, pid)
-            for listener, pid in zip(self.listeners[datatype], self.ids[datatype])
-            if not pred(listener)
-        ]
-        self.listeners[datatype] = [listener for listener, _ in keep]
-        self.ids[datatype] = [pid for _, pid in keep]
-
-    def listen(self, datatype: Any, event_queue: EventQueue):
-        listeners_to_remove = []
-        for listener in self.listeners[type(datatype)]:
-            if not listener.on_event(datatype, event_queue=event_queue):
-                listeners_to_remove.append(listener)
-        for listener in listeners_to_remove:
-            self.listeners[type(datatype)].remove(listener)
+        for registration in list(self._registrations.values()):
+            if registration.listener.datatype is datatype and pred(registration.listener):
+                self.remove_handle(registration.handle)
+
+    def _matching(self, data: Any, phase: Optional[Hashable]) -> List[_Registration]:
+        phases = self._buckets.get(type(data))
+        if not phases:
+            return []
+        keys = _EVENT_KEYS.get(type(data))
+        player, slot, move_type = keys(data) if keys is not None else (None, None, None)
+        if phase is None:
+            phase_buckets = phases.values()
+        else:
+            phase_buckets = [phases[p] for p in (phase, None) if p in phases]
+
+        matched = []
+        buckets_hit = 0
+        for by_key in phase_buckets:
+            for (key_player, key_type), bucket in by_key.items():
+                if not bucket:
+                    continue
+                if key_player is not None and player is not None and key_player != player:
+                    continue
+                if key_type is not None and move_type is not None and key_type != move_type:
+                    continue
+                buckets_hit += 1
+                matched.extend(bucket.values())
+        if buckets_hit > 1:
+            # Restore registration order; a multi-phase listener sits in several buckets.
+            matched = sorted({r.handle: r for r in matched}.values(), key=lambda r: r.handle)
+        if slot is not None:
+            matched = [r for r in matched if r.filter.slot is None or r.filter.slot == slot]
+        return matched
+
+    def listen(self, datatype: Any, event_queue: EventQueue, phase: Optional[Hashable] = None):
+        """
+        Deliver `datatype` (the event object) to every listener whose filter matches.
+        With a phase, only listeners registered for that phase (or for every phase)
+        hear it, through on_phase. A listener returning a falsy value is removed.
+        """
+        for registration in self._matching(datatype, phase):
+            if registration.handle not in self._registrations:
+                continue  # removed by an earlier listener during this dispatch
+            listener = registration.listener
+            if self.journal is not None:
+                self.journal.record(listener)
+            if phase is None:
+                keep = listener.on_event(datatype, event_queue=event_queue)
+            else:
+                keep = listener.on_phase(phase, datatype, event_queue)
+            if not keep:
+                self.remove_handle(registration.handle)
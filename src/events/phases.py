@@ -0,0 +1,29 @@
+"""
+Turn phases.
+
+A turn runs its queued actions phase by phase, in this order (the queue's
+priority brackets already sort actions this way):
+
+  DECISION            both players choose (ChooseAction)
+  SWITCH              chosen switches resolve (SwitchIn)
+  ABILITY_ENTRY       abilities of incoming Pokemon trigger
+  MOVE                moves, damage and their effects
+  RESIDUAL            end of turn: residual damage, sleep countdown
+  FAINT_REPLACEMENT   fainted actives are replaced
+
+Every Action has a `phase`. BattleManager fires the BattleState hooks for a
+phase once per turn, when the first action of that phase is about to run
+(RESIDUAL and FAINT_REPLACEMENT fire after the turn's queue empties).
+Listeners opt into phases with ListenerFilter(phases=...).
+"""
+
+from enum import Enum
+
+
+class Phase(Enum):
+    DECISION = 0
+    SWITCH = 1
+    ABILITY_ENTRY = 2
+    MOVE = 3
+    RESIDUAL = 4
+    FAINT_REPLACEMENT = 5
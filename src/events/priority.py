@@ -1,21 +1,32 @@
-import random 
-
 MAX_PRIORITY=8
 MIN_PRIORITY=-6
 
-class Priority:
-    def __init__(self, bracket: int, speed: int):
-        self.bracket = bracket
-        self.speed = speed
-
-    def __lt__(self, other: 'Priority') -> bool:
-        # Speed tie resolution.
-        if self == other:
-            return random.random() > 0.5
-        else:
-            return (self.bracket, self.speed) > (other.bracket, other.speed)
-
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Priority):
-            raise TypeError("Comparisons should be between Priority instances.")
-        return (self.bracket, self.speed) == (other.bracket, other.speed)
\ No newline at end of file
+class Priority(tuple):
+    """
+    Sort key for a queued action: higher bracket first, then higher speed.
+
+    Stored as the tuple (-bracket, -speed), so ascending order is execution
+    order and comparisons are plain C-level tuple comparisons. Speed ties are
+    not resolved here: EventQueue pairs every key with a tiebreak drawn once
+    from the battle's seeded rng when the action is queued.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, bracket: int, speed: int):
+        return tuple.__new__(cls, (-bracket, -speed))
+
+    def __getnewargs__(self):
+        # Rebuild from (bracket, speed) when pickled or deep-copied.
+        return (self.bracket, self.speed)
+
+    @property
+    def bracket(self) -> int:
+        return -self[0]
+
+    @property
+    def speed(self) -> int:
+        return -self[1]
+
+    def __repr__(self) -> str:
+        return f"Priority({self.bracket}, {self.speed})"
@@ -1,6 +1,9 @@
-from src.events.listener import Listener
+from src.events.listener import Listener, ListenerFilter
 from src.events.event_queue import EventQueue
-from src.state.pokestate_defs import Player, Status, SwitchInEvent, get_effectiveness, calculate_damage
+from src.events.battle_log import log
+from src.state.pokestate_defs import Player, Status, SwitchInEvent, calculate_damage
+from src.state.type_chart import dual_effectiveness
+from src.state.damage_calc import stab_multiplier
 
 
 class PursuitListener(Listener[SwitchInEvent]):
@@ -29,14 +32,11 @@ class PursuitListener(Listener[SwitchInEvent]):
         self.src_idx = src_idx
         self.target_idx = target_idx
 
-    def on_event(self, event: SwitchInEvent, event_queue: EventQueue) -> bool:
+    def listener_filter(self) -> ListenerFilter:
         # Only intercept when the *opponent* is the one switching.
-        if event.player != Player.opponent(self.pursuing_player):
-            return True  # keep listening
-
-        from src.dex.moves import get_move_by_name
-        from src.actions.move_action import MoveAction
+        return ListenerFilter(player=Player.opponent(self.pursuing_player))
 
+    def on_event(self, event: SwitchInEvent, event_queue: EventQueue) -> bool:
         src_mon = (
             self._game_state.battle_state
             .get_player(self.pursuing_player)
@@ -45,25 +45,15 @@ class PursuitListener(Listener[SwitchInEvent]):
 
         # Status conditions that always prevent acting.
         if src_mon.status in (Status.SLEEP, Status.FROZEN, Status.FAINTED):
-            print(f"{src_mon.name} can't move due to {src_mon.status}!")
-            event_queue.remove_event(
-                lambda e: (
-                    isinstance(e, MoveAction)
-                    and e.player == self.pursuing_player
-                    and e.move_idx == self.move_idx
-                    and e.src_idx == self.src_idx
-                )
-            )
+            log("status", "%s can't move due to %s!", src_mon.name, src_mon.status)
+            self._cancel_move(event_queue)
             return False
 
         # A status effect (e.g. paralysis) may have already removed the MoveAction
         # from the queue before SwitchIn fired.  If so, the user can't act.
         move_still_queued = any(
-            isinstance(queued.event, MoveAction)
-            and queued.event.player == self.pursuing_player
-            and queued.event.move_idx == self.move_idx
-            and queued.event.src_idx == self.src_idx
-            for queued in event_queue.get_all_events()
+            queued.event.move_idx == self.move_idx
+            for queued in event_queue.find(self.pursuing_player, self.src_idx, "MoveAction")
         )
         if not move_still_queued:
             return False
@@ -73,40 +63,33 @@ class PursuitListener(Listener[SwitchInEvent]):
             .get_player(event.player)
             .get_active_mon(event.slot)
         )
-        dex_entry = get_move_by_name("Pursuit")
+        dex_entry = src_mon.moves[self.move_idx].move_info
 
-        effectiveness = 1.0
-        if target_mon.type1:
-            effectiveness *= get_effectiveness(dex_entry.type, target_mon.type1)
-        if target_mon.type2:
-            effectiveness *= get_effectiveness(dex_entry.type, target_mon.type2)
+        effectiveness = dual_effectiveness(dex_entry.type, target_mon.type1, target_mon.type2)
 
         if effectiveness == 0:
-            print(f"Pursuit had no effect on {target_mon.name}!")
+            log("move", "Pursuit had no effect on %s!", target_mon.name)
         else:
-            stab = (
-                1.5 if (dex_entry.type == src_mon.type1 or dex_entry.type == src_mon.type2)
-                else 1.0
-            )
             damage = calculate_damage(
                 dex_entry.power,
                 src_mon.get_offensive_stat(dex_entry.category),
                 target_mon.get_defensive_stat(dex_entry.category),
                 effectiveness,
-                stab,
+                stab_multiplier(dex_entry.type, src_mon),
+                self._game_state.rng,
             )
             if damage > 0 and not target_mon.fainted:
+                self._game_state.battle_state.record(target_mon)
                 target_mon.hp = max(target_mon.hp - damage, 0)
-                print(f"Pursuit dealt {damage} damage to {target_mon.name} as it fled!")
+                log("damage", "Pursuit dealt %d damage to %s as it fled!", damage, target_mon.name)
 
         # Remove the pending MoveAction for Pursuit so it does not fire at end-of-turn.
-        event_queue.remove_event(
-            lambda e: (
-                isinstance(e, MoveAction)
-                and e.player == self.pursuing_player
-                and e.move_idx == self.move_idx
-                and e.src_idx == self.src_idx
-            )
-        )
+        self._cancel_move(event_queue)
 
         return False  # remove this listener; Pursuit has now resolved
+
+    def _cancel_move(self, event_queue: EventQueue):
+        event_queue.cancel(
+            self.pursuing_player, self.src_idx, "MoveAction",
+            lambda e: e.move_idx == self.move_idx,
+        )
@@ -4,15 +4,41 @@ Status Effect Listeners
 This module contains listeners that implement status effects like paralysis, poison, etc.
 using the event system. These listeners respond to various game events and modify
 behavior accordingly.
+
+Inside a battle each listener is called once per turn for the phases it declares:
+MOVE (before the first move of the turn is taken off the queue: full paralysis,
+sleep and freeze checks, which cancel the Pokemon's queued MoveAction) and RESIDUAL
+(end of turn: poison/burn damage, sleep countdown). on_event performs every phase
+at once, which is what a bare listen(battle_state) call gets.
+
+A listener's `pokemon_idx` is the Pokemon's index in its team (`pk_list`), so the
+status follows it to the bench and back. Queued moves are looked up by the active
+slot it occupies; while it is benched there is nothing of its to cancel.
 """
 
-import random
 from abc import ABC, abstractmethod
+from typing import Optional
 
-from src.events.listener import Listener, ListenerManager
+from src.events.listener import Listener, ListenerFilter, ListenerManager
 from src.events.event_queue import EventQueue
+from src.events.battle_log import log
+from src.events.phases import Phase
 from src.state.pokestate import BattleState, PokemonState, Player
 from src.state.pokestate_defs import PokemonId, Status
+from src.state.rng import BattleRng, GLOBAL_RNG
+
+
+def _listened_pokemon(battle_state: BattleState, player: Player, pokemon_idx: int) -> PokemonState:
+    """The Pokemon a listener acts on, saved to the undo log first if one is attached."""
+    pokemon = battle_state.get_player(player).pk_list[pokemon_idx]
+    battle_state.record(pokemon)
+    return pokemon
+
+
+def _active_slot(battle_state: BattleState, player: Player, pokemon_idx: int) -> Optional[int]:
+    """The active slot team member `pokemon_idx` is in, or None while it is benched."""
+    active_mons = battle_state.get_player(player).active_mons
+    return active_mons.index(pokemon_idx) if pokemon_idx in active_mons else None
 
 
 class StatusListener(Listener, ABC):
@@ -41,21 +67,36 @@ class ParalysisListener(Listener[BattleState]):
     PARALYZE_CHANCE: float = 0.3  # 30% chance to be unable to move
     SPEED_REDUCTION: float = 0.25
 
-    def __init__(self, player: Player, pokemon_idx: int):
+    def __init__(self, player: Player, pokemon_idx: int, rng: BattleRng = GLOBAL_RNG):
         self.player = player
         self.pokemon_idx = pokemon_idx
+        self._rng = rng
         self.speed_reduced = False
         self.original_base_speed = None
 
+    def listener_filter(self) -> ListenerFilter:
+        # MOVE: full paralysis roll. RESIDUAL: speed drop takes effect for next turn's order.
+        return ListenerFilter(phases=(Phase.MOVE, Phase.RESIDUAL))
+
+    def on_phase(self, phase: Phase, input: BattleState, event_queue: EventQueue) -> bool:
+        pokemon = _listened_pokemon(input, self.player, self.pokemon_idx)
+        if pokemon.status != Status.PARALYZED:
+            self._restore_speed(pokemon)
+            return False
+        self._handle_speed_reduction(pokemon)
+        if phase == Phase.MOVE:
+            self._handle_move_prevention(input, event_queue, pokemon)
+        return True
+
     # TODO: Mark itself for deletion if it status is removed.
     def on_event(self, input: BattleState, event_queue: EventQueue) -> bool:
-        pokemon = input.get_player(self.player).pk_list[self.pokemon_idx]
+        pokemon = _listened_pokemon(input, self.player, self.pokemon_idx)
 
         if pokemon.status == Status.PARALYZED:
             # Handle speed reduction
             self._handle_speed_reduction(pokemon)
             # Handle move prevention
-            self._handle_move_prevention(event_queue, pokemon)
+            self._handle_move_prevention(input, event_queue, pokemon)
             return True
         elif pokemon.status != Status.PARALYZED and self.speed_reduced:
             # Restore speed if no longer paralyzed
@@ -68,8 +109,9 @@ class ParalysisListener(Listener[BattleState]):
             original_speed = pokemon.speed
             pokemon._speed.modifier = self.SPEED_REDUCTION
             self.speed_reduced = True
-            print(
-                f"{pokemon.name}'s speed was reduced due to paralysis! ({original_speed} -> {pokemon.speed})"
+            log(
+                "status", "%s's speed was reduced due to paralysis! (%d -> %d)",
+                pokemon.name, original_speed, pokemon.speed,
             )
 
     def _restore_speed(self, pokemon: PokemonState):
@@ -77,22 +119,20 @@ class ParalysisListener(Listener[BattleState]):
         if self.speed_reduced:
             pokemon._speed.modifier = 1.0
             self.speed_reduced = False
-            print(f"{pokemon.name}'s speed was restored!")
+            log("status", "%s's speed was restored!", pokemon.name)
 
-    def _handle_move_prevention(self, event_queue: EventQueue, pokemon: PokemonState):
+    def _handle_move_prevention(
+        self, battle_state: BattleState, event_queue: EventQueue, pokemon: PokemonState
+    ):
         """30% chance to prevent move actions"""
-        all_events = event_queue.get_all_events()
-        for priority_item in all_events:
-            action = priority_item.event
-            if (
-                action.__class__.__name__ == "MoveAction"
-                and action.player == self.player
-                and action.src_idx == self.pokemon_idx
-            ):
-                if random.random() < self.PARALYZE_CHANCE:
-                    print(f"{pokemon.name} is paralyzed and can't move!")
-                    event_queue.remove_event(lambda event: event == action)
-                    break
+        slot = _active_slot(battle_state, self.player, self.pokemon_idx)
+        if slot is None:
+            return
+        for priority_item in event_queue.find(self.player, slot, "MoveAction"):
+            if self._rng.chance(self.PARALYZE_CHANCE):
+                log("status", "%s is paralyzed and can't move!", pokemon.name)
+                event_queue.remove_item(priority_item)
+                break
 
 
 class PoisonListener(Listener[BattleState]):
@@ -104,17 +144,20 @@ class PoisonListener(Listener[BattleState]):
         self.player = player
         self.pokemon_idx = pokemon_idx
 
+    def listener_filter(self) -> ListenerFilter:
+        return ListenerFilter(phases=(Phase.RESIDUAL,))
+
     def on_event(self, input: BattleState, event_queue: EventQueue) -> bool:
-        pokemon = input.get_player(self.player).pk_list[self.pokemon_idx]
+        pokemon = _listened_pokemon(input, self.player, self.pokemon_idx)
 
         if pokemon.status == Status.POISONED and not pokemon.fainted:
             # Apply 12.5% damage
             damage = max(1, int(pokemon.hp_max * 0.125))
             pokemon.hp = max(0, pokemon.hp - damage)
-            print(f"{pokemon.name} is hurt by poison! (-{damage} HP)")
+            log("status", "%s is hurt by poison! (-%d HP)", pokemon.name, damage)
 
             if pokemon.hp <= 0:
-                print(f"{pokemon.name} fainted from poison!")
+                log("faint", "%s fainted from poison!", pokemon.name)
                 return False
         return True
 
@@ -129,8 +172,11 @@ class ToxicListener(Listener[BattleState]):
         self.pokemon_idx = pokemon_idx
         self.toxic_counter = 1
 
+    def listener_filter(self) -> ListenerFilter:
+        return ListenerFilter(phases=(Phase.RESIDUAL,))
+
     def on_event(self, input: BattleState, event_queue: EventQueue) -> bool:
-        pokemon = input.get_player(self.player).pk_list[self.pokemon_idx]
+        pokemon = _listened_pokemon(input, self.player, self.pokemon_idx)
 
         if pokemon.status != Status.TOXIC:
             return False
@@ -142,8 +188,9 @@ class ToxicListener(Listener[BattleState]):
         # Damage increases each turn: 6.25% * turn_number
         damage = max(1, int(pokemon.hp_max * 0.0625 * self.toxic_counter))
         pokemon.hp = max(0, pokemon.hp - damage)
-        print(
-            f"{pokemon.name} is badly poisoned! (-{damage} HP, turn {self.toxic_counter})"
+        log(
+            "status", "%s is badly poisoned! (-%d HP, turn %d)",
+            pokemon.name, damage, self.toxic_counter,
         )
 
         self.toxic_counter += 1
@@ -161,8 +208,22 @@ class BurnListener(Listener[BattleState]):
         self.attack_reduced = False
         self.original_base_attack = None
 
+    def listener_filter(self) -> ListenerFilter:
+        # MOVE: attack drop applies before moves. RESIDUAL: burn damage.
+        return ListenerFilter(phases=(Phase.MOVE, Phase.RESIDUAL))
+
+    def on_phase(self, phase: Phase, input: BattleState, event_queue: EventQueue) -> bool:
+        pokemon = _listened_pokemon(input, self.player, self.pokemon_idx)
+        if pokemon.status != Status.BURNED:
+            self._restore_attack(pokemon)
+            return False
+        self._handle_attack_reduction(pokemon)
+        if phase == Phase.RESIDUAL:
+            self._handle_burn_damage(pokemon)
+        return True
+
     def on_event(self, input: BattleState, event_queue: EventQueue) -> bool:
-        pokemon = input.get_player(self.player).pk_list[self.pokemon_idx]
+        pokemon = _listened_pokemon(input, self.player, self.pokemon_idx)
 
         if pokemon.status == Status.BURNED:
             # Handle attack reduction
@@ -183,8 +244,9 @@ class BurnListener(Listener[BattleState]):
             original_attack = pokemon.attack
             pokemon._attack.modifier = 0.5
             self.attack_reduced = True
-            print(
-                f"{pokemon.name}'s attack was reduced due to burn! ({original_attack} -> {pokemon.attack})"
+            log(
+                "status", "%s's attack was reduced due to burn! (%d -> %d)",
+                pokemon.name, original_attack, pokemon.attack,
             )
 
     def _restore_attack(self, pokemon: PokemonState):
@@ -192,17 +254,17 @@ class BurnListener(Listener[BattleState]):
         if self.attack_reduced:
             pokemon._attack.modifier = 1.0
             self.attack_reduced = False
-            print(f"{pokemon.name}'s attack was restored!")
+            log("status", "%s's attack was restored!", pokemon.name)
 
     def _handle_burn_damage(self, pokemon: PokemonState):
         """Apply burn damage"""
         if not pokemon.fainted:
             damage = max(1, int(pokemon.hp_max * 0.125))
             pokemon.hp = max(0, pokemon.hp - damage)
-            print(f"{pokemon.name} is hurt by its burn! (-{damage} HP)")
+            log("status", "%s is hurt by its burn! (-%d HP)", pokemon.name, damage)
 
             if pokemon.hp <= 0:
-                print(f"{pokemon.name} fainted from its burn!")
+                log("faint", "%s fainted from its burn!", pokemon.name)
 
 
 class SleepListener(Listener[BattleState]):
@@ -210,25 +272,48 @@ class SleepListener(Listener[BattleState]):
 
     datatype = BattleState
 
-    def __init__(self, player: Player, pokemon_idx: int):
+    def __init__(self, player: Player, pokemon_idx: int, rng: BattleRng = GLOBAL_RNG):
         self.player = player
         self.pokemon_idx = pokemon_idx
-        self.sleep_turns_remaining = random.randint(1, 3)
+        self.sleep_turns_remaining = rng.randint(1, 3)
+
+    def listener_filter(self) -> ListenerFilter:
+        # MOVE: wake up or stay asleep (cancelling moves). RESIDUAL: count down.
+        return ListenerFilter(phases=(Phase.MOVE, Phase.RESIDUAL))
+
+    def on_phase(self, phase: Phase, input: BattleState, event_queue: EventQueue) -> bool:
+        pokemon = _listened_pokemon(input, self.player, self.pokemon_idx)
+        if pokemon.status != Status.SLEEP:
+            return False
+        if phase == Phase.RESIDUAL:
+            self.sleep_turns_remaining -= 1
+            return True
+        if self.sleep_turns_remaining <= 0:
+            pokemon.status = Status.NONE
+            log("status", "%s woke up!", pokemon.name)
+            return False
+        if self._remove_all_moves(input, event_queue, pokemon):
+            log(
+                "status", "%s is fast asleep! (%d turns left)",
+                pokemon.name, self.sleep_turns_remaining,
+            )
+        return True
 
     def on_event(self, input: BattleState, event_queue: EventQueue) -> bool:
-        pokemon = input.get_player(self.player).pk_list[self.pokemon_idx]
+        pokemon = _listened_pokemon(input, self.player, self.pokemon_idx)
 
         if pokemon.status == Status.SLEEP:
             if self.sleep_turns_remaining <= 0:
                 pokemon.status = Status.NONE
-                print(f"{pokemon.name} woke up!")
+                log("status", "%s woke up!", pokemon.name)
                 return False
             else:
-                print(
-                    f"{pokemon.name} is fast asleep! ({self.sleep_turns_remaining} turns left)"
-                )
                 # Remove all move actions while asleep
-                self._remove_all_moves(event_queue, pokemon)
+                if self._remove_all_moves(input, event_queue, pokemon):
+                    log(
+                        "status", "%s is fast asleep! (%d turns left)",
+                        pokemon.name, self.sleep_turns_remaining,
+                    )
 
                 # Decrease sleep counter
                 self.sleep_turns_remaining -= 1
@@ -236,17 +321,15 @@ class SleepListener(Listener[BattleState]):
         else:
             return False
 
-    def _remove_all_moves(self, event_queue: EventQueue, pokemon: PokemonState):
-        """Remove all move actions for this Pokemon"""
-
-        def is_move_from_pokemon(event):
-            return (
-                event.__class__.__name__ == "MoveAction"
-                and event.player == self.player
-                and event.src_idx == self.pokemon_idx
-            )
-
-        event_queue.remove_event(is_move_from_pokemon)
+    def _remove_all_moves(
+        self, battle_state: BattleState, event_queue: EventQueue, pokemon: PokemonState
+    ) -> bool:
+        """Remove all move actions for this Pokemon; False while it is benched"""
+        slot = _active_slot(battle_state, self.player, self.pokemon_idx)
+        if slot is None:
+            return False
+        event_queue.cancel(self.player, slot, "MoveAction")
+        return True
 
 
 class FreezeListener(Listener[BattleState]):
@@ -254,38 +337,37 @@ class FreezeListener(Listener[BattleState]):
 
     datatype = BattleState
 
-    def __init__(self, player: Player, pokemon_idx: int):
+    def __init__(self, player: Player, pokemon_idx: int, rng: BattleRng = GLOBAL_RNG):
         self.player = player
         self.pokemon_idx = pokemon_idx
+        self._rng = rng
+
+    def listener_filter(self) -> ListenerFilter:
+        return ListenerFilter(phases=(Phase.MOVE,))
 
     def on_event(self, input: BattleState, event_queue: EventQueue) -> bool:
-        pokemon = input.get_player(self.player).pk_list[self.pokemon_idx]
+        pokemon = _listened_pokemon(input, self.player, self.pokemon_idx)
 
         if pokemon.status == Status.FROZEN:
+            slot = _active_slot(input, self.player, self.pokemon_idx)
+            if slot is None:
+                return True  # only thaws on turns it would move
             # 20% chance to thaw out
-            if random.random() < 0.2:
+            if self._rng.chance(0.2):
                 pokemon.status = Status.NONE
-                print(f"{pokemon.name} thawed out!")
+                log("status", "%s thawed out!", pokemon.name)
                 return False
 
             # Still frozen - remove all move actions
-            print(f"{pokemon.name} is frozen solid!")
-            self._remove_all_moves(event_queue, pokemon)
+            log("status", "%s is frozen solid!", pokemon.name)
+            self._remove_all_moves(event_queue, slot)
             return True
         else:
             return False
 
-    def _remove_all_moves(self, event_queue: EventQueue, pokemon: PokemonState):
+    def _remove_all_moves(self, event_queue: EventQueue, slot: int):
         """Remove all move actions for this Pokemon"""
-
-        def is_move_from_pokemon(event):
-            return (
-                event.__class__.__name__ == "MoveAction"
-                and event.player == self.player
-                and event.src_idx == self.pokemon_idx
-            )
-
-        event_queue.remove_event(is_move_from_pokemon)
+        event_queue.cancel(self.player, slot, "MoveAction")
 
 
 class CleanupSwitchoutListeners:
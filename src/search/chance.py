@@ -0,0 +1,276 @@
+"""
+Exact enumeration of a turn's chance outcomes.
+
+Instead of sampling a turn many times, enumerate_outcomes() plays it once per
+distinct combination of random results and returns every resulting position
+with its probability:
+
+    for outcome in enumerate_outcomes(game_state, thunderbolt, tackle):
+        print(outcome.probability, outcome.game_state.battle_state)
+
+The turn runs on a copy whose every random draw goes through an
+EnumeratingRng. Each semantic draw becomes a branch point with exact weights:
+
+  - chance(p)           two branches, p and 1 - p (paralysis, thaw)
+  - randint / choice    uniform branches (sleep length)
+  - roll_damage(base)   one branch per distinct damage value, weighted by the
+                        share of the 85-100% roll that produces it
+                        (damage_calc.roll_distribution)
+  - tiebreak            one branch per place the action can take among the
+                        actions queued at the same priority this turn (speed
+                        ties); decisions tie harmlessly and are not branched
+
+The branches are walked depth first, replaying the turn with the undo log
+rolled back in between, until every path has been played. Outcomes whose
+positions are equivalent under `key` are merged (by default: same Zobrist
+hash, so HP within one HP bucket, and same listener counters).
+
+A turn ends at the next decision either player has to make (the next turn's
+choices, or a faint replacement) or when the battle is over; each outcome is
+a position that BattleManager.resume() and MCTS can continue from.
+expectiminimax() builds on this for a small exact lookahead.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from battle_manager_rewrite import BattleManager
+from src.actions.choose_action import ChooseAction
+from src.actions.decision import Choice, DecisionProvider, legal_choices
+from src.events.battle_log import NullSink, use_log_sink
+from src.events.game_state import GameState
+from src.events.phases import Phase
+from src.search.mcts import PLAYERS, hp_share, clone_position
+from src.search.zobrist import position_hash
+from src.state.pokestate import BattleState
+from src.state.pokestate_defs import Player
+from src.state.damage_calc import roll_distribution
+from src.state.rng import BattleRng
+from src.state.undo import UndoLog
+
+_SIMPLE = (int, float, str, Enum, type(None))
+
+
+class EnumeratingRng(BattleRng):
+    """
+    A BattleRng that branches instead of sampling. Each run follows `script`
+    (the branch index to take at each draw, 0 past its end) and records the
+    path it took; next_script() is the depth-first successor of that path.
+    `probability` is the product of the weights taken so far.
+    """
+
+    def __init__(self):
+        super().__init__(source=None)
+        self.restart([])
+
+    def restart(self, script: Sequence[int]):
+        self._script = list(script)
+        self._path: List[Tuple[int, int]] = []  # (index taken, branch count) per draw
+        self._tiebreaks: Dict[Any, List[float]] = {}  # priority -> sorted keys drawn this run
+        self.probability = 1.0
+
+    def next_script(self) -> Optional[List[int]]:
+        """Script for the next unexplored path, or None when every path was played."""
+        path = self._path
+        for depth in reversed(range(len(path))):
+            index, width = path[depth]
+            if index + 1 < width:
+                return [taken for taken, _ in path[:depth]] + [index + 1]
+        return None
+
+    def _branch(self, weights: Sequence[float]) -> int:
+        depth = len(self._path)
+        index = self._script[depth] if depth < len(self._script) else 0
+        self._path.append((index, len(weights)))
+        self.probability *= weights[index]
+        return index
+
+    def random(self) -> float:
+        raise TypeError("a bare uniform draw cannot be enumerated; use a semantic BattleRng method")
+
+    def chance(self, probability: float) -> bool:
+        if probability <= 0.0 or probability >= 1.0:
+            return probability >= 1.0
+        return self._branch((probability, 1.0 - probability)) == 0
+
+    def randint(self, a: int, b: int) -> int:
+        count = b - a + 1
+        return a if count == 1 else a + self._branch([1.0 / count] * count)
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        return seq[0] if len(seq) == 1 else seq[self._branch([1.0 / len(seq)] * len(seq))]
+
+    def roll_damage(self, base_damage: float) -> int:
+        dist = roll_distribution(base_damage)
+        if len(dist.damages) == 1:
+            return dist.damages[0]
+        return dist.damages[self._branch(dist.probabilities)]
+
+    def tiebreak(self, priority, event) -> float:
+        if getattr(event, "phase", None) == Phase.DECISION:
+            return 0.5
+        # Every key drawn at this priority this run, including already popped
+        # actions: a uniformly random place among all of them gives the same
+        # order probabilities as independent uniform draws would.
+        drawn = self._tiebreaks.setdefault(priority, [])
+        place = self._branch([1.0 / (len(drawn) + 1)] * (len(drawn) + 1)) if drawn else 0
+        bounds = [0.0, *drawn, 1.0]
+        key = (bounds[place] + bounds[place + 1]) / 2
+        drawn.insert(place, key)
+        return key
+
+    def getstate(self) -> Any:
+        tiebreaks = {priority: list(keys) for priority, keys in self._tiebreaks.items()}
+        return list(self._script), list(self._path), tiebreaks, self.probability
+
+    def setstate(self, state: Any):
+        script, path, tiebreaks, self.probability = state
+        self._script, self._path = list(script), list(path)
+        self._tiebreaks = {priority: list(keys) for priority, keys in tiebreaks.items()}
+
+
+@dataclass
+class Outcome:
+    probability: float
+    game_state: GameState
+
+
+class _DecisionReached(Exception):
+    pass
+
+
+class _TurnChoices(DecisionProvider):
+    """Plays the given choices once each; any other decision ends the turn."""
+
+    def __init__(self, choices: Dict[Player, Choice]):
+        self.choices = choices
+
+    def choose(self, game_state, player, choices, slot=0):
+        choice = self.choices.pop(player, None)
+        if choice is None:
+            raise _DecisionReached()
+        return choice
+
+
+def _listener_key(game_state: GameState) -> Tuple:
+    # Listener counters (sleep turns left, toxic stage, ...) are not in the Zobrist hash.
+    keys = []
+    for registration in game_state.listener_manager._registrations.values():
+        listener = registration.listener
+        attrs = tuple(
+            (name, value) for name, value in sorted(vars(listener).items()) if isinstance(value, _SIMPLE)
+        )
+        keys.append(repr((registration.id, type(listener).__name__, attrs)))
+    return tuple(sorted(keys))
+
+
+def outcome_key(game_state: GameState) -> Hashable:
+    """Default equivalence for merging outcomes: Zobrist hash (HP bucketed) plus listener state."""
+    return (
+        position_hash(game_state.battle_state, game_state.field_state),
+        game_state.battle_state.turn_count,
+        _listener_key(game_state),
+    )
+
+
+def enumerate_outcomes(
+    game_state: GameState,
+    choice_1: Optional[Choice],
+    choice_2: Optional[Choice],
+    key: Optional[Callable[[GameState], Hashable]] = outcome_key,
+) -> List[Outcome]:
+    """
+    Every distinct position after Player 1 plays `choice_1` and Player 2
+    `choice_2` from the decision pending in `game_state` (None for a player
+    who is not choosing, e.g. during a one-sided faint replacement), most
+    likely first. Outcomes with equal `key` are merged; key=None keeps every
+    path. `game_state` itself is not modified.
+    """
+    rng = EnumeratingRng()
+    position = clone_position(game_state, rng)
+    undo = UndoLog()
+    undo.attach(position, track_rng=False)
+    merged: Dict[Hashable, Outcome] = {}
+    paths = 0
+    script: Optional[List[int]] = []
+    with use_log_sink(NullSink()):
+        while script is not None:
+            rng.restart(script)
+            mark = undo.mark()
+            undo.record(position.battle_state)  # turn_count
+            undo.record(position)  # phase
+            provider = _TurnChoices({p: c for p, c in zip(PLAYERS, (choice_1, choice_2)) if c is not None})
+            manager = BattleManager(
+                position.battle_state,
+                choose_action=lambda player: ChooseAction(player, provider),
+                verbose=False,
+                rng=rng,
+                game_state=position,
+            )
+            try:
+                manager.resume()
+            except _DecisionReached:
+                pass
+            outcome_id = paths if key is None else key(position)
+            if outcome_id in merged:
+                merged[outcome_id].probability += rng.probability
+            else:
+                merged[outcome_id] = Outcome(rng.probability, clone_position(position, game_state.rng))
+            undo.unmake(mark)
+            paths += 1
+            script = rng.next_script()
+    undo.detach(position)
+    return sorted(merged.values(), key=lambda outcome: -outcome.probability)
+
+
+def expected_value(
+    game_state: GameState,
+    choice_1: Optional[Choice],
+    choice_2: Optional[Choice],
+    evaluate: Callable[[BattleState], float] = hp_share,
+) -> float:
+    """Exact expectation of `evaluate` (Player 1's score) over the turn's outcomes."""
+    return sum(
+        outcome.probability * evaluate(outcome.game_state.battle_state)
+        for outcome in enumerate_outcomes(game_state, choice_1, choice_2)
+    )
+
+
+def choosers(battle_state: BattleState) -> Tuple[Player, ...]:
+    """Players who decide at this position: those replacing a fainted active, else both."""
+    replacing = tuple(p for p in PLAYERS if battle_state.get_player(p).get_active_mon(0).fainted)
+    return replacing or PLAYERS
+
+
+def expectiminimax(
+    game_state: GameState,
+    depth: int,
+    evaluate: Callable[[BattleState], float] = hp_share,
+) -> Tuple[float, Optional[Choice]]:
+    """
+    Player 1's value and best choice over `depth` decisions, with exact chance
+    nodes. Simultaneous choices are resolved pessimistically (maximin: Player 2
+    answers Player 1's choice), so the value is a lower bound on what Player 1
+    can guarantee.
+    """
+    battle_state = game_state.battle_state
+    if depth == 0 or battle_state.is_finished():
+        return evaluate(battle_state), None
+    deciding = choosers(battle_state)
+    options = [
+        legal_choices(battle_state.get_player(p)) or (None,) if p in deciding else (None,)
+        for p in PLAYERS
+    ]
+    best_value, best_choice = -1.0, None
+    for choice_1 in options[0]:
+        worst = min(
+            sum(
+                outcome.probability * expectiminimax(outcome.game_state, depth - 1, evaluate)[0]
+                for outcome in enumerate_outcomes(game_state, choice_1, choice_2)
+            )
+            for choice_2 in options[1]
+        )
+        if worst > best_value:
+            best_value, best_choice = worst, choice_1
+    return best_value, best_choice
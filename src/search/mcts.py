@@ -0,0 +1,440 @@
+"""
+Monte Carlo Tree Search for simultaneous-move turns.
+
+Both players choose at once, so every tree node keeps separate statistics per
+player ("decoupled" search) and each player picks its own arm with a
+SelectionRule: DecoupledUCT (UCB1 per player) or Exp3 (adversarial bandit,
+mixes better against opponents that adapt). Children are keyed by the joint
+choice. The tree is open-loop: nodes hold no state, each iteration replays
+the battle from the root position, and chance (damage rolls, paralysis,
+sleep) is simply re-sampled.
+
+An iteration runs on one copy of the root position (clone_position) through
+SearchBattle, a BattleManager whose decisions come from the tree while in it
+and from `rollout_policy` after the first new node. The rollout stops when
+the battle ends or after `rollout_turns` turns and is scored by `evaluate`
+(1 = Player 1 wins); an UndoLog then rolls the copy back for the next
+iteration.
+
+    mcts = MCTS(rollout_policy=GreedyDamageProvider(), seed=0)
+    result = mcts.search(game_state, iterations=2000)         # or time_limit=0.5
+    result = mcts.parallel_search(game_state, workers=4, time_limit=0.5)
+    choice = result.best(Player.PLAYER_1)
+
+parallel_search runs independent searches in a process pool (root
+parallelization) and merges their root statistics. The pool is started on
+first use and kept for later searches; close() it, or use the MCTS (or an
+MCTSProvider) as a context manager:
+
+    with MCTSProvider(MCTS(seed=0), time_limit=0.5, workers=4) as provider:
+        result = run_battle(team_1, team_2, provider, RandomProvider())
+
+Time limits are measured from the caller's side: the clock starts when
+search / parallel_search is called, so copying the position, handing it to
+the workers and merging their results all come out of the same budget.
+"""
+
+import copy
+import math
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from battle_manager_rewrite import BattleManager, DeathListener
+from src.actions.choose_action import ChooseAction
+from src.actions.decision import Choice, DecisionProvider, Policy, RandomProvider
+from src.events.battle_log import NullSink, use_log_sink
+from src.events.event_queue import EventQueue
+from src.events.game_state import GameState
+from src.events.phases import Phase
+from src.events.pursuit_listener import PursuitListener
+from src.state.pokestate import BattleState
+from src.state.pokestate_defs import Player, SwitchInEvent
+from src.state.rng import GLOBAL_RNG, BattleRng
+from src.state.undo import UndoLog
+
+PLAYERS = (Player.PLAYER_1, Player.PLAYER_2)
+
+# Seconds before a parallel search's deadline at which workers stop, left for
+# sending their statistics back and merging them.
+RETURN_MARGIN = 0.01
+
+# A joint choice: Player 1's and Player 2's (None for a player who did not choose).
+JointChoice = Tuple[Optional[Choice], Optional[Choice]]
+
+
+def hp_share(battle_state: BattleState) -> float:
+    """Player 1's score: 1 or 0 once decided, else its share of the remaining HP fractions."""
+    if battle_state.player_2.is_finished():
+        return 0.5 if battle_state.player_1.is_finished() else 1.0
+    if battle_state.player_1.is_finished():
+        return 0.0
+    shares = [
+        sum(mon.hp / mon.hp_max for mon in player_state.pk_list if mon.hp_max)
+        for player_state in (battle_state.player_1, battle_state.player_2)
+    ]
+    return shares[0] / (shares[0] + shares[1])
+
+
+# -- tree --------------------------------------------------------------------
+
+
+@dataclass
+class ArmStats:
+    visits: int = 0
+    total: float = 0.0  # summed reward, from the choosing player's point of view
+    score: float = 0.0  # Exp3's importance-weighted reward estimate
+
+
+@dataclass
+class Node:
+    arms: Dict[Player, Dict[Choice, ArmStats]] = field(
+        default_factory=lambda: {Player.PLAYER_1: {}, Player.PLAYER_2: {}}
+    )
+    children: Dict[JointChoice, "Node"] = field(default_factory=dict)
+
+
+class SelectionRule(ABC):
+    """Picks one player's arm at a node; `legal` is what that player may choose this time."""
+
+    @abstractmethod
+    def select(
+        self, arms: Dict[Choice, ArmStats], legal: Sequence[Choice], rng: BattleRng
+    ) -> Tuple[Choice, float]:
+        """Returns the choice and the probability it was picked with."""
+
+    def update(self, arm: ArmStats, reward: float, probability: float):
+        arm.visits += 1
+        arm.total += reward
+
+
+class DecoupledUCT(SelectionRule):
+    def __init__(self, exploration: float = 1.4):
+        self.exploration = exploration
+
+    def select(self, arms, legal, rng):
+        unvisited = [choice for choice in legal if choice not in arms or not arms[choice].visits]
+        if unvisited:
+            return rng.choice(unvisited), 1.0
+        log_total = math.log(sum(arms[choice].visits for choice in legal))
+        best, best_value = legal[0], -math.inf
+        for choice in legal:
+            arm = arms[choice]
+            value = arm.total / arm.visits + self.exploration * math.sqrt(log_total / arm.visits)
+            if value > best_value:
+                best, best_value = choice, value
+        return best, 1.0
+
+
+class Exp3(SelectionRule):
+    def __init__(self, gamma: float = 0.1):
+        self.gamma = gamma
+
+    def select(self, arms, legal, rng):
+        k = len(legal)
+        eta = self.gamma / k
+        scores = [arms[c].score if c in arms else 0.0 for c in legal]
+        top = max(scores)
+        weights = [math.exp(eta * (s - top)) for s in scores]
+        total = sum(weights)
+        probabilities = [(1 - self.gamma) * w / total + self.gamma / k for w in weights]
+        draw = rng.random()
+        for choice, probability in zip(legal, probabilities):
+            draw -= probability
+            if draw < 0:
+                return choice, probability
+        return legal[-1], probabilities[-1]
+
+    def update(self, arm, reward, probability):
+        super().update(arm, reward, probability)
+        arm.score += reward / probability
+
+
+@dataclass
+class SearchResult:
+    """Root statistics: per player, choice -> (visits, summed reward)."""
+
+    root: Dict[Player, Dict[Choice, Tuple[int, float]]]
+    iterations: int
+
+    def best(self, player: Player, legal: Optional[Sequence[Choice]] = None) -> Optional[Choice]:
+        """The most visited choice for `player` (among `legal`, if given)."""
+        stats = {c: s for c, s in self.root[player].items() if legal is None or c in legal}
+        if not stats:
+            return None
+        return max(stats, key=lambda c: (stats[c][0], stats[c][1]))
+
+    def merge(self, other: "SearchResult") -> "SearchResult":
+        root = {player: dict(arms) for player, arms in self.root.items()}
+        for player, arms in other.root.items():
+            for choice, (visits, total) in arms.items():
+                old_visits, old_total = root[player].get(choice, (0, 0.0))
+                root[player][choice] = (old_visits + visits, old_total + total)
+        return SearchResult(root, self.iterations + other.iterations)
+
+
+# -- simulation ----------------------------------------------------------------
+
+
+_NOT_CLONED = (DeathListener, PursuitListener)
+
+
+def clone_position(game_state: GameState, rng: BattleRng) -> GameState:
+    """
+    Deep copy of a position for search: Pokemon, field and listeners, with
+    every rng reference (the battle's and GLOBAL_RNG) replaced by `rng`. The
+    queue is left empty, so listeners tied to queued actions (Pursuit) are
+    dropped with it, as are DeathListeners; a BattleManager adds its own on
+    resume(). Dex entries are shared, not copied.
+    """
+    memo = {
+        id(game_state.event_queue): EventQueue(tie_rng=rng),
+        id(game_state.rng): rng,
+        id(GLOBAL_RNG): rng,
+        id(game_state.battle_state.undo_log): None,
+    }
+    for registration in game_state.listener_manager._registrations.values():
+        if isinstance(registration.listener, _NOT_CLONED):
+            memo[id(registration.listener)] = registration.listener  # shared, then removed
+    for player_state in (game_state.battle_state.player_1, game_state.battle_state.player_2):
+        for mon in player_state.pk_list:
+            for move in mon.moves:
+                memo[id(move.move_info)] = move.move_info
+    clone = copy.deepcopy(game_state, memo)
+    for datatype in (BattleState, SwitchInEvent):
+        clone.listener_manager.remove_listener_if(
+            datatype, lambda listener: isinstance(listener, _NOT_CLONED)
+        )
+    clone.phase = None
+    return clone
+
+
+class _Walk(DecisionProvider):
+    """One iteration's path: chooses from the tree until it leaves it, then rolls out."""
+
+    def __init__(self, root: Node, rule: SelectionRule, rollout_policy: Policy, rng: BattleRng):
+        self.node = root
+        self.rule = rule
+        self.rollout_policy = rollout_policy
+        self.rng = rng
+        self.in_tree = True
+        self.pending: Dict[Player, Tuple[Choice, float]] = {}
+        self.path: List[Tuple[Node, Dict[Player, Tuple[Choice, float]]]] = []
+
+    def choose(self, game_state, player, choices, slot=0):
+        if not self.in_tree:
+            return self.rollout_policy(game_state, player, choices)
+        choice, probability = self.rule.select(self.node.arms[player], choices, self.rng)
+        self.pending[player] = (choice, probability)
+        return choice
+
+    def close_round(self):
+        """Both players have chosen (or one, for a faint replacement): move to the child node."""
+        if not self.in_tree or not self.pending:
+            return
+        self.path.append((self.node, self.pending))
+        joint = tuple(self.pending[p][0] if p in self.pending else None for p in PLAYERS)
+        child = self.node.children.get(joint)
+        if child is None:
+            child = self.node.children[joint] = Node()
+            self.in_tree = False  # expanded one node; the rest is rollout
+        self.node = child
+        self.pending = {}
+
+    def backpropagate(self, reward: float):
+        for node, chosen in self.path:
+            for player, (choice, probability) in chosen.items():
+                arm = node.arms[player].get(choice)
+                if arm is None:
+                    arm = node.arms[player][choice] = ArmStats()
+                self.rule.update(arm, reward if player == Player.PLAYER_1 else 1.0 - reward, probability)
+
+
+class SearchBattle(BattleManager):
+    """BattleManager replaying a copied position, with every decision made by `walk`."""
+
+    def __init__(self, game_state: GameState, walk: _Walk, max_turns: int):
+        super().__init__(
+            game_state.battle_state,
+            choose_action=lambda player: ChooseAction(player, walk),
+            verbose=False,
+            max_turns=max_turns,
+            rng=game_state.rng,
+            game_state=game_state,
+        )
+        self._walk = walk
+
+    def _enter_phase(self, phase: Phase) -> bool:
+        if phase != Phase.DECISION:
+            self._walk.close_round()
+        return super()._enter_phase(phase)
+
+
+# -- search ----------------------------------------------------------------------
+
+
+class MCTS:
+    def __init__(
+        self,
+        selection: Optional[SelectionRule] = None,
+        rollout_policy: Policy = RandomProvider(),
+        evaluate: Callable[[BattleState], float] = hp_share,
+        rollout_turns: int = 20,
+        seed: Optional[int] = None,
+    ):
+        self.selection = selection if selection is not None else DecoupledUCT()
+        self.rollout_policy = rollout_policy
+        self.evaluate = evaluate
+        self.rollout_turns = rollout_turns
+        self.seed = seed
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+
+    def __getstate__(self):
+        # Workers get the search settings, not the pool.
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_workers"] = 0
+        return state
+
+    def __enter__(self) -> "MCTS":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool, if parallel_search started one."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_workers = 0
+
+    def _executor(self, workers: int) -> ProcessPoolExecutor:
+        if self._pool_workers != workers:
+            self.close()
+            self._pool = ProcessPoolExecutor(max_workers=workers)
+            self._pool_workers = workers
+        return self._pool
+
+    def search(
+        self,
+        game_state: GameState,
+        iterations: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        seed: Optional[int] = None,
+    ) -> SearchResult:
+        """Search the decision pending in `game_state` until either budget runs out."""
+        deadline = _deadline(time_limit, 0.0)
+        rng = BattleRng.seeded(self.seed if seed is None else seed)
+        return self._search_position(clone_position(game_state, rng), iterations, deadline)
+
+    def parallel_search(
+        self,
+        game_state: GameState,
+        workers: int,
+        iterations: Optional[int] = None,
+        time_limit: Optional[float] = None,
+    ) -> SearchResult:
+        """Root parallelization: `workers` independent searches, root statistics summed.
+        `iterations` is the total across workers; `time_limit` is the wall time of the whole call."""
+        deadline = _deadline(time_limit, RETURN_MARGIN)
+        base_seed = 0 if self.seed is None else self.seed
+        per_worker = None if iterations is None else max(1, iterations // workers)
+        rng = BattleRng.seeded(base_seed)
+        position = clone_position(game_state, rng)
+        pool = self._executor(workers)
+        futures = [
+            pool.submit(_search_worker, self, position, base_seed + i, per_worker, deadline)
+            for i in range(workers)
+        ]
+        results = [future.result() for future in futures]
+        merged = results[0]
+        for result in results[1:]:
+            merged = merged.merge(result)
+        return merged
+
+    def _search_position(
+        self, position: GameState, iterations: Optional[int], deadline: Optional[float]
+    ) -> SearchResult:
+        """Search `position` in place; `deadline` is a time.monotonic() value."""
+        if iterations is None and deadline is None:
+            raise ValueError("MCTS needs an iteration or time budget")
+        root = Node()
+        rng = position.rng
+        undo = UndoLog()
+        undo.attach(position, track_rng=False)
+        max_turns = position.battle_state.turn_count + self.rollout_turns
+        done = 0
+        with use_log_sink(NullSink()):
+            while (iterations is None or done < iterations) and (
+                deadline is None or time.monotonic() < deadline
+            ):
+                mark = undo.mark()
+                undo.record(position.battle_state)  # turn_count
+                undo.record(position)  # phase
+                walk = _Walk(root, self.selection, self.rollout_policy, rng)
+                SearchBattle(position, walk, max_turns).resume()
+                walk.close_round()
+                walk.backpropagate(self.evaluate(position.battle_state))
+                undo.unmake(mark)
+                done += 1
+        undo.detach(position)
+        stats = {
+            player: {choice: (arm.visits, arm.total) for choice, arm in arms.items()}
+            for player, arms in root.arms.items()
+        }
+        return SearchResult(stats, done)
+
+
+def _deadline(time_limit: Optional[float], margin: float) -> Optional[float]:
+    # time.monotonic() is system-wide, so worker processes can compare against it.
+    return None if time_limit is None else time.monotonic() + max(0.0, time_limit - margin)
+
+
+def _search_worker(
+    mcts: MCTS, position: GameState, seed: int, iterations: Optional[int], deadline: Optional[float]
+) -> SearchResult:
+    position.rng.setstate(BattleRng.seeded(seed).getstate())
+    return mcts._search_position(position, iterations, deadline)
+
+
+class MCTSProvider(DecisionProvider):
+    """
+    Decision provider that searches every decision with `mcts` (in-process, or
+    root-parallel with `workers`). The worker pool lives as long as `mcts`;
+    close() the provider, or use it as a context manager, when done.
+    """
+
+    def __init__(
+        self,
+        mcts: MCTS,
+        iterations: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        workers: int = 1,
+    ):
+        self.mcts = mcts
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.workers = workers
+
+    def __enter__(self) -> "MCTSProvider":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.mcts.close()
+
+    def choose(self, game_state, player, choices, slot=0):
+        if len(choices) == 1:
+            return choices[0]
+        if self.workers > 1:
+            result = self.mcts.parallel_search(game_state, self.workers, self.iterations, self.time_limit)
+        else:
+            result = self.mcts.search(game_state, self.iterations, self.time_limit)
+        best = result.best(player, choices)
+        return best if best is not None else choices[0]
@@ -0,0 +1,85 @@
+"""
+Fixed-size transposition table keyed by 64-bit position hashes.
+
+The table never grows: it has `2 ** bits` buckets of two entries each.
+
+  - The first entry is depth-preferred: a new result only replaces it when it
+    was searched at least as deep, or the entry is from an older search (see
+    new_search()).
+  - The second entry always takes whatever the first one turned away.
+
+So deep, expensive results survive while recent shallow ones still get cached.
+Entries store the full key, so a probe never returns another position's
+value; `value` can be anything the search wants (a score, visit statistics,
+a best action).
+"""
+
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+
+@dataclass
+class TableEntry:
+    key: int
+    depth: int
+    value: Any
+    generation: int
+
+
+class TranspositionTable:
+    WAYS = 2
+
+    def __init__(self, bits: int = 16):
+        self._mask = (1 << bits) - 1
+        self._slots: List[Optional[TableEntry]] = [None] * ((1 << bits) * self.WAYS)
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    def new_search(self):
+        """Age every stored entry, so the next search may overwrite them regardless of depth."""
+        self.generation += 1
+
+    def probe(self, key: int) -> Optional[TableEntry]:
+        base = (key & self._mask) * self.WAYS
+        for entry in self._slots[base:base + self.WAYS]:
+            if entry is not None and entry.key == key:
+                self.hits += 1
+                return entry
+        self.misses += 1
+        return None
+
+    def get(self, key: int, default: Any = None) -> Any:
+        entry = self.probe(key)
+        return default if entry is None else entry.value
+
+    def store(self, key: int, value: Any, depth: int = 0):
+        base = (key & self._mask) * self.WAYS
+        slots = self._slots
+        new = TableEntry(key, depth, value, self.generation)
+        preferred = slots[base]
+        if (
+            preferred is None
+            or preferred.key == key
+            or depth >= preferred.depth
+            or preferred.generation != self.generation
+        ):
+            slots[base] = new
+            if preferred is not None and preferred.key != key:
+                slots[base + 1] = preferred  # demoted, not lost
+            elif slots[base + 1] is not None and slots[base + 1].key == key:
+                slots[base + 1] = None  # drop the stale copy of this key
+        else:
+            slots[base + 1] = new
+
+    def __len__(self) -> int:
+        return sum(entry is not None for entry in self._slots)
+
+    def clear(self):
+        self._slots = [None] * len(self._slots)
+        self.generation = 0
+        self.hits = self.misses = 0
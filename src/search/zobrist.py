@@ -0,0 +1,109 @@
+"""
+Zobrist hashing of battle positions.
+
+position_hash() XORs fixed random 64-bit keys for every feature of a
+position:
+
+  - per Pokemon (by side and team slot): HP bucket, status, the five stat
+    boosts (Stat._boost) and each move's PP
+  - per side: active index and hazard layers (FieldSide.hazards)
+  - weather
+
+A Pokemon's share is cached on it (PokemonState._hash) and cleared by the
+setters of every field it covers, so hashing a position after a move only
+recomputes the Pokemon that actually changed; the side and field keys are a
+handful of lookups. HP is bucketed into HP_BUCKETS steps of max HP (any
+non-zero HP stays out of bucket 0), so positions differing by a point or two
+of HP share a hash.
+
+This is a cached recombination rather than a running hash kept up to date
+by XORing each change in as it happens: position_hash still visits every
+Pokemon and re-XORs the side and field keys on each call. A running hash
+would need every hashed field's setter (HP, status, Stat boosts, MoveState
+PP, active index, hazards, weather) to know its side, slot and previous
+value. Undoing it would also mean journalling the hash in UndoLog next to
+each field. The cost of not doing that is measured at about 3 us for a
+3-vs-3 position with nothing changed, about 11 us after one Pokemon changes,
+and about 50 us when all six changed. That is small next to the cost of
+playing the turn that changed them.
+
+Keys come from a fixed seed, so hashes are stable across processes and runs.
+"""
+
+import random
+from typing import Optional
+
+from src.state.field import HAZARD_DEFS, FieldState
+from src.state.pokestate import BattleState, PokemonState
+from src.state.pokestate_defs import Status
+
+MAX_TEAM = 6
+MAX_MOVES = 4
+HP_BUCKETS = 64
+MAX_PP = 64  # PP values above this share keys modulo MAX_PP + 1
+BOOST_LEVELS = 13  # -6..+6
+STATS = ("_attack", "_defense", "_special_attack", "_special_defense", "_speed")
+HAZARDS = list(HAZARD_DEFS)
+MAX_LAYERS = 3
+WEATHERS = [None, "sun", "rain", "sand", "hail"]
+
+STATUS_INDEX = {status: i for i, status in enumerate(Status)}
+HAZARD_INDEX = {name: i for i, name in enumerate(HAZARDS)}
+WEATHER_INDEX = {weather: i for i, weather in enumerate(WEATHERS)}
+
+_rng = random.Random(0x5EED_2B0B)
+
+
+def _keys(*shape):
+    if len(shape) == 1:
+        return [_rng.getrandbits(64) for _ in range(shape[0])]
+    return [_keys(*shape[1:]) for _ in range(shape[0])]
+
+
+# Indexed [side][team slot][...].
+HP_KEYS = _keys(2, MAX_TEAM, HP_BUCKETS + 1)
+STATUS_KEYS = _keys(2, MAX_TEAM, len(Status))
+BOOST_KEYS = _keys(2, MAX_TEAM, len(STATS), BOOST_LEVELS)
+PP_KEYS = _keys(2, MAX_TEAM, MAX_MOVES, MAX_PP + 1)
+# Indexed [side][...].
+ACTIVE_KEYS = _keys(2, MAX_TEAM)
+HAZARD_KEYS = _keys(2, len(HAZARDS), MAX_LAYERS + 1)
+WEATHER_KEYS = _keys(len(WEATHERS))
+
+
+def hp_bucket(hp: int, hp_max: int) -> int:
+    if hp <= 0 or hp_max <= 0:
+        return 0
+    return min(HP_BUCKETS, (hp * HP_BUCKETS + hp_max - 1) // hp_max)
+
+
+def pokemon_hash(mon: PokemonState, side: int, slot: int) -> int:
+    """`mon`'s share of the position hash, from its cache when nothing it covers changed."""
+    h = mon._hash
+    if h is not None:
+        return h
+    h = HP_KEYS[side][slot][hp_bucket(mon._hp, mon.hp_max)]
+    h ^= STATUS_KEYS[side][slot][STATUS_INDEX[mon._status]]
+    boost_keys = BOOST_KEYS[side][slot]
+    for s, stat_name in enumerate(STATS):
+        h ^= boost_keys[s][getattr(mon, stat_name)._boost + 6]
+    pp_keys = PP_KEYS[side][slot]
+    for m, move in enumerate(mon.moves[:MAX_MOVES]):
+        h ^= pp_keys[m][move.pp % (MAX_PP + 1)]
+    object.__setattr__(mon, "_hash", h)
+    return h
+
+
+def position_hash(battle_state: BattleState, field_state: Optional[FieldState] = None) -> int:
+    """64-bit hash of the whole position (both teams, active slots, hazards, weather)."""
+    h = 0
+    for side, player_state in enumerate((battle_state.player_1, battle_state.player_2)):
+        for slot, mon in enumerate(player_state.pk_list):
+            h ^= pokemon_hash(mon, side, slot)
+        h ^= ACTIVE_KEYS[side][player_state.active_mons[0]]
+    if field_state is not None:
+        for side, field_side in enumerate((field_state.player_1_side, field_state.player_2_side)):
+            for name, layers in field_side.hazards.items():
+                h ^= HAZARD_KEYS[side][HAZARD_INDEX[name]][min(layers, MAX_LAYERS)]
+        h ^= WEATHER_KEYS[WEATHER_INDEX[field_state.weather]]
+    return h
@@ -0,0 +1,146 @@
+"""
+Battles as coroutines that suspend at decisions.
+
+BattleCoroutine.play() is the BattleManager loop as a generator: whenever
+players without a provider have to choose, it yields the list of
+DecisionRequests due at that point and waits for the list of Choices, in the
+same order, to be sent back.
+
+    battle = BattleCoroutine(battle_state, rng=BattleRng.seeded(0))
+    steps = battle.play()
+    requests = next(steps)
+    while True:
+        try:
+            requests = steps.send([pick(request.choices) for request in requests])
+        except StopIteration:
+            break
+    print(battle.winner())
+
+Both players' choices at the start of a turn are requested together (they
+only queue actions, so neither depends on the other); a faint replacement is
+requested on its own, after everything queued ahead of it has run, exactly as
+BattleManager would ask for it.
+
+Players given a provider (or policy) decide inline without suspending, so a
+driver only sees the decisions it asked for. The engine logs to whatever sink
+is current while the generator runs; drivers interleaving several battles
+should resume each under use_log_sink().
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Generator, List, Optional, Set, Tuple, Union
+
+from battle_manager_rewrite import BattleManager
+from src.actions.choose_action import ChooseAction
+from src.actions.decision import Choice, DecisionProvider, Policy, as_provider, legal_choices
+from src.events.game_state import GameState
+from src.state.pokestate import BattleState, winner
+from src.state.pokestate_defs import Player
+from src.state.rng import BattleRng, GLOBAL_RNG
+
+
+@dataclass
+class DecisionRequest:
+    """A pending choice for `player`'s active `slot`, one of `choices`."""
+
+    player: Player
+    slot: int
+    choices: Tuple[Choice, ...]
+    game_state: GameState
+
+
+class _Suspended(DecisionProvider):
+    """Hands a ChooseAction the choices that were sent to the coroutine, by slot."""
+
+    def __init__(self):
+        self.answers: Dict[int, Choice] = {}
+
+    def choose(self, game_state, player, choices, slot=0):
+        return self.answers.pop(slot)
+
+
+class BattleCoroutine(BattleManager):
+    """
+    BattleManager whose decisions for players without a provider are yielded
+    from play() as DecisionRequests. `providers` maps players who should decide
+    inline to a DecisionProvider or Policy.
+    """
+
+    def __init__(
+        self,
+        battle_state: BattleState,
+        providers: Optional[Dict[Player, Union[DecisionProvider, Policy]]] = None,
+        max_turns: Optional[int] = None,
+        rng: BattleRng = GLOBAL_RNG,
+        game_state: Optional[GameState] = None,
+    ):
+        super().__init__(
+            battle_state,
+            choose_action=self._make_choose_action,
+            verbose=False,
+            max_turns=max_turns,
+            rng=rng,
+            game_state=game_state,
+        )
+        self._providers = {player: as_provider(p) for player, p in (providers or {}).items()}
+        self._opening: Set[ChooseAction] = set()  # this turn's not yet asked opening decisions
+
+    def _make_choose_action(self, player: Player) -> ChooseAction:
+        provider = self._providers.get(player)
+        return ChooseAction(player, provider if provider is not None else _Suspended())
+
+    def _start_turn(self):
+        super()._start_turn()
+        self._opening = {item.event for item in self._game_state.event_queue.get_all_events()}
+
+    def _take_opening(self, action: ChooseAction) -> List[ChooseAction]:
+        """`action` and the turn's other opening decisions, taken off the queue in execution order."""
+        if action not in self._opening:
+            return [action]
+        queue = self._game_state.event_queue
+        others = [item for item in queue.get_all_events() if item.event in self._opening]
+        others.sort(key=lambda item: (item.priority, item.tiebreak, item.seq))
+        for item in others:
+            queue.remove_item(item)
+        self._opening = set()
+        return [action] + [item.event for item in others]
+
+    def play(self, resume: bool = False) -> Generator[List[DecisionRequest], List[Choice], None]:
+        """
+        Run the battle from the lead-in (or, with `resume`, from the decision
+        point the game state is at, as BattleManager.resume() does), yielding
+        the decisions due at each point and expecting their Choices back.
+        Illegal choices raise ValueError from send().
+        """
+        if resume:
+            self._prepare_resume()
+        else:
+            self._lead_in()
+        game_state = self._game_state
+        while (next_action := self._next_action()) is not None:
+            if not isinstance(next_action, ChooseAction):
+                next_action.execute(game_state)
+                continue
+            group = self._take_opening(next_action)
+            requests, asked = [], []
+            for action in group:
+                if not isinstance(action.provider, _Suspended):
+                    continue
+                player_state = game_state.battle_state.get_player(action.player)
+                for slot in range(len(player_state.active_mons)):
+                    choices = legal_choices(player_state, slot)
+                    if choices:
+                        requests.append(DecisionRequest(action.player, slot, choices, game_state))
+                        asked.append((action, slot))
+            if requests:
+                answers = yield requests
+                if len(answers) != len(requests):
+                    raise ValueError(f"Expected {len(requests)} choices, got {len(answers)}")
+                for (action, slot), choice in zip(asked, answers):
+                    action.provider.answers[slot] = choice
+            for action in group:
+                action.execute(game_state)
+
+    def winner(self) -> Optional[Player]:
+        return winner(self._game_state.battle_state)
+
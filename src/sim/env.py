@@ -0,0 +1,131 @@
+"""
+Gym-style reinforcement-learning environment (requires NumPy).
+
+BattleEnv plays one side of a singles battle on the rewrite engine; the other
+side is a policy (random by default). The battle runs as a BattleCoroutine
+that suspends whenever the agent has to choose:
+
+    env = BattleEnv(team_1, team_2)
+    observation, info = env.reset(seed=0)
+    while True:
+        action = pick(observation, info["action_mask"])
+        observation, reward, terminated, truncated, info = env.step(action)
+        if terminated or truncated:
+            break
+
+Actions are integers: 0..max_moves-1 use that move, max_moves + i switches to
+team slot i. info["action_mask"] marks the legal ones. The reward is +1 for a
+win, -1 for a loss and 0 otherwise (including a draw or the turn cap, which
+ends the episode with truncated=True).
+
+Observations come from an ObservationEncoder and are written into the same
+float32 buffer every step, as are the action mask and info dict; copy them to
+keep them. The two buffers can be views into memory the caller owns (see
+vector_env).
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.actions.decision import Choice, ChoiceKind, DecisionProvider, Policy, RandomProvider
+from src.events.battle_log import NullSink, use_log_sink
+from src.sim.coroutine import BattleCoroutine, DecisionRequest
+from src.sim.headless import DEFAULT_MAX_TURNS, TeamDefinition
+from src.sim.observation import ObservationEncoder
+from src.state.legal_actions import MAX_MOVES
+from src.state.pokestate_defs import Player
+from src.state.rng import BattleRng, GLOBAL_RNG
+from src.state.team_template import TeamTemplate, create_battle_state
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required to use the environment, not to import the package.
+    np = None
+
+
+class BattleEnv:
+    """
+    One battle between two team definitions, played from `player`'s side
+    against `opponent` (a DecisionProvider or Policy).
+    """
+
+    def __init__(
+        self,
+        team_1: Union[TeamDefinition, TeamTemplate],
+        team_2: Union[TeamDefinition, TeamTemplate],
+        opponent: Union[DecisionProvider, Policy, None] = None,
+        player: Player = Player.PLAYER_1,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        team_size: Optional[int] = None,
+        observation: Optional["np.ndarray"] = None,
+        action_mask: Optional["np.ndarray"] = None,
+    ):
+        self.teams = (TeamTemplate.of(team_1), TeamTemplate.of(team_2))
+        self.opponent = opponent if opponent is not None else RandomProvider()
+        self.player = player
+        self.max_turns = max_turns
+        team_size = team_size or max(len(team) for team in self.teams)
+        self.encoder = ObservationEncoder(team_size, MAX_MOVES, max_turns)
+        self.action_size = MAX_MOVES + team_size
+        self.observation = observation if observation is not None else self.encoder.empty()
+        self.action_mask = action_mask if action_mask is not None else np.zeros(self.action_size, dtype=bool)
+        if self.observation.shape != (self.encoder.size,) or self.action_mask.shape != (self.action_size,):
+            raise ValueError("Observation or action mask buffer has the wrong shape")
+        self._sink = NullSink()
+        self._battle: Optional[BattleCoroutine] = None
+        self._steps = None
+        self._requests: Optional[List[DecisionRequest]] = None
+        self._info: Dict[str, Any] = {"action_mask": self.action_mask, "turn": 0}
+
+    @property
+    def observation_size(self) -> int:
+        return self.encoder.size
+
+    @property
+    def game_state(self):
+        return self._battle.game_state
+
+    def reset(self, seed: Optional[int] = None) -> Tuple["np.ndarray", Dict[str, Any]]:
+        """Start a new battle (seeded for reproducibility) and advance to the agent's first decision."""
+        battle_state = create_battle_state(*self.teams)
+        rng = GLOBAL_RNG if seed is None else BattleRng.seeded(seed)
+        self._battle = BattleCoroutine(
+            battle_state,
+            providers={Player.opponent(self.player): self.opponent},
+            max_turns=self.max_turns,
+            rng=rng,
+        )
+        self._steps = self._battle.play()
+        self._advance(None)
+        return self.observation, self._info
+
+    def step(self, action: int) -> Tuple["np.ndarray", float, bool, bool, Dict[str, Any]]:
+        """Play `action` (an index into the action mask) and run on to the agent's next decision."""
+        if self._requests is None:
+            raise RuntimeError("The episode is over; call reset()")
+        if not 0 <= action < self.action_size or not self.action_mask[action]:
+            raise ValueError(f"Action {action} is not legal")
+        if action < MAX_MOVES:
+            choice = Choice(ChoiceKind.MOVE, action)
+        else:
+            choice = Choice(ChoiceKind.SWITCH, action - MAX_MOVES)
+        self._advance([choice])
+        if self._requests is not None:
+            return self.observation, 0.0, False, False, self._info
+        winner = self._battle.winner()
+        reward = 0.0 if winner is None else (1.0 if winner == self.player else -1.0)
+        terminated = self.game_state.battle_state.is_finished()
+        return self.observation, reward, terminated, not terminated, self._info
+
+    def _advance(self, choices: Optional[List[Choice]]):
+        with use_log_sink(self._sink):
+            try:
+                # Only the agent's side suspends, so each stop asks for one choice.
+                self._requests = self._steps.send(choices)
+            except StopIteration:
+                self._requests = None
+        battle_state = self._battle.game_state.battle_state
+        self.encoder.encode(battle_state, self.player, self.observation)
+        self._info["turn"] = battle_state.turn_count
+        self.action_mask.fill(False)
+        for legal in self._requests[0].choices if self._requests is not None else ():
+            self.action_mask[legal.index if legal.kind == ChoiceKind.MOVE else MAX_MOVES + legal.index] = True
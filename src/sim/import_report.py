@@ -0,0 +1,135 @@
+"""
+Import-time report for the simulator's entry points.
+
+Short-lived worker processes pay the full import cost of the engine before
+they play a single turn. This module imports an entry point in a fresh
+interpreter under `python -X importtime`, keeps the fastest of a few runs and
+reports where the time goes: the slowest modules by self time and the total
+per top-level package.
+
+Usage:
+    python -m src.sim.import_report                      # main and battle_manager_rewrite
+    python -m src.sim.import_report src.sim.headless --top 20 --runs 5
+
+Exits with status 1 if an entry point listed in IMPORT_BUDGETS_MS goes over
+its budget.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Cumulative import time per entry point, in milliseconds. Both measure about
+# 80 ms with cached bytecode (about 100 ms without) on a development machine;
+# NumPy is only imported by the vectorized helpers that use it.
+IMPORT_BUDGETS_MS: Dict[str, float] = {
+    "main": 130.0,
+    "battle_manager_rewrite": 130.0,
+}
+
+DEFAULT_RUNS = 3
+DEFAULT_TOP = 15
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    name: str
+    depth: int  # 0 for imports done by the measured statement itself
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> List[ImportTiming]:
+    """Timings from `-X importtime` output, in the order Python printed them (children first)."""
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # column header
+        indented = fields[2].rstrip()[1:]
+        name = indented.lstrip()
+        timings.append(
+            ImportTiming(name, (len(indented) - len(name)) // 2, int(fields[0]), int(fields[1]))
+        )
+    return timings
+
+
+def subtree(timings: List[ImportTiming], module: str) -> List[ImportTiming]:
+    """
+    The timings caused by importing `module`: its own entry, those of its
+    parent packages, and everything they imported. Interpreter startup
+    imports (site, encodings, ...) are dropped.
+    """
+    kept, pending = [], []
+    for timing in timings:
+        pending.append(timing)
+        if timing.depth == 0:
+            if module == timing.name or module.startswith(timing.name + "."):
+                kept.extend(pending)
+            pending = []
+    return kept
+
+
+def total_ms(timings: List[ImportTiming]) -> float:
+    return sum(t.cumulative_us for t in timings if t.depth == 0) / 1000
+
+
+def measure(module: str, runs: int = DEFAULT_RUNS) -> List[ImportTiming]:
+    """Timings of `import module` in a fresh interpreter, from the fastest of `runs` runs."""
+    best: Optional[List[ImportTiming]] = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            env={**os.environ, "PYTHONPATH": ROOT},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings = subtree(parse_importtime(result.stderr), module)
+        if best is None or total_ms(timings) < total_ms(best):
+            best = timings
+    return best
+
+
+def format_report(module: str, timings: List[ImportTiming], top: int = DEFAULT_TOP) -> str:
+    total = total_ms(timings)
+    budget = IMPORT_BUDGETS_MS.get(module)
+    verdict = "" if budget is None else f" (budget {budget:.0f} ms{', OVER' if total > budget else ''})"
+    lines = [f"{module}: {total:.1f} ms, {len(timings)} modules{verdict}", "", "   self ms     cum ms  module"]
+    for t in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]:
+        lines.append(f"{t.self_us / 1000:10.1f} {t.cumulative_us / 1000:10.1f}  {t.name}")
+
+    packages: Dict[str, int] = defaultdict(int)
+    for t in timings:
+        packages[t.name.partition(".")[0]] += t.self_us
+    lines += ["", "   self ms  package"]
+    for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"{self_us / 1000:10.1f}  {package}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report where import time goes for each module.")
+    parser.add_argument("modules", nargs="*", default=sorted(IMPORT_BUDGETS_MS))
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="rows per table")
+    args = parser.parse_args()
+
+    over = []
+    for module in args.modules:
+        timings = measure(module, args.runs)
+        print(format_report(module, timings, args.top), end="\n\n")
+        if total_ms(timings) > IMPORT_BUDGETS_MS.get(module, float("inf")):
+            over.append(module)
+    if over:
+        print("over budget: " + ", ".join(over))
+        sys.exit(1)
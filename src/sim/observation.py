@@ -0,0 +1,134 @@
+"""
+Fixed-size observation encoding (requires NumPy).
+
+ObservationEncoder writes a battle, seen from one player's side, into a
+preallocated float32 vector of `encoder.size` values:
+
+  [0]                      turn / max_turns
+  own team                 team_size Pokemon blocks
+  opponent's team          team_size Pokemon blocks
+
+Each Pokemon block is POKEMON_FEATURES values followed by max_moves move
+blocks of MOVE_FEATURES values:
+
+  visible, active, HP fraction, fainted, status one-hot (STATUS_ORDER),
+  stat boosts / 6, current stats / STAT_SCALE, type multi-hot (Type.value)
+  move: visible, power / POWER_SCALE, type one-hot, category one-hot,
+        PP fraction, priority
+
+Hidden information is left at zero: an opposing Pokemon is visible once it
+has been `revealed` (sent out) or is `known`, and its moves once they are
+`known` (used) or the Pokemon is. Opposing PP is never shown. Empty team and
+move slots are zero as well.
+
+encode() only assigns into the given buffer, so an environment can reuse one
+vector (or a view into shared memory) for every step.
+"""
+
+from src.sim.headless import DEFAULT_MAX_TURNS
+from src.state.legal_actions import MAX_BENCH, MAX_MOVES
+from src.state.pokestate import BattleState, PlayerState, PokemonState
+from src.state.pokestate_defs import Category, Player, Status, Type
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required to encode, not to import the package.
+    np = None
+
+STATS = ("_attack", "_defense", "_special_attack", "_special_defense", "_speed")
+STATUS_ORDER = (
+    Status.POISONED, Status.BURNED, Status.PARALYZED, Status.SLEEP, Status.FROZEN, Status.TOXIC,
+)
+STATUS_SLOT = {status: i for i, status in enumerate(STATUS_ORDER)}
+N_TYPES = len(Type)
+N_CATEGORIES = len(Category)
+STAT_SCALE = 500.0
+POWER_SCALE = 150.0
+MAX_BOOST = 6.0
+
+# Offsets inside a Pokemon block.
+VISIBLE, ACTIVE, HP, FAINTED = range(4)
+STATUS_AT = 4
+BOOSTS_AT = STATUS_AT + len(STATUS_ORDER)
+STATS_AT = BOOSTS_AT + len(STATS)
+TYPES_AT = STATS_AT + len(STATS)
+POKEMON_FEATURES = TYPES_AT + N_TYPES
+
+# Offsets inside a move block.
+MOVE_VISIBLE, MOVE_POWER = range(2)
+MOVE_TYPE_AT = 2
+MOVE_CATEGORY_AT = MOVE_TYPE_AT + N_TYPES
+MOVE_PP = MOVE_CATEGORY_AT + N_CATEGORIES
+MOVE_PRIORITY = MOVE_PP + 1
+MOVE_FEATURES = MOVE_PRIORITY + 1
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for observation encoding")
+
+
+class ObservationEncoder:
+    """Encodes battles for teams of up to `team_size` Pokemon with up to `max_moves` moves."""
+
+    def __init__(
+        self, team_size: int = MAX_BENCH, max_moves: int = MAX_MOVES, max_turns: int = DEFAULT_MAX_TURNS
+    ):
+        _require_numpy()
+        self.team_size = team_size
+        self.max_moves = max_moves
+        self.max_turns = max_turns
+        self.pokemon_size = POKEMON_FEATURES + max_moves * MOVE_FEATURES
+        self.size = 1 + 2 * team_size * self.pokemon_size
+
+    def empty(self) -> "np.ndarray":
+        return np.zeros(self.size, dtype=np.float32)
+
+    def encode(self, battle_state: BattleState, player: Player, out: "np.ndarray") -> "np.ndarray":
+        """Write `player`'s view of `battle_state` into `out` (float32, length `size`) and return it."""
+        out.fill(0.0)
+        out[0] = battle_state.turn_count / self.max_turns
+        self._encode_side(battle_state.get_player(player), out, 1, hidden=False)
+        self._encode_side(
+            battle_state.get_opponent(player), out, 1 + self.team_size * self.pokemon_size, hidden=True
+        )
+        return out
+
+    def _encode_side(self, side: PlayerState, out, offset: int, hidden: bool):
+        if len(side.pk_list) > self.team_size:
+            raise ValueError(f"Team of {len(side.pk_list)} does not fit an encoder for {self.team_size}")
+        for i, mon in enumerate(side.pk_list):
+            self._encode_pokemon(mon, i in side.active_mons, out, offset + i * self.pokemon_size, hidden)
+
+    def _encode_pokemon(self, mon: PokemonState, active: bool, out, at: int, hidden: bool):
+        if hidden and not (mon.revealed or mon.known):
+            return
+        out[at + VISIBLE] = 1.0
+        out[at + ACTIVE] = active
+        out[at + HP] = mon.hp / mon.hp_max if mon.hp_max else 0.0
+        out[at + FAINTED] = mon.fainted
+        slot = STATUS_SLOT.get(mon.status)
+        if slot is not None:
+            out[at + STATUS_AT + slot] = 1.0
+        for i, name in enumerate(STATS):
+            stat = getattr(mon, name)
+            out[at + BOOSTS_AT + i] = stat._boost / MAX_BOOST
+            out[at + STATS_AT + i] = stat.current_stat / STAT_SCALE
+        if mon.type1 is not None:
+            out[at + TYPES_AT + mon.type1.value] = 1.0
+        if mon.type2 is not None:
+            out[at + TYPES_AT + mon.type2.value] = 1.0
+        for m, move in enumerate(mon.moves):
+            if m >= self.max_moves:
+                break
+            info = move.move_info
+            if info is None or (hidden and not (mon.known or move.known)):
+                continue
+            move_at = at + POKEMON_FEATURES + m * MOVE_FEATURES
+            out[move_at + MOVE_VISIBLE] = 1.0
+            out[move_at + MOVE_POWER] = (info.power or 0) / POWER_SCALE
+            out[move_at + MOVE_TYPE_AT + info.type.value] = 1.0
+            out[move_at + MOVE_CATEGORY_AT + info.category.value] = 1.0
+            if not hidden:
+                out[move_at + MOVE_PP] = move.pp / move.pp_max if move.pp_max else 0.0
+            out[move_at + MOVE_PRIORITY] = info.priority
@@ -0,0 +1,132 @@
+"""
+Batched decision scheduling for many concurrent battles.
+
+A neural policy is cheap per sample only when it sees many samples at once.
+BatchScheduler runs any number of BattleCoroutines side by side: each round
+it collects every decision the suspended battles are waiting on, hands the
+whole batch to the policy in one call, and resumes each battle with its
+answers. N battles thus cost one policy call per decision point instead of N.
+
+    def policy(requests):            # one call per round
+        logits = model(encode_batch(requests))
+        return [pick(request, row) for request, row in zip(requests, logits)]
+
+    results = run_batched([(team_1, team_2)] * 256, policy, seed=0)
+
+A BatchPolicy takes a sequence of DecisionRequests and returns one Choice
+per request, in order; batched() adapts a per-decision Policy (e.g. the
+headless random_policy) for testing and baselines.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generator, List, Optional, Sequence, Tuple, Union
+
+from src.actions.decision import Choice, DecisionProvider, Policy, as_provider
+from src.events.battle_log import LogSink, NullSink, use_log_sink
+from src.sim.coroutine import BattleCoroutine, DecisionRequest
+from src.sim.headless import DEFAULT_MAX_TURNS, BattleResult, TeamDefinition
+from src.state.rng import BattleRng, GLOBAL_RNG
+from src.state.team_template import TeamTemplate, create_battle_state
+
+BatchPolicy = Callable[[Sequence[DecisionRequest]], Sequence[Choice]]
+
+
+def batched(policy: Union[DecisionProvider, Policy]) -> BatchPolicy:
+    """A BatchPolicy that asks `policy` about each request in turn."""
+    provider = as_provider(policy)
+
+    def choose_all(requests: Sequence[DecisionRequest]) -> List[Choice]:
+        return [
+            provider.choose(request.game_state, request.player, request.choices, request.slot)
+            for request in requests
+        ]
+
+    return choose_all
+
+
+@dataclass
+class _Running:
+    battle: BattleCoroutine
+    steps: Generator[List[DecisionRequest], List[Choice], None]
+    requests: List[DecisionRequest] = field(default_factory=list)
+
+
+class BatchScheduler:
+    """
+    Drives battles added with add() until all of them finish, answering
+    their decisions with one `policy` call per round. `rounds` and
+    `decisions` count the policy calls and the requests they answered.
+    """
+
+    def __init__(self, policy: BatchPolicy, sink: Optional[LogSink] = None):
+        self.policy = policy
+        self.sink = sink if sink is not None else NullSink()
+        self.battles: List[BattleCoroutine] = []
+        self._running: List[_Running] = []
+        self.rounds = 0
+        self.decisions = 0
+
+    def add(self, battle: BattleCoroutine, resume: bool = False) -> int:
+        """Schedule `battle` (from its lead-in, or resumed); returns its index in `battles`."""
+        self.battles.append(battle)
+        self._running.append(_Running(battle, battle.play(resume)))
+        return len(self.battles) - 1
+
+    def _advance(self, running: _Running, answers: Optional[List[Choice]]) -> bool:
+        """Resume one battle; False once it has finished."""
+        try:
+            running.requests = running.steps.send(answers)
+        except StopIteration:
+            return False
+        return True
+
+    def run(self) -> List[BattleCoroutine]:
+        """Play every scheduled battle to the end; returns `battles`."""
+        with use_log_sink(self.sink):
+            running = [entry for entry in self._running if self._advance(entry, None)]
+            while running:
+                batch = [request for entry in running for request in entry.requests]
+                answers = list(self.policy(batch))
+                if len(answers) != len(batch):
+                    raise ValueError(f"Batch policy returned {len(answers)} choices for {len(batch)} requests")
+                self.rounds += 1
+                self.decisions += len(batch)
+                still_running, start = [], 0
+                for entry in running:
+                    end = start + len(entry.requests)
+                    if self._advance(entry, answers[start:end]):
+                        still_running.append(entry)
+                    start = end
+                running = still_running
+        self._running = []
+        return self.battles
+
+
+def run_batched(
+    matchups: Sequence[Tuple[Union[TeamDefinition, TeamTemplate], Union[TeamDefinition, TeamTemplate]]],
+    policy: BatchPolicy,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    seed: Optional[int] = None,
+    sink: Optional[LogSink] = None,
+) -> List[BattleResult]:
+    """
+    Play one battle per (team_1, team_2) matchup, all decisions by `policy`
+    in batches. Battle i uses the rng seeded seed + i, so it replays exactly
+    like run_battle(..., seed=seed + i) with the same choices.
+    """
+    scheduler = BatchScheduler(policy, sink)
+    templates: Dict[int, TeamTemplate] = {}  # each distinct team object is compiled once
+
+    def compiled(team) -> TeamTemplate:
+        if id(team) not in templates:
+            templates[id(team)] = TeamTemplate.of(team)
+        return templates[id(team)]
+
+    for i, (team_1, team_2) in enumerate(matchups):
+        battle_state = create_battle_state(compiled(team_1), compiled(team_2))
+        rng = GLOBAL_RNG if seed is None else BattleRng.seeded(seed + i)
+        scheduler.add(BattleCoroutine(battle_state, max_turns=max_turns, rng=rng))
+    return [
+        BattleResult(winner=battle.winner(), turns=battle.turn_counter + 1)
+        for battle in scheduler.run()
+    ]
@@ -0,0 +1,192 @@
+"""
+Multi-process round-robin tournament runner.
+
+Every (team file, policy) pair is an entrant. Each pair of entrants plays
+`games_per_matchup` headless battles, alternating which entrant is Player 1.
+Games are split into shards and fanned out over a ProcessPoolExecutor; each
+battle is seeded from (base seed, matchup, game index) alone, so the merged
+win-rate matrix is identical for identical seeds regardless of worker count or
+shard size.
+
+Usage:
+    python -m src.sim.tournament team_a.txt team_b.txt --policies random max_power \\
+        --games 200 --workers 4 --seed 0
+"""
+
+import argparse
+import hashlib
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.actions.choose_action import Policy
+from src.actions.decision import GreedyDamageProvider
+from src.sim.headless import (
+    DEFAULT_MAX_TURNS,
+    TeamDefinition,
+    max_power_policy,
+    random_policy,
+    run_battle,
+)
+from src.state.pokestate import parse_team_file
+from src.state.pokestate_defs import Player
+from src.state.team_template import TeamTemplate
+
+BUILTIN_POLICIES: Dict[str, Policy] = {
+    "random": random_policy,
+    "max_power": max_power_policy,
+    "greedy_damage": GreedyDamageProvider(),
+}
+
+DEFAULT_SHARD_SIZE = 50
+
+
+@dataclass(frozen=True)
+class Entrant:
+    name: str
+    team: TeamDefinition
+    policy: Policy
+
+
+@dataclass
+class MatchupTally:
+    wins: int = 0  # wins for the first entrant of the matchup
+    losses: int = 0
+    draws: int = 0
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.losses + self.draws
+
+    def merge(self, other: "MatchupTally"):
+        self.wins += other.wins
+        self.losses += other.losses
+        self.draws += other.draws
+
+
+@dataclass
+class TournamentResult:
+    entrants: List[str]
+    tallies: Dict[Tuple[int, int], MatchupTally] = field(default_factory=dict)
+
+    def win_rate(self, i: int, j: int) -> Optional[float]:
+        """Score of entrant i against entrant j (draws count half); None on the diagonal."""
+        if i == j:
+            return None
+        tally = self.tallies[(min(i, j), max(i, j))]
+        if tally.games == 0:
+            return None
+        score = (tally.wins + 0.5 * tally.draws) / tally.games
+        return score if i < j else 1.0 - score
+
+    def matrix(self) -> List[List[Optional[float]]]:
+        n = len(self.entrants)
+        return [[self.win_rate(i, j) for j in range(n)] for i in range(n)]
+
+
+def derive_seed(base_seed: int, matchup: Tuple[int, int], game_index: int) -> int:
+    """Seed for one battle, independent of which worker or shard plays it."""
+    key = f"{base_seed}:{matchup[0]}:{matchup[1]}:{game_index}".encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "little")
+
+
+def _play_shard(
+    shard: Tuple[Tuple[int, int], Entrant, Entrant, int, int, int, int]
+) -> Tuple[Tuple[int, int], MatchupTally]:
+    matchup, entrant_a, entrant_b, first_game, last_game, base_seed, max_turns = shard
+    tally = MatchupTally()
+    # Teams are compiled once per shard; every game clones them.
+    team_a, team_b = TeamTemplate.of(entrant_a.team), TeamTemplate.of(entrant_b.team)
+    for game_index in range(first_game, last_game):
+        # Alternate sides so neither entrant keeps the Player 1 slot.
+        a_is_p1 = game_index % 2 == 0
+        p1, p2 = (entrant_a, entrant_b) if a_is_p1 else (entrant_b, entrant_a)
+        team_1, team_2 = (team_a, team_b) if a_is_p1 else (team_b, team_a)
+        result = run_battle(
+            team_1, team_2, p1.policy, p2.policy,
+            max_turns=max_turns,
+            seed=derive_seed(base_seed, matchup, game_index),
+        )
+        if result.winner is None:
+            tally.draws += 1
+        elif (result.winner == Player.PLAYER_1) == a_is_p1:
+            tally.wins += 1
+        else:
+            tally.losses += 1
+    return matchup, tally
+
+
+def make_entrants(team_files: Sequence[str], policies: Dict[str, Policy]) -> List[Entrant]:
+    entrants = []
+    for path in team_files:
+        team = parse_team_file(path)
+        for policy_name, policy in policies.items():
+            entrants.append(Entrant(f"{path}:{policy_name}", team, policy))
+    return entrants
+
+
+def run_tournament(
+    entrants: Sequence[Entrant],
+    games_per_matchup: int,
+    base_seed: int = 0,
+    max_workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> TournamentResult:
+    """
+    Play a full round robin between `entrants`. With max_workers=1 everything runs
+    in-process; otherwise shards are spread over a process pool. Policies must be
+    module-level callables so they can be pickled to the workers.
+    """
+    shards = []
+    for i, j in itertools.combinations(range(len(entrants)), 2):
+        for first in range(0, games_per_matchup, shard_size):
+            last = min(first + shard_size, games_per_matchup)
+            shards.append(((i, j), entrants[i], entrants[j], first, last, base_seed, max_turns))
+
+    result = TournamentResult([entrant.name for entrant in entrants])
+    for i, j in itertools.combinations(range(len(entrants)), 2):
+        result.tallies[(i, j)] = MatchupTally()
+
+    if max_workers == 1:
+        for matchup, tally in map(_play_shard, shards):
+            result.tallies[matchup].merge(tally)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            for matchup, tally in pool.map(_play_shard, shards):
+                result.tallies[matchup].merge(tally)
+    return result
+
+
+def format_matrix(result: TournamentResult) -> str:
+    lines = []
+    width = max(len(name) for name in result.entrants)
+    for name, row in zip(result.entrants, result.matrix()):
+        cells = ["   -  " if rate is None else f"{rate:6.3f}" for rate in row]
+        lines.append(f"{name:<{width}}  " + " ".join(cells))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Round-robin tournament between team files.")
+    parser.add_argument("team_files", nargs="+")
+    parser.add_argument("--policies", nargs="+", default=["random"], choices=sorted(BUILTIN_POLICIES))
+    parser.add_argument("--games", type=int, default=100, help="games per matchup")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    args = parser.parse_args()
+
+    entrants = make_entrants(
+        args.team_files, {name: BUILTIN_POLICIES[name] for name in args.policies}
+    )
+    start = time.perf_counter()
+    result = run_tournament(
+        entrants, args.games, args.seed, args.workers, args.shard_size
+    )
+    elapsed = time.perf_counter() - start
+    total_games = sum(tally.games for tally in result.tallies.values())
+    print(format_matrix(result))
+    print(f"\n{total_games} games in {elapsed:.2f}s ({total_games / elapsed:.0f} games/sec)")
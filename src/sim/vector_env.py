@@ -0,0 +1,166 @@
+"""
+Subprocess-backed vector environment (requires NumPy).
+
+SubprocVectorEnv steps N BattleEnvs in parallel across worker processes.
+Observations, action masks, actions, rewards and done flags live in shared
+memory: each worker's environments encode straight into their rows of the
+(N, observation_size) and (N, action_size) arrays, so a step only sends a
+one-word command down each pipe.
+
+    envs = SubprocVectorEnv(functools.partial(BattleEnv, team_1, team_2), n=64, workers=8)
+    observations, masks = envs.reset(seed=0)
+    while training:
+        observations, rewards, terminated, truncated, masks = envs.step(actions)
+    envs.close()
+
+`make_env(observation=..., action_mask=...)` builds one environment around the
+given buffers; it runs in the workers, so it must be picklable when the
+multiprocessing start method is not fork. An environment whose episode ends
+is reset in the same step: its reward and done flags describe the finished
+episode, its observation and mask already belong to the next one. With a
+seed, environment i plays episodes seeded seed + i, seed + i + n, ...
+
+The returned arrays are the shared buffers themselves and are overwritten by
+the next step; copy what you need to keep.
+"""
+
+import multiprocessing
+import random
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from src.sim.env import BattleEnv
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required to use the vector env, not to import the package.
+    np = None
+
+_TYPECODES = {"float32": "f", "bool": "b", "int64": "q"}
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for the vector environment")
+
+
+def _shared_arrays(context, n: int, observation_size: int, action_size: int):
+    specs = {
+        "observations": ("float32", (n, observation_size)),
+        "action_masks": ("bool", (n, action_size)),
+        "actions": ("int64", (n,)),
+        "rewards": ("float32", (n,)),
+        "terminated": ("bool", (n,)),
+        "truncated": ("bool", (n,)),
+    }
+    return {
+        name: (context.RawArray(_TYPECODES[dtype], int(np.prod(shape))), dtype, shape)
+        for name, (dtype, shape) in specs.items()
+    }
+
+
+def _views(shared):
+    return {
+        name: np.frombuffer(raw, dtype=dtype).reshape(shape) for name, (raw, dtype, shape) in shared.items()
+    }
+
+
+def _worker(make_env, indices: Sequence[int], n: int, shared, conn):
+    random.seed()  # forked workers would otherwise share the parent's unseeded battle rng
+    arrays = _views(shared)
+    envs: List[BattleEnv] = [
+        make_env(observation=arrays["observations"][i], action_mask=arrays["action_masks"][i])
+        for i in indices
+    ]
+    seeds: List[Optional[int]] = [None] * len(envs)
+    try:
+        while True:
+            command, seed = conn.recv()
+            if command == "close":
+                break
+            if command == "reset":
+                for k, (i, env) in enumerate(zip(indices, envs)):
+                    seeds[k] = None if seed is None else seed + i
+                    env.reset(seeds[k])
+            elif command == "step":
+                rewards, terminated, truncated = arrays["rewards"], arrays["terminated"], arrays["truncated"]
+                for k, (i, env) in enumerate(zip(indices, envs)):
+                    _, rewards[i], terminated[i], truncated[i], _ = env.step(int(arrays["actions"][i]))
+                    if terminated[i] or truncated[i]:
+                        if seeds[k] is not None:
+                            seeds[k] += n
+                        env.reset(seeds[k])
+            conn.send(None)
+    finally:
+        conn.close()
+
+
+class SubprocVectorEnv:
+    """N environments from `make_env`, split over `workers` processes (default: one per CPU, at most n)."""
+
+    def __init__(
+        self,
+        make_env: Callable[..., BattleEnv],
+        n: int,
+        workers: Optional[int] = None,
+        context: Optional[multiprocessing.context.BaseContext] = None,
+    ):
+        _require_numpy()
+        probe = make_env()
+        self.n = n
+        self.observation_size = probe.observation_size
+        self.action_size = probe.action_size
+        context = context or multiprocessing.get_context()
+        workers = max(1, min(n, workers or multiprocessing.cpu_count()))
+        shared = _shared_arrays(context, n, self.observation_size, self.action_size)
+        arrays = _views(shared)
+        self.observations = arrays["observations"]
+        self.action_masks = arrays["action_masks"]
+        self.rewards = arrays["rewards"]
+        self.terminated = arrays["terminated"]
+        self.truncated = arrays["truncated"]
+        self._actions = arrays["actions"]
+        self._pipes = []
+        self._processes = []
+        for indices in np.array_split(np.arange(n), workers):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_worker, args=(make_env, indices.tolist(), n, shared, child), daemon=True
+            )
+            process.start()
+            child.close()
+            self._pipes.append(parent)
+            self._processes.append(process)
+        self.closed = False
+
+    def _command(self, command: str, seed: Optional[int] = None):
+        for pipe in self._pipes:
+            pipe.send((command, seed))
+        for pipe in self._pipes:
+            pipe.recv()
+
+    def reset(self, seed: Optional[int] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Start a new episode in every environment; returns (observations, action_masks)."""
+        self._command("reset", seed)
+        return self.observations, self.action_masks
+
+    def step(self, actions) -> Tuple["np.ndarray", ...]:
+        """One action per environment; returns (observations, rewards, terminated, truncated, action_masks)."""
+        self._actions[:] = actions
+        self._command("step")
+        return self.observations, self.rewards, self.terminated, self.truncated, self.action_masks
+
+    def close(self):
+        if self.closed:
+            return
+        for pipe in self._pipes:
+            pipe.send(("close", None))
+            pipe.close()
+        for process in self._processes:
+            process.join()
+        self.closed = True
+
+    def __enter__(self) -> "SubprocVectorEnv":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
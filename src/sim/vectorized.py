@@ -0,0 +1,575 @@
+"""
+Lockstep vectorized battle simulator (requires NumPy).
+
+VectorBattles plays K independent singles battles at once, one turn per
+step() for every battle still running. State is stored struct-of-arrays:
+
+  hp, status, sleep      (K, 2, T)      per battle, side, team slot
+  boosts                 (K, 2, T, 5)   attack, defense, sp. atk, sp. def, speed
+  pp                     (K, 2, T, M)
+  active                 (K, 2)
+
+and every phase of a turn (decisions, switches, full paralysis and sleep,
+damage, residual poison, faint checks, replacements) is a handful of array
+operations over the battles it concerns, with `done` masking out finished
+ones. Species and move data are compiled once into (2, T[, M]) tables.
+
+    battles = VectorBattles.from_teams(team_1, team_2, k=4096, seed=0)
+    result = battles.run(random_policy, random_policy)
+    result.win_rate(Player.PLAYER_1), result.turns.mean()
+
+Policies see the whole batch: policy(battles, side, legal) gets a (K, M + T)
+mask of legal choices (moves first, then switches by team slot, the order of
+legal_choices) and returns one column index per battle. random_policy and
+max_power_policy mirror their headless counterparts.
+
+The rules follow the reference BattleManager for the supported moves:
+damaging and fixed-damage moves, stat-stage moves, and moves inflicting
+paralysis, sleep or poison; Intimidate, Volt Absorb and Levitate (Drought is
+accepted, weather does not affect damage). Exact speed ties are a coin
+flip, as the reference queue's tiebreaks make them. Like the reference,
+moves do not spend PP. Hazard moves, Pursuit and Flash Fire are rejected.
+Status conditions stay with the Pokemon that has them: a benched Pokemon
+keeps counting down its sleep and taking poison damage, as the reference's
+status listeners do.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from src.events.game_state import GameState
+from src.events.status_listeners import SleepListener
+from src.sim.headless import DEFAULT_MAX_TURNS, TeamDefinition
+from src.state.pokestate import BattleState, Stat, create_default_battle_state
+from src.state.pokestate_defs import Category, Player, Status, Target, Type
+from src.state import type_chart
+from src.state.type_chart import NO_TYPE, type_index
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required to use this module, not to import the package.
+    np = None
+
+MAX_MOVES = 4
+
+# Status codes.
+NONE, PARALYZED, SLEEP, POISONED, FAINTED = range(5)
+STATUS_CODES = {
+    Status.NONE: NONE, Status.PARALYZED: PARALYZED, Status.SLEEP: SLEEP,
+    Status.POISONED: POISONED, Status.FAINTED: FAINTED,
+}
+
+# Stat indices, in Stat order.
+ATTACK, DEFENSE, SPECIAL_ATTACK, SPECIAL_DEFENSE, SPEED = range(5)
+STAT_NAMES = ("attack", "defense", "special_attack", "special_defense", "speed")
+
+# Ability codes.
+NO_ABILITY, INTIMIDATE, VOLT_ABSORB, LEVITATE = range(4)
+ABILITY_CODES = {
+    None: NO_ABILITY, "intimidate": INTIMIDATE, "voltabsorb": VOLT_ABSORB,
+    "levitate": LEVITATE, "drought": NO_ABILITY,
+}
+
+# Move categories and stat-effect targets.
+PHYSICAL, SPECIAL, STATUS_MOVE = Category.PHYSICAL.value, Category.SPECIAL.value, Category.STATUS.value
+NO_EFFECT, ON_SELF, ON_OPPONENT = range(3)
+
+SWITCH_BRACKET = 6
+PARALYZE_CHANCE = 0.3
+PARALYSIS_SPEED_DIVISOR = 4  # Stat.modifier of 0.25, applied before the boost denominator
+POISON_FRACTION = 0.125
+ABSORB_HEAL = 0.25
+MAX_BOOST = 6
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for the vectorized simulator")
+
+
+def _ability_code(ability: Optional[str]) -> int:
+    key = None if ability is None else ability.replace(" ", "").replace("-", "").lower()
+    if key not in ABILITY_CODES:
+        raise ValueError(f"Ability {ability} is not supported by the vectorized simulator")
+    return ABILITY_CODES[key]
+
+
+@dataclass
+class VectorResult:
+    winner: "np.ndarray"  # (K,) 0 = no winner (turn cap or both sides out), 1 / 2 = Player 1 / 2
+    turns: "np.ndarray"  # (K,)
+
+    def win_rate(self, player: Player) -> float:
+        return float((self.winner == player.value).mean())
+
+
+Policy = Callable[["VectorBattles", int, "np.ndarray"], "np.ndarray"]
+
+
+def random_policy(battles: "VectorBattles", side: int, legal: "np.ndarray") -> "np.ndarray":
+    """Uniform over each battle's legal choices."""
+    draws = battles.rng.random(legal.shape)
+    return np.where(legal, draws, -1.0).argmax(axis=1)
+
+
+def max_power_policy(battles: "VectorBattles", side: int, legal: "np.ndarray") -> "np.ndarray":
+    """Legal move with the highest base power (first on ties); first legal switch when forced."""
+    active = battles.active[:, side]
+    power = battles.power[side, active]  # (K, M)
+    score = np.full(legal.shape, -2.0)
+    score[:, MAX_MOVES:] = -1.0
+    score[:, :MAX_MOVES] = power
+    return np.where(legal, score, -3.0).argmax(axis=1)
+
+
+class VectorBattles:
+    """
+    K copies of one singles position, advanced in lockstep. Build with
+    from_teams() (leads not yet sent out) or from a BattleState / GameState
+    taken at a turn's decision point.
+    """
+
+    def __init__(
+        self,
+        battle_state: BattleState,
+        k: int,
+        seed: Optional[int] = None,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        sleep_turns: Optional[List[List[int]]] = None,
+    ):
+        _require_numpy()
+        self.k = k
+        self.rng = np.random.default_rng(seed)
+        self.max_turns = max_turns
+        sides = (battle_state.player_1, battle_state.player_2)
+        if any(len(side.active_mons) != 1 for side in sides):
+            raise ValueError("The vectorized simulator only plays singles")
+        team_size = max(len(side.pk_list) for side in sides)
+        self.team_size = team_size
+        self._compile(sides, team_size)
+
+        shape = (k, 2, team_size)
+        hp = np.zeros((2, team_size), dtype=np.int64)
+        status = np.full((2, team_size), FAINTED, dtype=np.int8)
+        boosts = np.zeros((2, team_size, 5), dtype=np.int8)
+        pp = np.zeros((2, team_size, MAX_MOVES), dtype=np.int16)
+        for s, side in enumerate(sides):
+            for t, mon in enumerate(side.pk_list):
+                if mon.status not in STATUS_CODES:
+                    raise ValueError(f"Status {mon.status} is not supported by the vectorized simulator")
+                hp[s, t] = mon.hp
+                status[s, t] = STATUS_CODES[mon.status]
+                boosts[s, t] = [getattr(mon, f"_{name}")._boost for name in STAT_NAMES]
+                pp[s, t, :len(mon.moves)] = [move.pp for move in mon.moves]
+        self.hp = np.broadcast_to(hp, shape).copy()
+        self.status = np.broadcast_to(status, shape).copy()
+        self.sleep = np.zeros(shape, dtype=np.int8)
+        if sleep_turns is not None:
+            for s, counters in enumerate(sleep_turns):
+                self.sleep[:, s, :len(counters)] = counters
+        self.boosts = np.broadcast_to(boosts, shape + (5,)).copy()
+        self.pp = np.broadcast_to(pp, shape + (MAX_MOVES,)).copy()
+        self.active = np.tile(np.array([side.active_mons[0] for side in sides]), (k, 1))
+
+        self.done = np.zeros(k, dtype=bool)
+        self.winner = np.zeros(k, dtype=np.int8)
+        self.turns = np.full(k, battle_state.turn_count, dtype=np.int32)
+        self._rows = np.arange(k)
+        self._boost_ratios = np.array(Stat.BOOST_RATIOS, dtype=np.int64)  # (numerator, denominator) rows
+        self._check_finished(self._rows)
+
+    @classmethod
+    def from_teams(
+        cls, team_1: TeamDefinition, team_2: TeamDefinition, k: int,
+        seed: Optional[int] = None, max_turns: int = DEFAULT_MAX_TURNS,
+    ) -> "VectorBattles":
+        """K fresh battles between two team definitions (as for run_battle), leads sent out."""
+        names_1, moves_1, abilities_1 = team_1
+        names_2, moves_2, abilities_2 = team_2
+        battle_state = create_default_battle_state(
+            names_1, names_2, moves_1, moves_2, abilities_1, abilities_2
+        )
+        battles = cls(battle_state, k, seed, max_turns)
+        battles.turns[:] = 0
+        # Leads enter one side at a time, each switch-in resetting its own
+        # boosts before its ability resolves, in a random order.
+        first = (battles.rng.random(k) < 0.5).astype(np.int64)
+        rows = battles._rows
+        for side in (first, 1 - first):
+            battles.boosts[rows, side, battles.active[rows, side]] = 0
+            battles._ability_entry(rows, side)
+        return battles
+
+    @classmethod
+    def from_game_state(
+        cls, game_state: GameState, k: int, seed: Optional[int] = None, max_turns: int = DEFAULT_MAX_TURNS,
+    ) -> "VectorBattles":
+        """K copies of a position taken at a decision point, sleep counters included."""
+        battle_state = game_state.battle_state
+        sleep_turns = [[0] * len(side.pk_list) for side in (battle_state.player_1, battle_state.player_2)]
+        for listener in game_state.listener_manager.listeners[BattleState]:
+            if isinstance(listener, SleepListener):
+                sleep_turns[listener.player.value - 1][listener.pokemon_idx] = listener.sleep_turns_remaining
+        return cls(battle_state, k, seed, max_turns, sleep_turns)
+
+    # -- static tables ------------------------------------------------------------
+
+    def _compile(self, sides, team_size: int):
+        shape = (2, team_size)
+        self.present = np.zeros(shape, dtype=bool)
+        self.hp_max = np.ones(shape, dtype=np.int64)
+        self.level = np.zeros(shape, dtype=np.int64)
+        self.type1 = np.full(shape, NO_TYPE, dtype=np.int64)
+        self.type2 = np.full(shape, NO_TYPE, dtype=np.int64)
+        self.base = np.ones(shape + (5,), dtype=np.int64)
+        self.ability = np.zeros(shape, dtype=np.int8)
+
+        move_shape = shape + (MAX_MOVES,)
+        self.has_move = np.zeros(move_shape, dtype=bool)
+        self.power = np.zeros(move_shape, dtype=np.float64)
+        self.category = np.full(move_shape, STATUS_MOVE, dtype=np.int64)
+        self.move_type = np.zeros(move_shape, dtype=np.int64)
+        self.priority = np.zeros(move_shape, dtype=np.int64)
+        self.fixed = np.zeros(move_shape, dtype=bool)
+        self.effect_target = np.zeros(move_shape, dtype=np.int8)
+        self.effect_stat = np.zeros(move_shape, dtype=np.int64)
+        self.effect_change = np.zeros(move_shape, dtype=np.int8)
+        self.inflict = np.zeros(move_shape, dtype=np.int8)
+
+        for s, side in enumerate(sides):
+            for t, mon in enumerate(side.pk_list):
+                self.present[s, t] = t in side.in_play
+                self.hp_max[s, t] = mon.hp_max
+                self.level[s, t] = mon.level
+                self.type1[s, t] = type_index(mon.type1)
+                self.type2[s, t] = type_index(mon.type2)
+                self.base[s, t] = [getattr(mon, f"_{name}")._base for name in STAT_NAMES]
+                self.ability[s, t] = _ability_code(mon.ability)
+                if len(mon.moves) > MAX_MOVES:
+                    raise ValueError(f"{mon.name} knows more than {MAX_MOVES} moves")
+                for m, move in enumerate(mon.moves):
+                    self._compile_move((s, t, m), move.move_info)
+
+    def _compile_move(self, at: Tuple[int, int, int], info):
+        if info.hazard_set or info.name == "Pursuit":
+            raise ValueError(f"Move {info.name} is not supported by the vectorized simulator")
+        if info.category != Category.STATUS and info.target == Target.SELF:
+            raise ValueError(f"Self-targeting damaging move {info.name} is not supported")
+        if len(info.target_effects) > 1:
+            raise ValueError(f"Move {info.name} has more than one effect")
+        self.has_move[at] = True
+        self.category[at] = info.category.value
+        self.move_type[at] = info.type.value
+        self.priority[at] = info.priority
+        self.fixed[at] = info.fixed_damage == "level"
+        if info.category != Category.STATUS and info.power is not None:
+            self.power[at] = info.power
+        for effect in info.target_effects if info.category == Category.STATUS else ():
+            if effect.property == "status":
+                code = STATUS_CODES.get(Status(effect.value.lower()))
+                if code not in (PARALYZED, SLEEP, POISONED):
+                    raise ValueError(f"Status {effect.value} is not supported by the vectorized simulator")
+                self.inflict[at] = code
+            else:
+                self.effect_target[at] = ON_SELF if info.target == Target.SELF else ON_OPPONENT
+                self.effect_stat[at] = STAT_NAMES.index(effect.property)
+                self.effect_change[at] = int(effect.value)
+
+    # -- helpers ----------------------------------------------------------------------
+
+    def _stat(self, rows, side, mon, stat):
+        """Current stat (boosts and paralysis applied), floored the way Stat.current_stat floors it."""
+        ratio = self._boost_ratios[self.boosts[rows, side, mon, stat] + MAX_BOOST]
+        value = self.base[side, mon, stat] * ratio[..., 0]
+        paralyzed = (stat == SPEED) & (self.status[rows, side, mon] == PARALYZED)
+        return np.where(paralyzed, value // PARALYSIS_SPEED_DIVISOR, value) // ratio[..., 1]
+
+    def _boost(self, rows, side, mon, stat, change):
+        current = self.boosts[rows, side, mon, stat]
+        # Stat.boost refuses any change once a stat sits at either limit.
+        blocked = (change == 0) | (np.abs(current) == MAX_BOOST)
+        updated = np.clip(current + change, -MAX_BOOST, MAX_BOOST)
+        self.boosts[rows, side, mon, stat] = np.where(blocked, current, updated)
+
+    def _damage(self, rows, side, mon, amount):
+        hp = np.maximum(self.hp[rows, side, mon] - amount, 0)
+        self.hp[rows, side, mon] = hp
+        fainted = hp == 0
+        self.status[rows[fainted], side[fainted], mon[fainted]] = FAINTED
+        self.boosts[rows[fainted], side[fainted], mon[fainted]] = 0
+
+    def _check_finished(self, rows):
+        out = (self.status[rows] == FAINTED) | ~self.present[None]  # (n, 2, T)
+        out = out.all(axis=2)
+        finished = out.any(axis=1) & ~self.done[rows]
+        rows = rows[finished]
+        out = out[finished]
+        self.done[rows] = True
+        self.winner[rows] = np.where(out[:, 1] & ~out[:, 0], 1, np.where(out[:, 0] & ~out[:, 1], 2, 0))
+
+    def legal(self, side: int, forced: bool = False) -> "np.ndarray":
+        """(K, M + T) legal choices for `side`'s active; `forced`: replacement switches only."""
+        rows = self._rows
+        active = self.active[:, side]
+        usable = self.status[rows, side, active] != FAINTED
+        moves = self.has_move[side, active] & (self.pp[rows, side, active] > 0) & usable[:, None]
+        if forced:
+            moves[:] = False
+        bench = (
+            self.present[side][None]
+            & (self.status[:, side] != FAINTED)
+            & (np.arange(self.team_size)[None] != active[:, None])
+        )
+        return np.concatenate([moves, bench], axis=1)
+
+    def _decide(self, policies, deciding, forced: bool) -> "np.ndarray":
+        """Each side's choice where `deciding` (K, 2) is set and it has one; -1 elsewhere."""
+        choices = np.full((self.k, 2), -1, dtype=np.int64)
+        for side in (0, 1):
+            legal = self.legal(side, forced)
+            can = deciding[:, side] & legal.any(axis=1)
+            if not can.any():
+                continue
+            picked = np.asarray(policies[side](self, side, legal))
+            if not legal[self._rows[can], picked[can]].all():
+                raise ValueError(f"Policy returned an illegal choice for side {side}")
+            choices[can, side] = picked[can]
+        return choices
+
+    def _switch(self, rows, side, new):
+        self.boosts[rows, side, self.active[rows, side]] = 0
+        self.active[rows, side] = new
+
+    def _ability_entry(self, rows, side):
+        """Abilities of `side`'s incoming actives that act on entry (Intimidate)."""
+        mon = self.active[rows, side]
+        intimidating = (self.ability[side, mon] == INTIMIDATE) & (self.status[rows, side, mon] != FAINTED)
+        rows, side = rows[intimidating], side[intimidating]
+        target = self.active[rows, 1 - side]
+        self._boost(rows, 1 - side, target, ATTACK, -1)
+
+    # -- one turn -----------------------------------------------------------------------
+
+    def step(self, policy_1: Policy, policy_2: Policy):
+        """Play one turn (and any faint replacements) of every battle still running."""
+        live = self._rows[~self.done]
+        if live.size == 0:
+            return
+        policies = (policy_1, policy_2)
+        self.turns[live] += 1
+        deciding = np.zeros((self.k, 2), dtype=bool)
+        deciding[live] = True
+        choices = self._decide(policies, deciding, forced=False)
+        self._switch_phase(live, choices)
+        self._move_phase(live, choices)
+        self._residual_phase(self._rows[~self.done])
+        self._replacement_phase(policies, self._rows[~self.done])
+        capped = ~self.done & (self.turns >= self.max_turns)
+        self.done[capped] = True
+
+    def _switch_phase(self, live, choices):
+        switched = []
+        for side in (0, 1):
+            rows = live[choices[live, side] >= MAX_MOVES]
+            self._switch(rows, np.full(rows.size, side), choices[rows, side] - MAX_MOVES)
+            switched.append(rows)
+        # Every switch resolves before the abilities of the incoming Pokemon.
+        for side, rows in enumerate(switched):
+            self._ability_entry(rows, np.full(rows.size, side))
+
+    def _move_phase(self, live, choices):
+        rows = self._rows
+        pending = np.zeros((self.k, 2), dtype=bool)
+        pending[live] = (choices[live] >= 0) & (choices[live] < MAX_MOVES)
+        moving = live[pending[live].any(axis=1)]
+        if moving.size == 0:
+            return
+
+        # Order: higher bracket, then higher speed; exact ties are a coin flip.
+        move = np.clip(choices, 0, MAX_MOVES - 1)
+        bracket = self.priority[[0, 1], self.active, move]
+        speed = self._stat(rows[:, None], np.array([0, 1]), self.active, SPEED)
+        key = bracket * 1e6 + speed
+        tie = key[:, 0] == key[:, 1]
+        first = np.where(tie, self.rng.random(self.k) < 0.5, key[:, 1] > key[:, 0]).astype(np.int64)
+        second = 1 - first
+
+        # Phase hooks, before either move: sleepers whose counter ran out wake
+        # up; actives that are asleep, or fully paralyzed, lose their move.
+        waking = np.zeros((self.k, 2, self.team_size), dtype=bool)
+        waking[moving] = (self.status[moving] == SLEEP) & (self.sleep[moving] <= 0)
+        self.status[waking] = NONE
+        active_status = self.status[rows[:, None], [0, 1], self.active]
+        full_paralysis = (active_status == PARALYZED) & (self.rng.random((self.k, 2)) < PARALYZE_CHANCE)
+        pending &= ~((active_status == SLEEP) | full_paralysis)
+
+        self._payload = np.zeros((self.k, 2), dtype=np.int64)
+        self._inflicted = np.zeros((self.k, 2), dtype=np.int8)
+        self._heal = np.zeros((self.k, 2), dtype=bool)
+        self._pending = pending
+
+        # Each move's damage and status land before the other side moves.
+        self._execute(moving, first[moving], choices)
+        self._land(moving, first[moving])
+        moving = moving[~self.done[moving]]
+        self._execute(moving, second[moving], choices)
+        self._land(moving, second[moving])
+
+        # Volt Absorb heals after every move of the turn.
+        heal_rows, heal_sides = np.nonzero(self._heal)
+        keep = ~self.done[heal_rows]
+        heal_rows, heal_sides = heal_rows[keep], heal_sides[keep]
+        mon = self.active[heal_rows, heal_sides]
+        alive = self.status[heal_rows, heal_sides, mon] != FAINTED
+        heal_rows, heal_sides, mon = heal_rows[alive], heal_sides[alive], mon[alive]
+        amount = (self.hp_max[heal_sides, mon] * ABSORB_HEAL).astype(np.int64)
+        self.hp[heal_rows, heal_sides, mon] = np.minimum(
+            self.hp[heal_rows, heal_sides, mon] + amount, self.hp_max[heal_sides, mon]
+        )
+
+    def _execute(self, rows, side, choices):
+        """`side`'s pending move in each of `rows`: stat changes now, damage and status queued."""
+        go = self._pending[rows, side]
+        rows, side = rows[go], side[go]
+        self._pending[rows, side] = False
+        attacker = self.active[rows, side]
+        alive = self.status[rows, side, attacker] != FAINTED
+        rows, side, attacker = rows[alive], side[alive], attacker[alive]
+        opponent = 1 - side
+        target = self.active[rows, opponent]
+        move = choices[rows, side]
+        category = self.category[side, attacker, move]
+        move_type = self.move_type[side, attacker, move]
+
+        effectiveness = type_chart.dual_effectiveness_array(
+            move_type, self.type1[opponent, target], self.type2[opponent, target]
+        )
+        physical = category == PHYSICAL
+        offense = self._stat(rows, side, attacker, np.where(physical, ATTACK, SPECIAL_ATTACK))
+        defense = self._stat(rows, opponent, target, np.where(physical, DEFENSE, SPECIAL_DEFENSE))
+        stab = np.where(
+            (move_type == self.type1[side, attacker]) | (move_type == self.type2[side, attacker]), 1.5, 1.0
+        )
+        base = self.power[side, attacker, move] * (offense / defense) * effectiveness * stab
+        rolled = np.floor(base * self.rng.uniform(0.85, 1.0, rows.size)).astype(np.int64)
+        damage = np.where(self.fixed[side, attacker, move], self.level[side, attacker], rolled)
+        damage = np.where((effectiveness == 0) | (category == STATUS_MOVE), 0, damage)
+
+        ability = self.ability[opponent, target]
+        absorbed = (damage > 0) & (
+            ((ability == VOLT_ABSORB) & (move_type == Type.ELECTRIC.value))
+            | ((ability == LEVITATE) & (move_type == Type.GROUND.value))
+        )
+        self._heal[rows[absorbed], opponent[absorbed]] |= ability[absorbed] == VOLT_ABSORB
+        self._payload[rows, side] = np.where(absorbed, 0, damage)
+        self._inflicted[rows, side] = self.inflict[side, attacker, move]
+
+        effect = self.effect_target[side, attacker, move]
+        on_self = effect == ON_SELF
+        hit = effect != NO_EFFECT
+        self._boost(
+            rows[hit],
+            np.where(on_self, side, opponent)[hit],
+            np.where(on_self, attacker, target)[hit],
+            self.effect_stat[side, attacker, move][hit],
+            self.effect_change[side, attacker, move][hit],
+        )
+
+    def _land(self, rows, side):
+        """Apply `side`'s queued damage and status to the opposing active, then check for a finish."""
+        opponent = 1 - side
+        target = self.active[rows, opponent]
+        up = self.status[rows, opponent, target] != FAINTED
+
+        damage = self._payload[rows, side]
+        hit = up & (damage > 0)
+        self._damage(rows[hit], opponent[hit], target[hit], damage[hit])
+
+        code = self._inflicted[rows, side]
+        takes = up & (code != NONE) & (self.status[rows, opponent, target] == NONE)
+        rows_s, opp_s, target_s, code_s = rows[takes], opponent[takes], target[takes], code[takes]
+        self.status[rows_s, opp_s, target_s] = code_s
+        asleep = code_s == SLEEP
+        self.sleep[rows_s[asleep], opp_s[asleep], target_s[asleep]] = self.rng.integers(1, 4, asleep.sum())
+        # A status landing mid-phase acts on the target's still-pending move at once.
+        loses_move = asleep | ((code_s == PARALYZED) & (self.rng.random(code_s.size) < PARALYZE_CHANCE))
+        self._pending[rows_s[loses_move], opp_s[loses_move]] = False
+
+        self._payload[rows, side] = 0
+        self._inflicted[rows, side] = NONE
+        self._check_finished(rows)
+
+    def _residual_phase(self, rows):
+        if rows.size == 0:
+            return
+        status = self.status[rows]
+        poisoned = status == POISONED
+        loss = np.maximum(1, (self.hp_max * POISON_FRACTION).astype(np.int64))
+        hp = np.where(poisoned, np.maximum(self.hp[rows] - loss[None], 0), self.hp[rows])
+        fainted = poisoned & (hp == 0)
+        self.hp[rows] = hp
+        self.status[rows] = np.where(fainted, FAINTED, status)
+        boosts = self.boosts[rows]
+        boosts[fainted] = 0
+        self.boosts[rows] = boosts
+        self.sleep[rows] -= (self.status[rows] == SLEEP).astype(np.int8)
+        self._check_finished(rows)
+
+    def _replacement_phase(self, policies, rows):
+        deciding = np.zeros((self.k, 2), dtype=bool)
+        deciding[rows] = self.status[rows[:, None], [0, 1], self.active[rows]] == FAINTED
+        rows = rows[deciding[rows].any(axis=1)]
+        if rows.size == 0:
+            return
+        choices = self._decide(policies, deciding, forced=True)
+        # Replacements resolve one side at a time (faster fainted Pokemon first),
+        # each switch followed by the incoming Pokemon's ability.
+        speed = self._stat(rows[:, None], np.array([0, 1]), self.active[rows], SPEED)
+        tie = speed[:, 0] == speed[:, 1]
+        first = np.where(tie, self.rng.random(rows.size) < 0.5, speed[:, 1] > speed[:, 0]).astype(np.int64)
+        for side in (first, 1 - first):
+            go = choices[rows, side] >= MAX_MOVES
+            rows_now, side_now = rows[go], side[go]
+            self._switch(rows_now, side_now, choices[rows_now, side_now] - MAX_MOVES)
+            self._ability_entry(rows_now, side_now)
+
+    def run(self, policy_1: Policy = random_policy, policy_2: Policy = random_policy) -> VectorResult:
+        """Step until every battle has finished or hit the turn cap."""
+        while not self.done.all():
+            self.step(policy_1, policy_2)
+        return VectorResult(self.winner.copy(), self.turns.copy())
+
+
+if __name__ == "__main__":
+    from src.sim.headless import run_battle
+
+    team_1: TeamDefinition = (
+        ["Pikachu", "Bulbasaur", "Charmander"],
+        [
+            ["Thunderbolt", "Quick Attack", "Thunder Wave", "Seismic Toss"],
+            ["Vine Whip", "Tackle", "Growth", "Sleep Powder"],
+            ["Ember", "Scratch", "Growl", "Leer"],
+        ],
+        [None, None, None],
+    )
+    team_2: TeamDefinition = (
+        ["Squirtle", "Pidgey", "Rattata"],
+        [
+            ["Water Gun", "Tackle", "Bubble", "Withdraw"],
+            ["Quick Attack", "Gust", "Sand Attack"],
+            ["Quick Attack", "Tackle", "Tail Whip"],
+        ],
+        [None, None, None],
+    )
+    k = 20000
+    start = time.perf_counter()
+    result = VectorBattles.from_teams(team_1, team_2, k, seed=0).run()
+    elapsed = time.perf_counter() - start
+    print(f"{k} vectorized battles in {elapsed:.2f}s ({k / elapsed:.0f} battles/sec)")
+    print(f"P1 wins: {result.win_rate(Player.PLAYER_1):.3f}  mean turns: {result.turns.mean():.2f}")
+    n = 500
+    reference = [run_battle(team_1, team_2, seed=i) for i in range(n)]
+    p1 = sum(r.winner == Player.PLAYER_1 for r in reference) / n
+    turns = sum(r.turns for r in reference) / n
+    print(f"reference ({n} battles): P1 wins: {p1:.3f}  mean turns: {turns:.2f}")
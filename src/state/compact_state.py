@@ -0,0 +1,222 @@
+"""
+Array-backed compact battle state for search.
+
+All mutable battle data for both sides (HP, status, boosts, stat modifiers,
+PP, volatile flags, what the opponent has seen, hazards, active indices,
+weather, turn) lives in one
+fixed-layout `array('i')`, so a search branch is a single buffer copy:
+
+    compact = CompactBattleState.from_state(battle_state, field_state)
+    snap = compact.snapshot()      # memcpy
+    ...mutate...
+    compact.restore(snap)          # memcpy back
+    compact.apply_to(battle_state, field_state)
+
+Static data (species, types, base stats, hp_max, move identities) is not
+stored; apply_to() writes the buffer back into dataclasses of the same shape
+the buffer was built from. Listener-held state (sleep counters, toxic counter)
+is not part of BattleState and is not captured.
+"""
+
+from array import array
+from typing import Optional
+
+from src.state.field import FieldState, HAZARD_DEFS
+from src.state.pokestate import BattleState, PokemonState
+from src.state.pokestate_defs import Player, Status
+
+MAX_TEAM = 6
+MAX_MOVES = 4
+
+STATUSES = list(Status)
+STATUS_CODE = {status: code for code, status in enumerate(STATUSES)}
+HAZARDS = list(HAZARD_DEFS)
+WEATHERS = [None, "sun", "rain", "sand", "hail"]
+STATS = ["_attack", "_defense", "_special_attack", "_special_defense", "_speed"]
+VOLATILES = [
+    "active", "trapped", "two_turn_move", "confused", "substitute", "reflect", "light_screen",
+]
+# What the opponent has seen of a Pokemon (the observation encoder's hidden information).
+SEEN = ["known", "revealed"]
+MODIFIER_SCALE = 1000  # stat modifiers are stored in thousandths
+
+# Per-Pokemon field offsets.
+HP = 0
+STATUS = 1
+SLEEP_TURNS = 2
+BOOSTS = 3
+MODIFIERS = BOOSTS + len(STATS)
+PP = MODIFIERS + len(STATS)
+DISABLED = PP + MAX_MOVES  # bitmask over move slots
+FLAGS = DISABLED + 1  # bitmask over VOLATILES
+SEEN_FLAGS = FLAGS + 1  # bitmask over SEEN
+KNOWN_MOVES = SEEN_FLAGS + 1  # bitmask over move slots
+POKEMON_STRIDE = KNOWN_MOVES + 1
+
+# Per-side field offsets.
+ACTIVE = 0
+HAZARD_LAYERS = 1
+TEAM = HAZARD_LAYERS + len(HAZARDS)
+SIDE_STRIDE = TEAM + MAX_TEAM * POKEMON_STRIDE
+
+# Battle-wide field offsets.
+TURN = 0
+WEATHER = 1
+SIDES = 2
+SIZE = SIDES + 2 * SIDE_STRIDE
+
+
+def _side_offset(player: Player) -> int:
+    return SIDES + (0 if player == Player.PLAYER_1 else SIDE_STRIDE)
+
+
+def pokemon_offset(player: Player, idx: int) -> int:
+    return _side_offset(player) + TEAM + idx * POKEMON_STRIDE
+
+
+class CompactBattleState:
+    __slots__ = ("buffer",)
+
+    def __init__(self, buffer: Optional[array] = None):
+        self.buffer = buffer if buffer is not None else array("i", [0]) * SIZE
+
+    # -- snapshot / restore -------------------------------------------------
+
+    def snapshot(self) -> array:
+        return self.buffer[:]
+
+    def restore(self, snapshot: array):
+        self.buffer[:] = snapshot
+
+    def copy(self) -> "CompactBattleState":
+        return CompactBattleState(self.buffer[:])
+
+    # -- accessors ----------------------------------------------------------
+
+    def hp(self, player: Player, idx: int) -> int:
+        return self.buffer[pokemon_offset(player, idx) + HP]
+
+    def set_hp(self, player: Player, idx: int, value: int):
+        self.buffer[pokemon_offset(player, idx) + HP] = value
+
+    def status(self, player: Player, idx: int) -> Status:
+        return STATUSES[self.buffer[pokemon_offset(player, idx) + STATUS]]
+
+    def set_status(self, player: Player, idx: int, status: Status):
+        self.buffer[pokemon_offset(player, idx) + STATUS] = STATUS_CODE[status]
+
+    def boost(self, player: Player, idx: int, stat: str) -> int:
+        return self.buffer[pokemon_offset(player, idx) + BOOSTS + STATS.index(f"_{stat}")]
+
+    def pp(self, player: Player, idx: int, move_idx: int) -> int:
+        return self.buffer[pokemon_offset(player, idx) + PP + move_idx]
+
+    def active(self, player: Player) -> int:
+        return self.buffer[_side_offset(player) + ACTIVE]
+
+    def hazard_layers(self, player: Player, hazard: str) -> int:
+        return self.buffer[_side_offset(player) + HAZARD_LAYERS + HAZARDS.index(hazard)]
+
+    @property
+    def turn(self) -> int:
+        return self.buffer[TURN]
+
+    # -- conversion ---------------------------------------------------------
+
+    @classmethod
+    def from_state(
+        cls, battle_state: BattleState, field_state: Optional[FieldState] = None
+    ) -> "CompactBattleState":
+        compact = cls()
+        buf = compact.buffer
+        buf[TURN] = battle_state.turn_count
+        for player in (Player.PLAYER_1, Player.PLAYER_2):
+            player_state = battle_state.get_player(player)
+            if len(player_state.pk_list) > MAX_TEAM:
+                raise ValueError(f"Team of {len(player_state.pk_list)} exceeds {MAX_TEAM}")
+            side = _side_offset(player)
+            buf[side + ACTIVE] = player_state.active_mons[0]
+            for idx, mon in enumerate(player_state.pk_list):
+                _write_pokemon(buf, pokemon_offset(player, idx), mon)
+            if field_state is not None:
+                hazards = field_state.get_side(player).hazards
+                for h, name in enumerate(HAZARDS):
+                    buf[side + HAZARD_LAYERS + h] = hazards.get(name, 0)
+        if field_state is not None:
+            buf[WEATHER] = WEATHERS.index(field_state.weather)
+        return compact
+
+    def apply_to(self, battle_state: BattleState, field_state: Optional[FieldState] = None):
+        """Write the buffer back into dataclasses shaped like the ones it was built from."""
+        buf = self.buffer
+        battle_state.turn_count = buf[TURN]
+        for player in (Player.PLAYER_1, Player.PLAYER_2):
+            player_state = battle_state.get_player(player)
+            side = _side_offset(player)
+            player_state.active_mons[0] = buf[side + ACTIVE]
+            for idx, mon in enumerate(player_state.pk_list):
+                _read_pokemon(buf, pokemon_offset(player, idx), mon)
+            player_state.refresh_bench_mask()  # status and active index were written directly
+            if field_state is not None:
+                hazards = field_state.get_side(player).hazards
+                for h, name in enumerate(HAZARDS):
+                    layers = buf[side + HAZARD_LAYERS + h]
+                    if layers:
+                        hazards[name] = layers
+                    else:
+                        hazards.pop(name, None)
+        if field_state is not None:
+            field_state.weather = WEATHERS[buf[WEATHER]]
+
+
+def _write_pokemon(buf: array, base: int, mon: PokemonState):
+    if len(mon.moves) > MAX_MOVES:
+        raise ValueError(f"{mon.name} knows {len(mon.moves)} moves, max is {MAX_MOVES}")
+    buf[base + HP] = mon._hp
+    buf[base + STATUS] = STATUS_CODE[mon._status]
+    buf[base + SLEEP_TURNS] = mon.sleep_turns
+    for s, stat_name in enumerate(STATS):
+        stat = getattr(mon, stat_name)
+        buf[base + BOOSTS + s] = stat._boost
+        buf[base + MODIFIERS + s] = round(stat.modifier * MODIFIER_SCALE)
+    disabled = known_moves = 0
+    for m, move in enumerate(mon.moves):
+        buf[base + PP + m] = move.pp
+        if move.disabled:
+            disabled |= 1 << m
+        if move.known:
+            known_moves |= 1 << m
+    buf[base + DISABLED] = disabled
+    buf[base + KNOWN_MOVES] = known_moves
+    flags = 0
+    for f, name in enumerate(VOLATILES):
+        if getattr(mon, name):
+            flags |= 1 << f
+    buf[base + FLAGS] = flags
+    seen = 0
+    for f, name in enumerate(SEEN):
+        if getattr(mon, name):
+            seen |= 1 << f
+    buf[base + SEEN_FLAGS] = seen
+
+
+def _read_pokemon(buf: array, base: int, mon: PokemonState):
+    mon._hp = buf[base + HP]
+    mon._status = STATUSES[buf[base + STATUS]]
+    mon.sleep_turns = buf[base + SLEEP_TURNS]
+    for s, stat_name in enumerate(STATS):
+        stat = getattr(mon, stat_name)
+        stat._boost = buf[base + BOOSTS + s]
+        stat.modifier = buf[base + MODIFIERS + s] / MODIFIER_SCALE
+    disabled = buf[base + DISABLED]
+    known_moves = buf[base + KNOWN_MOVES]
+    for m, move in enumerate(mon.moves):
+        move.pp = buf[base + PP + m]
+        move.disabled = bool(disabled & (1 << m))
+        move.known = bool(known_moves & (1 << m))
+    flags = buf[base + FLAGS]
+    for f, name in enumerate(VOLATILES):
+        setattr(mon, name, bool(flags & (1 << f)))
+    seen = buf[base + SEEN_FLAGS]
+    for f, name in enumerate(SEEN):
+        setattr(mon, name, bool(seen & (1 << f)))
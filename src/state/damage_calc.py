@@ -0,0 +1,196 @@
+"""
+Exact damage distributions.
+
+The engine rolls damage as `int(base * r)` with r uniform on [0.85, 1.0]
+(BattleRng.roll_damage). Since the roll is continuous, damage d has
+probability |[d/base, (d+1)/base) ∩ [0.85, 1.0]| / 0.15, so the whole
+distribution is known exactly without sampling:
+
+    dist = damage_distribution(move, attacker, defender)
+    dist.expected, dist.ko_chance(defender.hp)
+
+batch_damage_distribution() evaluates every move of one Pokemon against every
+member of an opposing PlayerState in one NumPy call; NumPy is imported by that
+first call, not by this module.
+
+STAB, type effectiveness, fixed damage and boosted stats follow the same rules
+as MoveAction.calculate_move_damage, which shares the helpers below.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List
+
+from src.state.pokestate import PlayerState, PokemonState
+from src.state.pokestate_defs import Category, Move, Type
+from src.state.type_chart import dual_effectiveness, dual_effectiveness_array, type_index
+
+ROLL_MIN = 0.85
+ROLL_MAX = 1.0
+ROLL_SPAN = ROLL_MAX - ROLL_MIN
+STAB = 1.5
+
+
+def stab_multiplier(move_type: Type, mon: PokemonState) -> float:
+    return STAB if move_type == mon.type1 or move_type == mon.type2 else 1.0
+
+
+def fixed_damage(move: Move, src_mon: PokemonState, target_mon: PokemonState) -> int:
+    """Damage of a fixed-damage move (ignores stats and the roll, respects immunities)."""
+    if dual_effectiveness(move.type, target_mon.type1, target_mon.type2) == 0:
+        return 0
+    if move.fixed_damage == "level":
+        return src_mon.level
+    return 0
+
+
+def pre_roll_damage(move: Move, src_mon: PokemonState, target_mon: PokemonState) -> float:
+    """Damage before the 85-100% roll; 0 for status moves and immunities."""
+    if move.power is None or move.category == Category.STATUS:
+        return 0.0
+    return (
+        move.power
+        * (src_mon.get_offensive_stat(move.category) / target_mon.get_defensive_stat(move.category))
+        * dual_effectiveness(move.type, target_mon.type1, target_mon.type2)
+        * stab_multiplier(move.type, src_mon)
+    )
+
+
+@dataclass
+class DamageDistribution:
+    damages: List[int]  # ascending, each with non-zero probability
+    probabilities: List[float]
+
+    @property
+    def expected(self) -> float:
+        return sum(d * p for d, p in zip(self.damages, self.probabilities))
+
+    @property
+    def min(self) -> int:
+        return self.damages[0]
+
+    @property
+    def max(self) -> int:
+        return self.damages[-1]
+
+    def ko_chance(self, hp: int) -> float:
+        """Probability that one hit does at least `hp` damage."""
+        return sum(p for d, p in zip(self.damages, self.probabilities) if d >= hp)
+
+    @staticmethod
+    def certain(damage: int) -> "DamageDistribution":
+        return DamageDistribution([damage], [1.0])
+
+
+def roll_distribution(base_damage: float) -> DamageDistribution:
+    """Distribution of int(base_damage * r) for r uniform on [0.85, 1.0]."""
+    if base_damage <= 0:
+        return DamageDistribution.certain(0)
+    damages, probabilities = [], []
+    for d in range(math.floor(base_damage * ROLL_MIN), math.floor(base_damage * ROLL_MAX) + 1):
+        low = max(d / base_damage, ROLL_MIN)
+        high = min((d + 1) / base_damage, ROLL_MAX)
+        if high > low:
+            damages.append(d)
+            probabilities.append((high - low) / ROLL_SPAN)
+    return DamageDistribution(damages, probabilities)
+
+
+def damage_distribution(
+    move: Move, src_mon: PokemonState, target_mon: PokemonState
+) -> DamageDistribution:
+    if move.fixed_damage is not None:
+        return DamageDistribution.certain(fixed_damage(move, src_mon, target_mon))
+    return roll_distribution(pre_roll_damage(move, src_mon, target_mon))
+
+
+# -- batched (NumPy) ---------------------------------------------------------
+
+
+@dataclass
+class BatchDamageDistribution:
+    """
+    Distributions for M moves x T targets, padded to a common width W.
+    damages[m, t, w] has probability probabilities[m, t, w]; padding has probability 0.
+    """
+
+    damages: "np.ndarray"  # (M, T, W) int64
+    probabilities: "np.ndarray"  # (M, T, W) float64
+
+    @property
+    def expected(self) -> "np.ndarray":
+        return (self.damages * self.probabilities).sum(axis=-1)
+
+    def ko_chance(self, hp) -> "np.ndarray":
+        """P(damage >= hp); `hp` broadcasts against (M, T), e.g. one value per target."""
+        import numpy as np
+
+        hp = np.asarray(hp)[..., None]
+        return (self.probabilities * (self.damages >= hp)).sum(axis=-1)
+
+    def distribution(self, move_idx: int, target_idx: int) -> DamageDistribution:
+        probs = self.probabilities[move_idx, target_idx]
+        keep = probs > 0
+        return DamageDistribution(
+            self.damages[move_idx, target_idx][keep].tolist(), probs[keep].tolist()
+        )
+
+
+def _stat_for(mon: PokemonState, category: Category, offensive: bool) -> float:
+    if category == Category.STATUS:
+        return 1.0
+    return mon.get_offensive_stat(category) if offensive else mon.get_defensive_stat(category)
+
+
+def batch_damage_distribution(
+    src_mon: PokemonState, targets: PlayerState
+) -> BatchDamageDistribution:
+    """Exact distributions for every move of `src_mon` against every Pokemon in `targets`."""
+    import numpy as np
+
+    move_infos = [move.move_info for move in src_mon.moves]
+    defenders = targets.pk_list
+
+    power = np.array(
+        [m.power if m.power is not None and m.category != Category.STATUS else 0 for m in move_infos],
+        dtype=np.float64,
+    )
+    offense = np.array([_stat_for(src_mon, m.category, True) for m in move_infos], dtype=np.float64)
+    defense = np.array(
+        [[_stat_for(t, m.category, False) for t in defenders] for m in move_infos], dtype=np.float64
+    )
+    stab = np.array([stab_multiplier(m.type, src_mon) for m in move_infos])
+    effectiveness = dual_effectiveness_array(
+        np.array([m.type.value for m in move_infos])[:, None],
+        np.array([type_index(t.type1) for t in defenders])[None, :],
+        np.array([type_index(t.type2) for t in defenders])[None, :],
+    )
+    # Same operation order as pre_roll_damage, so both forms agree bit for bit.
+    base = power[:, None] * (offense[:, None] / defense) * effectiveness * stab[:, None]  # (M, T)
+
+    # Fixed-damage moves: one certain outcome, folded in below as a zero-width roll.
+    is_fixed = np.array([m.fixed_damage is not None for m in move_infos])
+    fixed = np.array(
+        [[fixed_damage(m, src_mon, t) if m.fixed_damage is not None else 0 for t in defenders]
+         for m in move_infos],
+        dtype=np.int64,
+    ).reshape(base.shape)
+    certain = is_fixed[:, None] | (base <= 0)
+
+    low = np.floor(base * ROLL_MIN).astype(np.int64)
+    high = np.floor(base * ROLL_MAX).astype(np.int64)
+    low = np.where(certain, np.where(is_fixed[:, None], fixed, 0), low)
+    high = np.where(certain, low, high)
+    width = int((high - low).max(initial=0)) + 1
+
+    damages = low[..., None] + np.arange(width)  # (M, T, W)
+    safe_base = np.where(certain, 1.0, base)[..., None]
+    interval = (
+        np.minimum((damages + 1) / safe_base, ROLL_MAX)
+        - np.maximum(damages / safe_base, ROLL_MIN)
+    )
+    probabilities = np.clip(interval, 0.0, None) / ROLL_SPAN
+    probabilities = np.where(
+        certain[..., None], (np.arange(width) == 0).astype(np.float64), probabilities
+    )
+    return BatchDamageDistribution(damages, probabilities)
@@ -0,0 +1,69 @@
+"""
+Bitmask legal-action generation.
+
+Each PokemonState keeps `move_mask` (bit i set while moves[i] has PP and is
+not disabled) and each PlayerState keeps `bench_mask` (bit i set while
+pk_list[i] is in play, not fainted and not active). Both are updated in place
+when PP, disabled, faint or switch state changes, so asking "what can this
+slot do" is two attribute reads and one table lookup:
+
+    choices = legal_choices(player_state, slot)   # shared tuple of Choice
+
+CHOICE_TABLE[bench_mask][move_mask] holds the ready-made tuples for every
+team of up to MAX_BENCH Pokemon with up to MAX_MOVES moves each; anything
+larger falls back to building the tuple.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Tuple
+
+MAX_MOVES = 4
+MAX_BENCH = 6
+
+
+class ChoiceKind(Enum):
+    MOVE = 0
+    SWITCH = 1
+
+
+@dataclass(frozen=True)
+class Choice:
+    """A single decision for one active slot: use move `index` or switch to pk_list[`index`]."""
+
+    kind: ChoiceKind
+    index: int
+
+
+def _indices(mask: int) -> Tuple[int, ...]:
+    return tuple(i for i in range(mask.bit_length()) if mask >> i & 1)
+
+
+BIT_INDICES = [_indices(mask) for mask in range(1 << MAX_BENCH)]
+
+
+def bit_indices(mask: int) -> Tuple[int, ...]:
+    """Set bit positions of `mask`, ascending."""
+    return BIT_INDICES[mask] if mask < len(BIT_INDICES) else _indices(mask)
+
+
+def _choices(bench_mask: int, move_mask: int) -> Tuple[Choice, ...]:
+    return tuple(Choice(ChoiceKind.MOVE, i) for i in bit_indices(move_mask)) + tuple(
+        Choice(ChoiceKind.SWITCH, i) for i in bit_indices(bench_mask)
+    )
+
+
+CHOICE_TABLE = [
+    [_choices(bench_mask, move_mask) for move_mask in range(1 << MAX_MOVES)]
+    for bench_mask in range(1 << MAX_BENCH)
+]
+
+
+def legal_choices(player_state: "PlayerState", slot: int = 0) -> Tuple[Choice, ...]:
+    """Every move and switch the given active slot may currently choose (moves first)."""
+    active_mon = player_state.get_active_mon(slot)
+    move_mask = 0 if active_mon.fainted else active_mon.move_mask
+    bench_mask = player_state.bench_mask
+    if bench_mask >> MAX_BENCH or move_mask >> MAX_MOVES:
+        return _choices(bench_mask, move_mask)
+    return CHOICE_TABLE[bench_mask][move_mask]
@@ -1,11 +1,13 @@
 from dataclasses import dataclass, field
 import enum
-from typing import Optional, List, Tuple
+from typing import Any, Optional, List, Tuple
 
 from src.dex.stat_calculator import calculate_hp, calculate_other_stat
 import src.dex.moves as moves
 import src.dex.gen1_dex as dex
+from src.state.legal_actions import bit_indices
 from src.state.pokestate_defs import Player, Move, PokemonId, Status, Type, Category
+from src.events.battle_log import log
 
 
 @dataclass
@@ -16,6 +18,16 @@ class MoveState:
     pp_max: int
     disabled: bool
     move_info: Optional[Move] = field(default=None, repr=False)
+    move_id: Optional[int] = field(default=None, repr=False)  # index into moves.ALL_MOVES
+    # Pokemon that knows this move and the move's position, for its move_mask.
+    _owner: Optional["PokemonState"] = field(default=None, repr=False, compare=False)
+    _slot: int = field(default=0, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if (name == "pp" or name == "disabled") and self._owner is not None:
+            self._owner._hash = None
+            self._owner._refresh_move_bit(self._slot)
 
     @property
     def available(self):
@@ -30,14 +42,17 @@ class MoveState:
             move = moves.get_move_by_name(move_arg)
             if move is None:
                 raise ValueError(f"Move '{move_arg}' not found")
-        return MoveState(
-            known=False,
-            name=move.name,
-            pp=move.pp,
-            pp_max=move.pp,
-            disabled=False,
-            move_info=move,
+        return MoveState._new(move, moves.MOVE_INDEX.id_of(move.name))
+
+    @staticmethod
+    def _new(move: Move, move_id: Optional[int]) -> "MoveState":
+        # Fresh, full-PP state, filled in directly: nothing is hashed or masked yet.
+        state = MoveState.__new__(MoveState)
+        state.__dict__.update(
+            known=False, name=move.name, pp=move.pp, pp_max=move.pp, disabled=False,
+            move_info=move, move_id=move_id, _owner=None, _slot=0,
         )
+        return state
 
 
 @dataclass
@@ -53,13 +68,29 @@ class Stat:
 
     BOOST_UNIT = 0.5
     MAX_BOOSTS = 6
+    # Exact (numerator, denominator) of the boost multiplier for boosts -6..+6:
+    # (2 + b) / 2 when raised, 2 / (2 - b) when lowered (BOOST_UNIT per stage).
+    BOOST_RATIOS = tuple((2 + b, 2) if b >= 0 else (2, 2 - b) for b in range(-6, 7))
+
+    # Pokemon whose cached position hash a boost change invalidates.
+    _owner: Optional["PokemonState"] = field(default=None, repr=False, compare=False)
+    # current_stat, cached until _base, _boost or modifier changes.
+    _current: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == "_boost" or name == "modifier" or name == "_base":
+            self.__dict__["_current"] = None
+            if name == "_boost" and self._owner is not None:
+                self._owner._hash = None
 
     @property
     def current_stat(self) -> int:
-        if self._boost < 0:
-            return int(self._base * (1 / (1 + abs(self._boost) * self.BOOST_UNIT)) * self.modifier)
-        else:
-            return int(self._base * (1 + self._boost * self.BOOST_UNIT) * self.modifier)
+        current = self._current
+        if current is None:
+            numerator, denominator = self.BOOST_RATIOS[self._boost + self.MAX_BOOSTS]
+            current = self.__dict__["_current"] = int(self._base * numerator * self.modifier) // denominator
+        return current
 
     @property
     def base(self) -> int:
@@ -84,12 +115,78 @@ class Stat:
         return True
 
     @staticmethod
-    def from_value(value: int):
-        stat = Stat()
-        stat.base = value
+    def from_value(value: int, owner: Optional["PokemonState"] = None):
+        if value < 0:
+            raise ValueError("Base stat cannot be negative")
+        stat = Stat.__new__(Stat)
+        stat.__dict__.update(_base=value, _boost=0, modifier=1.0, _owner=owner, _current=value)
         return stat
 
 
+class StatAttribute:
+    """
+    A PokemonState's effective stat, backed by its `_<name>` Stat. Reads give
+    the current (boosted, modified) value. Assigning "+N" / "-N" boosts by N
+    stages, logging when the stat is already at its limit; any other value
+    resets the boost.
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.stat_name = "_" + name
+
+    def __get__(self, mon: Optional["PokemonState"], owner=None):
+        if mon is None:
+            return self
+        return mon.__dict__[self.stat_name].current_stat
+
+    def __set__(self, mon: "PokemonState", value: str):
+        stat = mon.__dict__[self.stat_name]
+        if value.startswith(("+", "-")):
+            change = int(value)
+            if value.startswith("-"):
+                change = -abs(change)
+            if change == 0:
+                return
+            if not stat.boost(change):
+                log(
+                    "effect", "%s's %s won't go %s!",
+                    mon.name, self.name, "higher" if change > 0 else "lower",
+                )
+        else:
+            # Reset stats
+            stat._boost = 0
+
+
+# (species, type1, type2, ability, hp_max, stats) per (name, level), shared by every PokemonState built from it.
+_SPECIES_PROFILES: dict = {}
+
+
+def _species_profile(name: str, level: int) -> tuple:
+    try:
+        return _SPECIES_PROFILES[name, level]
+    except KeyError:
+        species_id = dex.SPECIES_INDEX.id_of(name)
+        if species_id is None:
+            raise ValueError(f"Unknown species: {name}")
+        pokemon = dex.SPECIES_INDEX.by_id(species_id)
+        stats = tuple(
+            calculate_other_stat(base, level)
+            for base in (pokemon.attack, pokemon.defense, pokemon.special_attack,
+                         pokemon.special_defense, pokemon.speed)
+        )
+        profile = _SPECIES_PROFILES[name, level] = (
+            pokemon.species, pokemon.type1, pokemon.type2, pokemon.ability,
+            calculate_hp(pokemon.hp, level), stats, species_id,
+        )
+        return profile
+
+
+# PokemonState fields that feed its position hash (boosts and PP notify it separately).
+_HASHED_FIELDS = frozenset({"_hp", "hp_max", "_status", "_attack", "_defense", "_special_attack",
+                            "_special_defense", "_speed", "moves"})
+
+
 @dataclass
 class PokemonState:
     active: bool = False  # Whether the pokemon is currently active in battle
@@ -100,7 +197,7 @@ class PokemonState:
     in_play: bool = False  # True if brought to the battle
     level: int = 100  # Level of the Pokemon
 
-    # TODO: Convert to % when encoding for AI
+    # Encoded for learning agents as a fraction of hp_max (src.sim.observation)
     _hp: int = 0  # Current HP of the Pokemon
     hp_max: int = 0  # Max HP of the Pokemon
     _attack: Stat = field(
@@ -121,6 +218,7 @@ class PokemonState:
 
     name: Optional[str] = None  # Nickname
     species: Optional[str] = None  # Species name
+    species_id: Optional[int] = None  # Pokédex number
     type1: Optional[Type] = None  # Species type 1,2
     type2: Optional[Type] = None
     _status: Status = Status.NONE  # Status condition of the Pokemon
@@ -135,26 +233,55 @@ class PokemonState:
     light_screen: bool = False  # Gen 1 light screen
     moves: List[MoveState] = field(default_factory=list)
     ability: Optional[str] = None
+    move_mask: int = field(default=0, repr=False)  # bit i set while moves[i] is available
+    # Owning side and position in its pk_list, for the side's bench_mask.
+    _side: Optional["PlayerState"] = field(default=None, repr=False, compare=False)
+    _index: int = field(default=0, repr=False, compare=False)
+    # Cached Zobrist component (src.search.zobrist); None once a hashed field changes.
+    _hash: Optional[int] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in _HASHED_FIELDS:
+            object.__setattr__(self, "_hash", None)
+
+    attack = StatAttribute()
+    defense = StatAttribute()
+    special_attack = StatAttribute()
+    special_defense = StatAttribute()
+    speed = StatAttribute()
 
     def __init__(self, name: str, level: int, moves: List[str], ability: Optional[str] = None):
-        pokemon = dex.get_pokemon_by_name(name)
-        self.name = name
-        self.level = level
-        self.moves = [MoveState.from_dex(move_name) for move_name in moves]
-        if pokemon:
-            self.species = pokemon.species
-            self.type1 = pokemon.type1
-            self.type2 = pokemon.type2
-            self.ability = ability if ability is not None else pokemon.ability
-            self.hp_max = calculate_hp(pokemon.hp, self.level)
-            self._hp = self.hp_max
-            self._generate_stats(
-                calculate_other_stat(pokemon.attack, self.level),
-                calculate_other_stat(pokemon.defense, self.level),
-                calculate_other_stat(pokemon.special_attack, self.level),
-                calculate_other_stat(pokemon.special_defense, self.level),
-                calculate_other_stat(pokemon.speed, self.level),
-            )
+        species, type1, type2, default_ability, hp_max, stats, species_id = _species_profile(name, level)
+        # A fresh Pokemon has nothing hashed yet, so its fields are filled in without __setattr__;
+        # the remaining fields read their class-level dataclass defaults.
+        move_states = []
+        move_mask = 0
+        for slot, move_name in enumerate(moves):
+            move = MoveState.from_dex(move_name)
+            move.__dict__.update(_owner=self, _slot=slot)
+            move_states.append(move)
+            if move.available:
+                move_mask |= 1 << slot
+        attack, defense, special_attack, special_defense, speed = stats
+        self.__dict__.update(
+            species_id=species_id,
+            name=name,
+            level=level,
+            moves=move_states,
+            move_mask=move_mask,
+            species=species,
+            type1=type1,
+            type2=type2,
+            ability=ability if ability is not None else default_ability,
+            hp_max=hp_max,
+            _hp=hp_max,
+            _attack=Stat.from_value(attack, self),
+            _defense=Stat.from_value(defense, self),
+            _special_attack=Stat.from_value(special_attack, self),
+            _special_defense=Stat.from_value(special_defense, self),
+            _speed=Stat.from_value(speed, self),
+        )
 
     @property
     def hp(self) -> int:
@@ -165,12 +292,25 @@ class PokemonState:
 
     @hp.setter
     def hp(self, value: int):
+        was_fainted = self._status == Status.FAINTED
         self._hp = max(0, min(value, self.hp_max))
         if self._hp == 0:
             self._status = Status.FAINTED
             self.reset_boosts()
         elif self._status == Status.FAINTED:
             self._status = Status.NONE
+        if was_fainted != (self._status == Status.FAINTED):
+            self._refresh_side()
+
+    def _refresh_move_bit(self, slot: int):
+        if self.moves[slot].available:
+            self.move_mask |= 1 << slot
+        else:
+            self.move_mask &= ~(1 << slot)
+
+    def _refresh_side(self):
+        if self._side is not None:
+            self._side._refresh_bench_bit(self._index)
 
     @property
     def fainted(self) -> bool:
@@ -180,51 +320,12 @@ class PokemonState:
     def statused(self) -> bool:
         return self._status != Status.NONE and self._status != Status.FAINTED
 
-    def _generate_stats(self, atk: int, defn: int, sp_atk: int, sp_def: int, spd: int):
-        def create_stat_property(stat_name: str):
-            def getter(self):
-                return getattr(self, f"_{stat_name}").current_stat
-
-            def setter(self, value: str):
-                if value.startswith(("+", "-")):
-                    change = int(value)
-                    if value.startswith("-"):
-                        change = -abs(change)
-                    if change == 0:
-                        return
-                    success = getattr(self, f"_{stat_name}").boost(change)
-                    if not success:
-                        print(
-                            f"{self.name}'s {stat_name} won't go {'higher' if change > 0 else 'lower'}!"
-                        )
-                else:
-                    # Reset stats
-                    getattr(self, f"_{stat_name}")._boost = 0
-
-            return property(getter, setter)
-
-        self._attack = Stat.from_value(atk)
-        self._defense = Stat.from_value(defn)
-        self._special_attack = Stat.from_value(sp_atk)
-        self._special_defense = Stat.from_value(sp_def)
-        self._speed = Stat.from_value(spd)
-        for stat_name in [
-            "attack",
-            "defense",
-            "special_attack",
-            "special_defense",
-            "speed",
-        ]:
-            setattr(PokemonState, stat_name, create_stat_property(stat_name))
-
     def reset_boosts(self):
         for stat_name in ["_attack", "_defense", "_special_attack", "_special_defense", "_speed"]:
             getattr(self, stat_name)._boost = 0
 
     def valid_move(self, move_idx: int) -> bool:
-        if move_idx < 0 or move_idx >= len(self.moves):
-            return False
-        return self.moves[move_idx].available
+        return move_idx >= 0 and bool(self.move_mask >> move_idx & 1)
 
     def get_offensive_stat(self, category: Category) -> int:
         if category == Category.PHYSICAL:
@@ -249,6 +350,7 @@ class PokemonState:
     @status.setter
     def status(self, value: str | Status):
         self._status = Status(value.lower()) if isinstance(value, str) else value
+        self._refresh_side()
 
 
 @dataclass
@@ -262,13 +364,29 @@ class PlayerState:
     # Current active Pokemon
     active_mons: List[int]
 
+    # Bit i set while pk_list[i] could be switched in (in play, not fainted, not active).
+    bench_mask: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for i, mon in enumerate(self.pk_list):
+            mon._side = self
+            mon._index = i
+        self.refresh_bench_mask()
+
+    def refresh_bench_mask(self):
+        """Recompute bench_mask from scratch, after writing fields behind the setters' backs."""
+        self.bench_mask = 0
+        for i in self.in_play:
+            self._refresh_bench_bit(i)
+
+    def _refresh_bench_bit(self, i: int):
+        if i in self.in_play and not self.pk_list[i].fainted and i not in self.active_mons:
+            self.bench_mask |= 1 << i
+        else:
+            self.bench_mask &= ~(1 << i)
+
     def get_available_pokemon(self) -> List[int]:
-        return [
-            i
-            for i in self.in_play
-            if not self.pk_list[i].status == Status.FAINTED
-            and i not in self.active_mons
-        ]
+        return list(bit_indices(self.bench_mask))
 
     def get_active_mon(self, slot: int = 0) -> PokemonState:
         if slot < 0 or slot >= len(self.active_mons):
@@ -287,7 +405,10 @@ class PlayerState:
             raise IndexError(
                 f"Slot index {slot_idx} out of range for active mons {self.active_mons}"
             )
+        old_idx = self.active_mons[slot_idx]
         self.active_mons[slot_idx] = new_idx
+        self._refresh_bench_bit(old_idx)
+        self._refresh_bench_bit(new_idx)
 
 
 @dataclass
@@ -295,6 +416,8 @@ class BattleState:
     player_1: PlayerState
     player_2: PlayerState
     turn_count: int = 0
+    # Journal for make/unmake search (src.state.undo.UndoLog); None when not searching.
+    undo_log: Optional[Any] = field(default=None, repr=False, compare=False)
 
     def get_player(self, player_id: Player) -> PlayerState:
         if player_id == Player.PLAYER_1:
@@ -314,6 +437,33 @@ class BattleState:
     def is_finished(self) -> bool:
         return self.player_1.is_finished() or self.player_2.is_finished()
 
+    def record(self, obj: Any):
+        """
+        Save `obj` to the attached undo log before it is changed in place; a
+        no-op when none is attached. Pokemon, sides and dicts go to their
+        UndoLog recorders, anything else has its attributes saved.
+        """
+        undo_log = self.undo_log
+        if undo_log is None:
+            return
+        if isinstance(obj, PokemonState):
+            undo_log.record_pokemon(obj)
+        elif isinstance(obj, PlayerState):
+            undo_log.record_side(obj)
+        elif isinstance(obj, dict):
+            undo_log.record_mapping(obj)
+        else:
+            undo_log.record(obj)
+
+
+def winner(battle_state: BattleState) -> Optional[Player]:
+    """The player whose opponent is out of Pokemon; None if neither or both are."""
+    if battle_state.player_2.is_finished() and not battle_state.player_1.is_finished():
+        return Player.PLAYER_1
+    if battle_state.player_1.is_finished() and not battle_state.player_2.is_finished():
+        return Player.PLAYER_2
+    return None
+
 
 def print_battle_state(battle_state: BattleState, title: str = "Battle State", field_state=None) -> None:
     """
@@ -1,9 +1,9 @@
-import random
-
 from dataclasses import dataclass, field
 from enum import StrEnum, Enum
 from typing import Tuple, Optional, List, Any
 
+from src.state.rng import BattleRng, GLOBAL_RNG
+
 
 class Player(Enum):
     PLAYER_1 = 1
@@ -233,6 +233,22 @@ def get_effectiveness(attacking_type: Type, defending_type: Type) -> float:
     return EFFECTIVENESS.get(attacking_type, {}).get(defending_type, 1.0)
 
 
+@dataclass
+class PokemonInfo:
+    """Species data from the Pokédex: types and base stats."""
+
+    species: str
+    type1: Type
+    type2: Optional[Type]
+    hp: int
+    attack: int
+    defense: int
+    special_attack: int
+    special_defense: int
+    speed: int
+    ability: Optional[str] = None
+
+
 @dataclass
 class Ability:
     """Represents a Pokemon ability."""
@@ -265,6 +281,8 @@ class MoveHitEvent:
     damage: int
     absorbed: bool = False
     damage_multiplier: float = 1.0
+    src_slot: int = 0        # active slot of the attacker
+    target_slot: int = 0     # active slot of the target
 
 
 # Calculate damage dealt by a move
@@ -274,11 +292,11 @@ def calculate_damage(
     defensive_stat: int,
     effective_multiplier: float,
     stab_multiplier: float,
+    rng: BattleRng = GLOBAL_RNG,
 ) -> int:
-    return int(
+    return rng.roll_damage(
         base_power
         * (offensive_stat / defensive_stat)
         * effective_multiplier
         * stab_multiplier
-        * random.uniform(0.85, 1.0)
     )
@@ -0,0 +1,54 @@
+"""
+Per-battle random source.
+
+Every random draw in the engine (damage rolls, status chances, sleep length,
+speed ties) goes through one of BattleRng's semantic methods, so a battle
+seeded with `BattleRng.seeded(seed)` replays identically, and a subclass can
+replace sampling altogether (src.search.chance.EnumeratingRng walks every
+outcome instead). GLOBAL_RNG forwards to the global `random` module, looked
+up at call time, which keeps the interactive game and tests that patch
+`random.random` working unchanged.
+"""
+
+import random
+from typing import Any, Sequence
+
+
+class BattleRng:
+    def __init__(self, source: Any = random):
+        # Either a random.Random instance or the random module itself.
+        self._source = source
+
+    @classmethod
+    def seeded(cls, seed: int) -> "BattleRng":
+        return cls(random.Random(seed))
+
+    def random(self) -> float:
+        return self._source.random()
+
+    def chance(self, probability: float) -> bool:
+        """True with the given probability."""
+        return self._source.random() < probability
+
+    def randint(self, a: int, b: int) -> int:
+        return self._source.randint(a, b)
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        return self._source.choice(seq)
+
+    def getstate(self) -> Any:
+        return self._source.getstate()
+
+    def setstate(self, state: Any):
+        self._source.setstate(state)
+
+    def roll_damage(self, base_damage: float) -> int:
+        """Apply the 85-100% damage roll to a pre-roll damage value."""
+        return int(base_damage * self._source.uniform(0.85, 1.0))
+
+    def tiebreak(self, priority: Any, event: Any) -> float:
+        """Speed-tie key for `event`, queued at `priority`: lower runs first among equal priorities."""
+        return self._source.random()
+
+
+GLOBAL_RNG = BattleRng()
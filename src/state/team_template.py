@@ -0,0 +1,92 @@
+"""
+Precompiled teams for repeated battles.
+
+create_default_battle_state resolves every species and move name and
+computes every stat for each battle it builds. A TeamTemplate does that once:
+it holds one fully built prototype PokemonState per team member, and each
+player_state() clones the prototypes (fresh Stats and MoveStates, shared
+immutable dex entries) without touching the dex again.
+
+    template_1 = TeamTemplate.from_file("team_a.txt")
+    template_2 = TeamTemplate(["Squirtle"], [["Water Gun", "Tackle"]])
+    for _ in range(games):
+        battle_state = create_battle_state(template_1, template_2)
+
+The prototypes are never handed out, so templates can be shared freely
+between battles (and pickled to worker processes).
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+from src.state.pokestate import BattleState, MoveState, PlayerState, PokemonState, Stat, parse_team_file
+
+STATS = ("_attack", "_defense", "_special_attack", "_special_defense", "_speed")
+
+# (names, moves per Pokemon, abilities per Pokemon), as parse_team_file returns.
+TeamSpec = Tuple[Sequence[str], Sequence[Sequence[str]], Optional[Sequence[Optional[str]]]]
+
+
+def _clone(prototype: PokemonState) -> PokemonState:
+    """A fresh PokemonState equal to `prototype`, owning its own Stats and MoveStates."""
+    mon = PokemonState.__new__(PokemonState)
+    attrs = dict(prototype.__dict__)
+    for stat_name in STATS:
+        stat = Stat.__new__(Stat)
+        stat.__dict__.update(attrs[stat_name].__dict__, _owner=mon)
+        attrs[stat_name] = stat
+    move_states = []
+    for move in attrs["moves"]:
+        move_state = MoveState.__new__(MoveState)
+        move_state.__dict__.update(move.__dict__, _owner=mon)
+        move_states.append(move_state)
+    attrs["moves"] = move_states
+    mon.__dict__.update(attrs)
+    return mon
+
+
+class TeamTemplate:
+    """A team compiled once from names, moves and abilities, instantiated any number of times."""
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        moves: Sequence[Sequence[str]],
+        abilities: Optional[Sequence[Optional[str]]] = None,
+        level: int = 100,
+    ):
+        abilities = abilities or [None] * len(names)
+        self.level = level
+        self._prototypes: List[PokemonState] = [
+            PokemonState(name=name, level=level, moves=list(move_names), ability=ability)
+            for move_names, name, ability in zip(moves, names, abilities)
+        ]
+
+    @classmethod
+    def from_file(cls, path: str, level: int = 100) -> "TeamTemplate":
+        """Compile a Showdown-style team file (see parse_team_file)."""
+        return cls(*parse_team_file(path), level=level)
+
+    @classmethod
+    def of(cls, team: Union["TeamTemplate", TeamSpec]) -> "TeamTemplate":
+        """`team` itself if it is already a template, else the template compiled from it."""
+        return team if isinstance(team, cls) else cls(*team)
+
+    def __len__(self) -> int:
+        return len(self._prototypes)
+
+    @property
+    def names(self) -> List[str]:
+        return [mon.name for mon in self._prototypes]
+
+    def player_state(self) -> PlayerState:
+        """A fresh, battle-ready side: every member at full HP and PP, the first one leading."""
+        return PlayerState(
+            pk_list=[_clone(prototype) for prototype in self._prototypes],
+            in_play=list(range(len(self._prototypes))),
+            active_mons=[0],
+        )
+
+
+def create_battle_state(team_1: TeamTemplate, team_2: TeamTemplate) -> BattleState:
+    """Like create_default_battle_state, from two compiled templates."""
+    return BattleState(player_1=team_1.player_state(), player_2=team_2.player_state())
@@ -0,0 +1,95 @@
+"""
+Precomputed type chart.
+
+EFFECTIVENESS is compiled once at import time into flat tables indexed by
+`Type.value`, so damage calculation does list indexing instead of nested
+dict lookups hashed on enums:
+
+  - TYPE_MATRIX: 18 x 18, [attacking * N_TYPES + defending]
+  - DUAL_TABLE:  18 x 19 x 19, attacking type against a defender's
+                 (type1, type2) pair; index NO_TYPE (18) stands for "no type".
+
+Scalar lookups: effectiveness(), dual_effectiveness().
+Vectorized lookups (require NumPy): effectiveness_array(), dual_effectiveness_array().
+NumPy is imported on the first vectorized lookup, so the scalar engine never
+pays for loading it.
+"""
+
+from typing import List, Optional
+
+from src.state.pokestate_defs import EFFECTIVENESS, Type
+
+N_TYPES = len(Type)
+NO_TYPE = N_TYPES
+_PAIR = N_TYPES + 1  # defender slots include NO_TYPE
+
+
+def _compile_matrix() -> List[float]:
+    matrix = [1.0] * (N_TYPES * N_TYPES)
+    for attacking, row in EFFECTIVENESS.items():
+        for defending, multiplier in row.items():
+            matrix[attacking.value * N_TYPES + defending.value] = float(multiplier)
+    return matrix
+
+
+def _compile_dual_table(matrix: List[float]) -> List[float]:
+    table = [1.0] * (N_TYPES * _PAIR * _PAIR)
+    for attacking in range(N_TYPES):
+        for t1 in range(_PAIR):
+            for t2 in range(_PAIR):
+                multiplier = 1.0
+                if t1 != NO_TYPE:
+                    multiplier *= matrix[attacking * N_TYPES + t1]
+                if t2 != NO_TYPE:
+                    multiplier *= matrix[attacking * N_TYPES + t2]
+                table[(attacking * _PAIR + t1) * _PAIR + t2] = multiplier
+    return table
+
+
+TYPE_MATRIX = _compile_matrix()
+DUAL_TABLE = _compile_dual_table(TYPE_MATRIX)
+
+
+def type_index(t: Optional[Type]) -> int:
+    """Table index for a type, NO_TYPE for None."""
+    # _value_ is a plain instance attribute; .value goes through a descriptor.
+    return NO_TYPE if t is None else t._value_
+
+
+def effectiveness(attacking: Type, defending: Type) -> float:
+    return TYPE_MATRIX[attacking._value_ * N_TYPES + defending._value_]
+
+
+def dual_effectiveness(attacking: Type, type1: Optional[Type], type2: Optional[Type]) -> float:
+    """Combined multiplier of an attacking type against a (possibly single-typed) defender."""
+    t1 = NO_TYPE if type1 is None else type1._value_
+    t2 = NO_TYPE if type2 is None else type2._value_
+    return DUAL_TABLE[(attacking._value_ * _PAIR + t1) * _PAIR + t2]
+
+
+# (TYPE_MATRIX, DUAL_TABLE) as NumPy arrays, built by the first vectorized lookup.
+_TABLES_NP = None
+
+
+def _tables_np(np):
+    global _TABLES_NP
+    if _TABLES_NP is None:
+        _TABLES_NP = (
+            np.array(TYPE_MATRIX, dtype=np.float64).reshape(N_TYPES, N_TYPES),
+            np.array(DUAL_TABLE, dtype=np.float64).reshape(N_TYPES, _PAIR, _PAIR),
+        )
+    return _TABLES_NP
+
+
+def effectiveness_array(attacking, defending):
+    """Element-wise TYPE_MATRIX lookup over integer type-index arrays (broadcasts)."""
+    import numpy as np
+
+    return _tables_np(np)[0][np.asarray(attacking), np.asarray(defending)]
+
+
+def dual_effectiveness_array(attacking, type1, type2):
+    """Element-wise DUAL_TABLE lookup; use NO_TYPE in type2 for single-typed defenders."""
+    import numpy as np
+
+    return _tables_np(np)[1][np.asarray(attacking), np.asarray(type1), np.asarray(type2)]
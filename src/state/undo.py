@@ -0,0 +1,130 @@
+"""
+Make/unmake journal for in-place tree search.
+
+Instead of deep-copying a GameState per search node, attach an UndoLog and
+roll back after exploring a branch:
+
+    undo = UndoLog()
+    undo.attach(game_state)
+    mark = undo.mark()
+    action.execute(game_state)     # ...and anything it queues
+    undo.unmake(mark)              # Pokemon, field, queue, listeners and rng restored
+
+While attached, every Action.execute records the state it is about to change
+through BattleState.record (record_pokemon / record_side / record_mapping, or
+record for anything else; a no-op when no log is attached), the EventQueue
+and ListenerManager journal their own insertions and removals, and listeners
+have their attributes saved before each dispatch. mark() also saves the rng state,
+so a replay after unmake() draws the same numbers.
+
+Entries are (undo function, args) pairs replayed newest first; nothing is
+journaled while unmake() runs, because the undo functions are the
+non-journaling internals of the objects they restore. BattleManager's own
+bookkeeping (turn counter, phases run) is not part of GameState and is not
+journaled.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.state.rng import BattleRng
+
+STATS = ("_attack", "_defense", "_special_attack", "_special_defense", "_speed")
+
+
+def _restore_attrs(obj: Any, saved: Dict[str, Any]):
+    attrs = obj.__dict__
+    attrs.clear()
+    attrs.update(saved)
+
+
+def _restore_pokemon(mon, saved: Dict[str, Any], stats: Tuple[Tuple[int, float], ...], side, bench_mask: int):
+    _restore_attrs(mon, saved)
+    for stat_name, (boost, modifier) in zip(STATS, stats):
+        stat = saved[stat_name]
+        stat._boost = boost
+        stat.modifier = modifier
+    if side is not None:
+        side.bench_mask = bench_mask
+
+
+def _restore_side(player_state, active_mons: List[int], bench_mask: int):
+    player_state.active_mons[:] = active_mons
+    player_state.bench_mask = bench_mask
+
+
+def _restore_mapping(mapping: dict, saved: dict):
+    mapping.clear()
+    mapping.update(saved)
+
+
+class UndoLog:
+    def __init__(self):
+        self._entries: List[Tuple[Callable[..., None], Tuple[Any, ...]]] = []
+        self.rng: Optional[BattleRng] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def attach(self, game_state, track_rng: bool = True):
+        """
+        Journal every change made to `game_state` from now on. With
+        `track_rng=False` unmake() leaves the rng where it is, so each branch
+        draws fresh numbers (what sampling searches want).
+        """
+        game_state.battle_state.undo_log = self
+        game_state.event_queue.journal = self
+        game_state.listener_manager.journal = self
+        self.rng = game_state.rng if track_rng else None
+
+    def detach(self, game_state):
+        game_state.battle_state.undo_log = None
+        game_state.event_queue.journal = None
+        game_state.listener_manager.journal = None
+        self.rng = None
+
+    def push(self, undo: Callable[..., None], *args):
+        self._entries.append((undo, args))
+
+    def mark(self) -> int:
+        """Position to unmake() back to; also saves the rng state."""
+        mark = len(self._entries)
+        if self.rng is not None:
+            self.push(self.rng.setstate, self.rng.getstate())
+        return mark
+
+    def unmake(self, mark: int = 0):
+        """Revert every change journaled since `mark`, newest first."""
+        entries = self._entries
+        while len(entries) > mark:
+            undo, args = entries.pop()
+            undo(*args)
+
+    def clear(self):
+        """Forget the journal without reverting anything (commit)."""
+        self._entries.clear()
+
+    # -- recorders ----------------------------------------------------------
+
+    def record(self, obj: Any):
+        """Save all of `obj`'s instance attributes (a shallow copy)."""
+        self.push(_restore_attrs, obj, dict(obj.__dict__))
+
+    def record_pokemon(self, mon):
+        """Save a PokemonState: its attributes, stat boosts/modifiers and its side's bench_mask."""
+        side = mon._side
+        self.push(
+            _restore_pokemon,
+            mon,
+            dict(mon.__dict__),
+            tuple((getattr(mon, s)._boost, getattr(mon, s).modifier) for s in STATS),
+            side,
+            side.bench_mask if side is not None else 0,
+        )
+
+    def record_side(self, player_state):
+        """Save a PlayerState's active slots and bench_mask."""
+        self.push(_restore_side, player_state, list(player_state.active_mons), player_state.bench_mask)
+
+    def record_mapping(self, mapping: dict):
+        """Save the contents of a dict mutated in place (e.g. FieldSide.hazards)."""
+        self.push(_restore_mapping, mapping, dict(mapping))
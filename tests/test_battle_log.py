@@ -0,0 +1,94 @@
+"""
+Tests for the pluggable battle log: engine messages reach the active sink as
+structured records and are only formatted when a sink asks for text.
+"""
+
+import io
+
+from src.state.pokestate import create_default_battle_state
+from src.state.pokestate_defs import Player
+from src.state.field import FieldState, FieldSide
+from src.events.game_state import GameState
+from src.events.event_queue import EventQueue
+from src.events.listener import ListenerManager
+from src.events.battle_log import (
+    MemorySink,
+    NullSink,
+    TextSink,
+    get_log_sink,
+    log,
+    use_log_sink,
+)
+from src.actions.actions import SwitchIn
+from src.actions.move_action import MoveAction
+from src.sim.headless import run_battle
+
+
+def make_game_state(team1, team2, moves1, moves2):
+    battle_state = create_default_battle_state(team1, team2, moves1, moves2)
+    return GameState(
+        battle_state=battle_state,
+        event_queue=EventQueue(),
+        listener_manager=ListenerManager(),
+        field_state=FieldState(
+            player_1_side=FieldSide(hazards={}),
+            player_2_side=FieldSide(hazards={}),
+        ),
+    )
+
+
+class Unprintable:
+    def __str__(self):
+        raise AssertionError("message should not have been formatted")
+
+
+def test_null_sink_never_formats_messages(capsys):
+    with use_log_sink(NullSink()):
+        log("damage", "Dealt %s damage!", Unprintable())
+
+    assert capsys.readouterr().out == ""
+
+
+def test_memory_sink_records_move_and_hazard_events():
+    gs = make_game_state(
+        ["Rattata", "Pikachu"], ["Bulbasaur", "Charmander"],
+        [["Tackle"], ["Thunderbolt"]],
+        [["Vine Whip"], ["Ember"]],
+    )
+    gs.field_state.get_side(Player.PLAYER_1).hazards["Spikes"] = 1
+
+    with use_log_sink(MemorySink()) as sink:
+        MoveAction(Player.PLAYER_1, 0, 0, 0).execute(gs)
+        SwitchIn(Player.PLAYER_1, 1).execute(gs)
+
+    kinds = [record.kind for record in sink.records]
+    assert "move" in kinds
+    assert "hazard" in kinds
+    assert "Rattata used Tackle on Bulbasaur!" in sink.messages()
+
+
+def test_text_sink_writes_formatted_lines():
+    stream = io.StringIO()
+
+    with use_log_sink(TextSink(stream)):
+        log("damage", "Dealt %d damage!", 12)
+
+    assert stream.getvalue() == "Dealt 12 damage!\n"
+
+
+def test_use_log_sink_restores_previous_sink():
+    previous = get_log_sink()
+
+    with use_log_sink(NullSink()):
+        assert get_log_sink() is not previous
+
+    assert get_log_sink() is previous
+
+
+def test_headless_battle_attaches_events_to_turns():
+    team = (["Pikachu"], [["Thunderbolt"]], [None])
+    other = (["Squirtle"], [["Tackle"]], [None])
+
+    result = run_battle(team, other, seed=3, sink=MemorySink())
+
+    assert any(record.kind == "move" for record in result.log[0].events)
@@ -0,0 +1,84 @@
+"""
+Tests for exact chance-node enumeration: outcome probabilities are exact
+(paralysis, speed ties), equivalent branches merge, the source
+position is left alone, and expectiminimax finds the obvious move.
+"""
+
+import pytest
+
+from src.actions.decision import Choice, ChoiceKind
+from src.events.event_queue import EventQueue
+from src.events.game_state import GameState
+from src.events.listener import ListenerManager
+from src.search.chance import enumerate_outcomes, expectiminimax
+from src.state.compact_state import CompactBattleState
+from src.state.pokestate import create_default_battle_state
+
+
+def move(index):
+    return Choice(ChoiceKind.MOVE, index)
+
+
+def make_game_state(team1, team2, moves1, moves2):
+    battle_state = create_default_battle_state(team1, team2, moves1, moves2)
+    return GameState(battle_state, EventQueue(), ListenerManager())
+
+
+def hp_of(outcome):
+    battle_state = outcome.game_state.battle_state
+    return (battle_state.player_1.pk_list[0].hp, battle_state.player_2.pk_list[0].hp)
+
+
+def test_outcomes_sum_to_one_and_leave_the_position_alone():
+    gs = make_game_state(["Pikachu"], ["Rattata"], [["Thunderbolt"]], [["Tackle"]])
+    before = CompactBattleState.from_state(gs.battle_state, gs.field_state).buffer
+
+    outcomes = enumerate_outcomes(gs, move(0), move(0))
+
+    assert sum(o.probability for o in outcomes) == pytest.approx(1.0)
+    assert len({hp_of(o) for o in outcomes}) == len(outcomes) > 1
+    assert CompactBattleState.from_state(gs.battle_state, gs.field_state).buffer == before
+
+
+def test_rolls_with_equivalent_results_are_merged():
+    gs = make_game_state(["Pikachu", "Bulbasaur"], ["Squirtle", "Rattata"],
+                         [["Thunderbolt"], ["Tackle"]], [["Tackle"], ["Tackle"]])
+
+    paths = enumerate_outcomes(gs, move(0), move(0), key=None)
+    merged = enumerate_outcomes(gs, move(0), move(0))
+
+    # Every Thunderbolt roll knocks Squirtle out before it moves.
+    assert len(paths) > 1 and len(merged) == 1
+    assert merged[0].probability == pytest.approx(1.0)
+
+
+def test_speed_ties_match_independent_draws():
+    gs = make_game_state(["Rattata", "Pidgey"], ["Rattata"], [["Tackle"], ["Tackle"]], [["Tackle"]])
+    gs.battle_state.player_1.pk_list[0].hp = 5
+    gs.battle_state.player_2.pk_list[0].hp = 5
+
+    probabilities = {hp_of(o): o.probability for o in enumerate_outcomes(gs, move(0), move(0))}
+
+    # Whoever wins the tie knocks the other out before it can move.
+    assert probabilities == pytest.approx({(5, 0): 1 / 2, (0, 5): 1 / 2})
+
+
+def test_paralysis_skips_the_move_thirty_percent_of_the_time():
+    gs = make_game_state(["Pikachu"], ["Rattata"], [["Thunder Wave", "Tackle"]], [["Tackle"]])
+    paralysed = enumerate_outcomes(gs, move(0), move(0))[0].game_state
+    pikachu_hp = paralysed.battle_state.player_1.pk_list[0].hp
+
+    outcomes = enumerate_outcomes(paralysed, move(1), move(0))
+
+    untouched = sum(o.probability for o in outcomes if hp_of(o)[0] == pikachu_hp)
+    assert untouched == pytest.approx(0.3)
+
+
+def test_expectiminimax_prefers_the_strong_move():
+    gs = make_game_state(["Pikachu", "Bulbasaur"], ["Squirtle", "Rattata"],
+                         [["Growl", "Thunderbolt"], ["Tackle"]], [["Tackle", "Water Gun"], ["Tackle"]])
+
+    value, choice = expectiminimax(gs, depth=1)
+
+    assert choice == move(1)
+    assert 0.5 < value <= 1.0
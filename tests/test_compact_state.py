@@ -0,0 +1,85 @@
+"""
+Tests for the array-backed compact battle state: conversion from and back to
+the dataclasses, and snapshot/restore for search branches.
+"""
+
+import copy
+
+from src.state.pokestate import create_default_battle_state
+from src.state.pokestate_defs import Player, Status
+from src.state.field import FieldState, FieldSide
+from src.state.compact_state import CompactBattleState
+
+
+def make_states():
+    battle_state = create_default_battle_state(
+        ["Pikachu", "Bulbasaur"], ["Squirtle", "Charmander"],
+        [["Thunderbolt", "Thunder Wave"], ["Vine Whip", "Growth"]],
+        [["Water Gun", "Tackle"], ["Ember", "Scratch"]],
+    )
+    field_state = FieldState(
+        player_1_side=FieldSide(hazards={}),
+        player_2_side=FieldSide(hazards={}),
+    )
+    return battle_state, field_state
+
+
+def test_from_state_captures_mutable_fields():
+    battle_state, field_state = make_states()
+    squirtle = battle_state.get_player(Player.PLAYER_2).pk_list[0]
+    squirtle.hp = 50
+    squirtle.status = Status.PARALYZED
+    squirtle._speed.modifier = 0.25
+    battle_state.get_player(Player.PLAYER_1).pk_list[1]._attack.boost(2)
+    battle_state.get_player(Player.PLAYER_1).pk_list[0].moves[1].pp = 3
+    field_state.get_side(Player.PLAYER_2).hazards["Spikes"] = 2
+    field_state.weather = "sun"
+
+    compact = CompactBattleState.from_state(battle_state, field_state)
+
+    assert compact.hp(Player.PLAYER_2, 0) == 50
+    assert compact.status(Player.PLAYER_2, 0) == Status.PARALYZED
+    assert compact.boost(Player.PLAYER_1, 1, "attack") == 2
+    assert compact.pp(Player.PLAYER_1, 0, 1) == 3
+    assert compact.hazard_layers(Player.PLAYER_2, "Spikes") == 2
+    assert compact.active(Player.PLAYER_1) == 0
+
+
+def test_round_trip_restores_dataclasses_exactly():
+    battle_state, field_state = make_states()
+    battle_state.get_player(Player.PLAYER_1).pk_list[0]._speed.modifier = 0.25
+    field_state.get_side(Player.PLAYER_1).hazards["Stealth Rock"] = 1
+    squirtle = battle_state.get_player(Player.PLAYER_2).pk_list[0]
+    squirtle.revealed = True
+    squirtle.known = True
+    squirtle.moves[1].known = True
+    battle_state.get_player(Player.PLAYER_2).pk_list[1].revealed = True
+    original = copy.deepcopy((battle_state, field_state))
+    compact = CompactBattleState.from_state(battle_state, field_state)
+
+    pikachu = battle_state.get_player(Player.PLAYER_1).pk_list[0]
+    pikachu.hp = 0
+    pikachu._speed.modifier = 1.0
+    squirtle.revealed = squirtle.known = squirtle.moves[1].known = False
+    battle_state.get_player(Player.PLAYER_2).pk_list[1].revealed = False
+    battle_state.get_player(Player.PLAYER_1).switch_pokemon(0, 1)
+    field_state.get_side(Player.PLAYER_1).hazards.clear()
+    field_state.weather = "rain"
+
+    compact.apply_to(battle_state, field_state)
+
+    assert (battle_state, field_state) == original
+
+
+def test_snapshot_and_restore_branch_the_buffer():
+    battle_state, field_state = make_states()
+    compact = CompactBattleState.from_state(battle_state, field_state)
+    snap = compact.snapshot()
+    full_hp = compact.hp(Player.PLAYER_1, 0)
+
+    compact.set_hp(Player.PLAYER_1, 0, 1)
+    compact.set_status(Player.PLAYER_1, 0, Status.BURNED)
+    compact.restore(snap)
+
+    assert compact.hp(Player.PLAYER_1, 0) == full_hp
+    assert compact.status(Player.PLAYER_1, 0) == Status.NONE
@@ -0,0 +1,99 @@
+"""
+Tests for the compiled dex: entries unpacked from the binary equal the source
+data modules, stale or missing files are rebuilt in the cache directory
+(falling back to memory when the file cannot be used), and importing the dex does not evaluate the data
+modules.
+"""
+
+import os
+import subprocess
+import sys
+
+from src.dex import compiled
+from src.dex.compiled import HEADER, GenerationDex
+from src.dex.gen1_moves import GEN1_MOVES
+from src.dex.gen1_species import GEN1_POKEMON
+import src.dex.gen1_dex as gen1_dex
+import src.dex.moves as moves
+
+
+def test_compiled_entries_match_sources(tmp_path):
+    dex = GenerationDex(1, str(tmp_path / "gen1.dex"))
+
+    assert list(dex.moves) == GEN1_MOVES
+    assert dict(dex.species) == GEN1_POKEMON
+    assert dex.move_index.get("thunder-wave") is dex.moves[dex.move_index.id_of("Thunder Wave")]
+    assert dex.species_index.get("Nidoran♀") == GEN1_POKEMON[29]
+    assert dex.move_index.get("Not A Move") is None
+    assert dex.species.get(0) is None
+
+
+def test_module_tables_come_from_compiled_dex():
+    assert moves.ALL_MOVES is compiled.GEN1.moves
+    assert gen1_dex.GEN1_POKEMON is compiled.GEN1.species
+    assert moves.get_move_by_name("Tackle") is moves.get_move_by_name("tackle")
+
+
+def test_stale_file_is_rebuilt(tmp_path):
+    path = tmp_path / "gen1.dex"
+    GenerationDex(1, str(path)).moves[0]
+    data = bytearray(path.read_bytes())
+    data[8:12] = b"\0\0\0\0"  # source key
+    path.write_bytes(bytes(data))
+
+    assert GenerationDex(1, str(path)).moves[0] == GEN1_MOVES[0]
+    assert HEADER.unpack_from(path.read_bytes())[3] == compiled._source_key(1)
+
+
+def test_touched_source_makes_the_file_stale(tmp_path, monkeypatch):
+    layout = tmp_path / "layout.py"
+    layout.write_text("")
+    monkeypatch.setattr(compiled, "_LAYOUT_FILE", str(layout))
+    path = tmp_path / "gen1.dex"
+    GenerationDex(1, str(path)).moves[0]
+    assert compiled._map(str(path), 1) is not None
+
+    mtime = os.stat(layout).st_mtime_ns + 1_000_000_000
+    os.utime(layout, ns=(mtime, mtime))
+
+    assert compiled._map(str(path), 1) is None
+
+
+def test_default_path_is_in_the_cache_directory(monkeypatch, tmp_path):
+    monkeypatch.delenv(compiled.DEX_DIR_ENV, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert os.path.dirname(compiled.default_path(1)) == str(tmp_path / "pokemon-sim")
+
+    monkeypatch.setenv(compiled.DEX_DIR_ENV, str(tmp_path / "dex"))
+    dex = GenerationDex(1)
+    assert os.path.dirname(dex.path) == str(tmp_path / "dex")
+    assert dex.moves[0] == GEN1_MOVES[0]
+    assert os.path.exists(dex.path)
+
+
+def test_unwritable_location_falls_back_to_memory(tmp_path):
+    (tmp_path / "file").write_text("")
+    dex = GenerationDex(1, str(tmp_path / "file" / "gen1.dex"))
+
+    assert dex.species[25].species == "Pikachu"
+    assert not os.path.exists(dex.path)
+
+
+def test_file_going_stale_after_build_falls_back_to_memory(tmp_path, monkeypatch):
+    monkeypatch.setattr(compiled, "_map", lambda path, generation: None)
+
+    dex = GenerationDex(1, str(tmp_path / "gen1.dex"))
+
+    assert dex.moves[0] == GEN1_MOVES[0]
+
+
+def test_import_does_not_evaluate_data_modules():
+    compiled.GEN1.section("moves")  # make sure the generated file is current
+    code = (
+        "import sys, src.dex.moves as m, src.dex.gen1_dex as d; "
+        "assert m.get_move_by_name('Tackle').power == 35; "
+        "assert d.get_pokemon_by_name('Mew').hp == 100; "
+        "assert 'src.dex.gen1_moves' not in sys.modules and 'src.dex.gen1_species' not in sys.modules"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True, env={**os.environ, "PYTHONPATH": root})
@@ -0,0 +1,79 @@
+"""
+Tests for the exact damage-distribution calculator, scalar and batched.
+"""
+
+import pytest
+
+from src.actions.move_action import MoveAction
+from src.dex.moves import get_move_by_name
+from src.state.damage_calc import damage_distribution, roll_distribution
+from src.state.pokestate import create_default_battle_state
+from src.state.pokestate_defs import Player
+from src.state.rng import BattleRng
+
+
+def make_battle_state():
+    return create_default_battle_state(
+        ["Pikachu", "Bulbasaur"], ["Squirtle", "Geodude", "Rattata"],
+        [["Thunderbolt", "Quick Attack", "Thunder Wave", "Night Shade"], ["Vine Whip", "Growth"]],
+        [["Water Gun", "Tackle"], ["Tackle"], ["Tackle"]],
+    )
+
+
+def test_roll_distribution_is_exact():
+    dist = roll_distribution(100.0)
+    assert dist.damages == list(range(85, 100))
+    assert sum(dist.probabilities) == pytest.approx(1.0)
+    # Each integer between 85 and 99 covers an equal slice of the roll.
+    assert all(p == pytest.approx(1 / 15) for p in dist.probabilities)
+    assert roll_distribution(0).damages == [0]
+
+
+def test_distribution_covers_sampled_damage():
+    battle_state = make_battle_state()
+    pikachu = battle_state.get_player(Player.PLAYER_1).get_active_mon()
+    squirtle = battle_state.get_player(Player.PLAYER_2).get_active_mon()
+    thunderbolt = get_move_by_name("Thunderbolt")
+    dist = damage_distribution(thunderbolt, pikachu, squirtle)
+    assert sum(dist.probabilities) == pytest.approx(1.0)
+
+    rng = BattleRng.seeded(3)
+    action = MoveAction(Player.PLAYER_1, 0, 0, 0)
+    samples = [action.calculate_move_damage(thunderbolt, pikachu, squirtle, rng) for _ in range(2000)]
+    assert set(samples) <= set(dist.damages)
+    assert sum(samples) / len(samples) == pytest.approx(dist.expected, rel=0.01)
+
+
+def test_boosts_and_fixed_damage():
+    battle_state = make_battle_state()
+    pikachu = battle_state.get_player(Player.PLAYER_1).get_active_mon()
+    squirtle = battle_state.get_player(Player.PLAYER_2).get_active_mon()
+    quick_attack = get_move_by_name("Quick Attack")
+    unboosted = damage_distribution(quick_attack, pikachu, squirtle).expected
+    pikachu._attack.boost(2)
+    assert damage_distribution(quick_attack, pikachu, squirtle).expected > unboosted
+
+    night_shade = get_move_by_name("Night Shade")
+    assert damage_distribution(night_shade, pikachu, squirtle).damages == [pikachu.level]
+    rattata = battle_state.get_player(Player.PLAYER_2).pk_list[2]
+    assert damage_distribution(night_shade, pikachu, rattata).damages == [0]
+
+
+def test_batch_matches_scalar():
+    pytest.importorskip("numpy")
+    from src.state.damage_calc import batch_damage_distribution
+
+    battle_state = make_battle_state()
+    pikachu = battle_state.get_player(Player.PLAYER_1).get_active_mon()
+    opponents = battle_state.get_player(Player.PLAYER_2)
+    batch = batch_damage_distribution(pikachu, opponents)
+    assert batch.damages.shape[:2] == (len(pikachu.moves), len(opponents.pk_list))
+
+    for m, move in enumerate(pikachu.moves):
+        for t, target in enumerate(opponents.pk_list):
+            expected = damage_distribution(move.move_info, pikachu, target)
+            got = batch.distribution(m, t)
+            assert got.damages == expected.damages
+            assert got.probabilities == pytest.approx(expected.probabilities)
+            assert batch.expected[m, t] == pytest.approx(expected.expected)
+            assert batch.ko_chance(target.hp)[m, t] == pytest.approx(expected.ko_chance(target.hp))
@@ -0,0 +1,101 @@
+"""
+Tests for decision providers: ChooseAction hands a legal-choice list to a
+provider and queues the structured Choice it returns, with no string parsing
+outside StdinProvider.
+"""
+
+import pytest
+
+from src.actions.choose_action import ChooseAction
+from src.actions.decision import (
+    Choice,
+    ChoiceKind,
+    GreedyDamageProvider,
+    RandomProvider,
+    ScriptedProvider,
+    StdinProvider,
+    legal_choices,
+)
+from src.actions.move_action import MoveAction
+from src.events.event_queue import EventQueue
+from src.events.game_state import GameState
+from src.events.listener import ListenerManager
+from src.sim.headless import run_battle
+from src.state.field import FieldSide, FieldState
+from src.state.pokestate import create_default_battle_state
+from src.state.pokestate_defs import Player
+
+
+def make_game_state(team1, team2, moves1, moves2):
+    battle_state = create_default_battle_state(team1, team2, moves1, moves2)
+    return GameState(
+        battle_state=battle_state,
+        event_queue=EventQueue(),
+        listener_manager=ListenerManager(),
+        field_state=FieldState(
+            player_1_side=FieldSide(hazards={}),
+            player_2_side=FieldSide(hazards={}),
+        ),
+    )
+
+
+def pikachu_vs_squirtle():
+    return make_game_state(
+        ["Pikachu", "Bulbasaur"], ["Squirtle"],
+        [["Quick Attack", "Thunderbolt", "Growl"], ["Tackle"]], [["Tackle"]],
+    )
+
+
+def test_stdin_provider_reprompts_until_a_legal_choice():
+    gs = pikachu_vs_squirtle()
+    answers = iter(["attack!", "move 9", "  switch   2 "])
+    written = []
+    provider = StdinProvider(read=lambda prompt: next(answers), write=written.append)
+
+    choices = legal_choices(gs.battle_state.get_player(Player.PLAYER_1))
+    choice = provider.choose(gs, Player.PLAYER_1, choices)
+
+    assert choice == Choice(ChoiceKind.SWITCH, 1)
+    assert sum("Invalid choice" in line for line in written) == 2
+
+
+def test_scripted_provider_replays_then_falls_back():
+    gs = pikachu_vs_squirtle()
+    choices = legal_choices(gs.battle_state.get_player(Player.PLAYER_1))
+    script = [Choice(ChoiceKind.MOVE, 2), Choice(ChoiceKind.SWITCH, 0)]
+
+    strict = ScriptedProvider(script)
+    assert strict.choose(gs, Player.PLAYER_1, choices) == Choice(ChoiceKind.MOVE, 2)
+    with pytest.raises(ValueError):
+        strict.choose(gs, Player.PLAYER_1, choices)  # switching to the active mon is illegal
+
+    lenient = ScriptedProvider(script[:1], fallback=ScriptedProvider([choices[0]] * 2))
+    assert lenient.choose(gs, Player.PLAYER_1, choices) == Choice(ChoiceKind.MOVE, 2)
+    assert lenient.choose(gs, Player.PLAYER_1, choices) == choices[0]
+
+
+def test_greedy_damage_provider_picks_highest_expected_damage():
+    gs = pikachu_vs_squirtle()
+    choices = legal_choices(gs.battle_state.get_player(Player.PLAYER_1))
+
+    assert GreedyDamageProvider().choose(gs, Player.PLAYER_1, choices) == Choice(ChoiceKind.MOVE, 1)
+
+
+def test_choose_action_queues_the_providers_choice():
+    gs = pikachu_vs_squirtle()
+    action = ChooseAction(Player.PLAYER_1, ScriptedProvider([Choice(ChoiceKind.MOVE, 1)]))
+
+    action.execute(gs)
+
+    _, queued = gs.event_queue.get_next_event()
+    assert isinstance(queued, MoveAction) and queued.move_idx == 1
+    assert action.chosen == [Choice(ChoiceKind.MOVE, 1)]
+
+
+def test_providers_drive_a_full_battle():
+    team_1 = (["Pikachu"], [["Thunderbolt", "Growl"]], [None])
+    team_2 = (["Squirtle"], [["Tackle", "Tail Whip"]], [None])
+
+    result = run_battle(team_1, team_2, GreedyDamageProvider(), RandomProvider(), seed=3)
+
+    assert result.winner == Player.PLAYER_1
@@ -0,0 +1,64 @@
+"""
+Tests for the normalized-name dex index shared by moves, species and abilities.
+"""
+
+import pytest
+
+from src.dex import gen1_dex, moves
+from src.dex.abilitydex import get_ability_by_name, get_ability_index_by_name
+from src.dex.dex_index import NameIndex
+from src.state.pokestate import PokemonState
+
+
+def test_move_lookup_accepts_any_spelling():
+    expected = moves.get_move_index_by_name("Thunder Wave")
+    assert expected is not None
+    for spelling in ("Thunder Wave", "thunderwave", "THUNDER-WAVE", "ThunderWave"):
+        assert moves.get_move_index_by_name(spelling) == expected
+        assert moves.get_move_by_name(spelling) is moves.ALL_MOVES[expected]
+    assert moves.get_move_by_name("Not A Move") is None
+    assert moves.get_move_index_by_name("Not A Move") is None
+
+
+def test_every_move_and_species_round_trips():
+    for index, move in enumerate(moves.ALL_MOVES):
+        assert moves.get_move_index_by_name(move.name) == index
+    for dex_num, pokemon in gen1_dex.GEN1_POKEMON.items():
+        assert gen1_dex.get_species_index_by_name(pokemon.species) == dex_num
+        assert gen1_dex.get_pokemon_by_name(pokemon.species.upper()) is pokemon
+
+
+def test_species_lookup_still_raises_on_unknown_name():
+    with pytest.raises(ValueError):
+        gen1_dex.get_pokemon_by_name("Missingno")
+    with pytest.raises(ValueError):
+        gen1_dex.get_species_index_by_name("Missingno")
+
+
+def test_ability_lookup():
+    assert get_ability_by_name("volt-absorb").name == "Volt Absorb"
+    assert get_ability_index_by_name("Levitate") is not None
+    assert get_ability_by_name("Huge Power") is None
+
+
+def test_ids_cached_on_state():
+    mon = PokemonState("Pikachu", 50, ["Thunderbolt", "Quick Attack"])
+    assert mon.species_id == 25
+    assert [m.move_id for m in mon.moves] == [
+        moves.get_move_index_by_name("Thunderbolt"),
+        moves.get_move_index_by_name("Quick Attack"),
+    ]
+
+
+def test_duplicate_names_rejected():
+    with pytest.raises(ValueError):
+        NameIndex(enumerate(["Body Slam", "body-slam"]), str)
+
+
+def test_only_hits_are_memoized():
+    index = NameIndex(enumerate(["Body Slam", "Surf"]), str)
+    for i in range(100):
+        assert index.id_of(f"Not A Move {i}") is None
+    assert index.id_of("body-slam") == 0
+
+    assert index._memo == {"body-slam": 0}
@@ -0,0 +1,117 @@
+"""
+Tests for the RL environment: the coroutine engine plays the same battle as
+the headless engine, observations hide what the opponent has not shown, the
+buffers are reused, and the subprocess vector env matches single envs.
+"""
+
+import functools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.sim.coroutine import BattleCoroutine
+from src.sim.env import BattleEnv
+from src.sim.headless import run_battle
+from src.sim.observation import MOVE_FEATURES, POKEMON_FEATURES, VISIBLE
+from src.sim.vector_env import SubprocVectorEnv
+from src.state.pokestate import create_default_battle_state
+from src.state.pokestate_defs import Player
+from src.state.rng import BattleRng
+
+TEAM_1 = (
+    ["Pikachu", "Bulbasaur"],
+    [["Thunderbolt", "Quick Attack"], ["Vine Whip", "Tackle"]],
+    [None, None],
+)
+TEAM_2 = (
+    ["Squirtle", "Rattata"],
+    [["Water Gun", "Tackle"], ["Quick Attack", "Tackle"]],
+    [None, None],
+)
+
+
+def last_choice(game_state, player, choices):
+    return choices[-1]
+
+
+def play_random(env, seed, steps=1000):
+    rng = np.random.default_rng(seed)
+    observation, info = env.reset(seed=seed)
+    frames = [observation.copy()]
+    for _ in range(steps):
+        action = rng.choice(np.flatnonzero(info["action_mask"]))
+        observation, reward, terminated, truncated, info = env.step(action)
+        frames.append(observation.copy())
+        if terminated or truncated:
+            return frames, reward
+    raise AssertionError("episode did not end")
+
+
+def test_coroutine_plays_the_same_battle_as_the_headless_engine():
+    names_1, moves_1, abilities_1 = TEAM_1
+    names_2, moves_2, abilities_2 = TEAM_2
+    battle_state = create_default_battle_state(names_1, names_2, moves_1, moves_2, abilities_1, abilities_2)
+    battle = BattleCoroutine(battle_state, max_turns=200, rng=BattleRng.seeded(7))
+    steps = battle.play()
+    decisions = 0
+    requests = next(steps)
+    with pytest.raises(StopIteration):
+        while True:
+            decisions += len(requests)
+            requests = steps.send([request.choices[-1] for request in requests])
+
+    reference = run_battle(TEAM_1, TEAM_2, last_choice, last_choice, seed=7)
+
+    assert battle.winner() == reference.winner
+    assert battle.turn_counter + 1 == reference.turns
+    assert decisions >= 2 * reference.turns - 1
+
+
+def test_observation_hides_what_the_opponent_has_not_shown():
+    env = BattleEnv(TEAM_1, TEAM_2)
+    observation, info = env.reset(seed=0)
+    block = env.encoder.pokemon_size
+    opponent = 1 + 2 * block
+
+    assert observation[1 + VISIBLE] == observation[1 + block + VISIBLE] == 1.0  # own team
+    assert observation[opponent + VISIBLE] == 1.0  # the opposing lead was sent out
+    assert not observation[opponent + block:].any()  # its bench was not
+    assert not observation[opponent + POKEMON_FEATURES:opponent + block].any()  # no move used yet
+
+    observation, *_ = env.step(0)
+    used = [
+        i for i, move in enumerate(env.game_state.battle_state.player_2.pk_list[0].moves) if move.known
+    ]
+    for i in range(2):
+        at = opponent + POKEMON_FEATURES + i * MOVE_FEATURES
+        assert observation[at + VISIBLE] == (i in used)
+
+
+def test_episodes_are_reproducible_and_reuse_their_buffers():
+    env = BattleEnv(TEAM_1, TEAM_2)
+    buffer = env.observation
+
+    frames, reward = play_random(env, seed=3)
+    again, reward_again = play_random(BattleEnv(TEAM_1, TEAM_2), seed=3)
+
+    assert env.observation is buffer and env.reset(seed=1)[0] is buffer
+    assert reward in (-1.0, 0.0, 1.0) and reward == reward_again
+    assert all((a == b).all() for a, b in zip(frames, again)) and len(frames) == len(again)
+
+
+def test_vector_env_matches_single_environments():
+    make_env = functools.partial(BattleEnv, TEAM_1, TEAM_2)
+    with SubprocVectorEnv(make_env, n=3, workers=2) as envs:
+        observations, masks = envs.reset(seed=10)
+        singles = [make_env() for _ in range(3)]
+        for i, env in enumerate(singles):
+            observation, info = env.reset(seed=10 + i)
+            assert (observations[i] == observation).all() and (masks[i] == info["action_mask"]).all()
+
+        actions = masks.argmax(axis=1)
+        observations, rewards, terminated, truncated, masks = envs.step(actions)
+        for i, env in enumerate(singles):
+            observation, reward, *_ = env.step(int(actions[i]))
+            assert (observations[i] == observation).all() and rewards[i] == reward
+    assert envs.closed
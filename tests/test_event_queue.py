@@ -0,0 +1,142 @@
+"""
+Tests for the heap-backed EventQueue: ordering, lazy removal, indexed
+cancellation and reprioritization.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import copy
+import pickle
+
+import pytest
+
+from src.events.event_queue import EventQueue
+from src.events.priority import Priority
+from src.state.pokestate_defs import Player
+from src.state.rng import BattleRng
+
+
+@dataclass(eq=False)
+class MoveAction:  # stand-in; the index keys on the type name
+    player: Player
+    src_idx: Optional[int] = 0
+    move_idx: int = 0
+
+
+@dataclass(eq=False)
+class SwitchIn:
+    player: Player
+
+
+def drain(queue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_next_event()[1])
+    return events
+
+
+def test_pops_in_priority_order():
+    queue = EventQueue()
+    events = [MoveAction(Player.PLAYER_1, move_idx=i) for i in range(5)]
+    for priority, event in zip([3, 1, 4, 0, 2], events):
+        queue.add_event(event, priority)
+    assert len(queue) == 5
+    assert drain(queue) == [events[3], events[1], events[4], events[0], events[2]]
+
+
+def test_remove_event_and_cancel_skip_dead_items():
+    queue = EventQueue()
+    p1_move = MoveAction(Player.PLAYER_1, 0)
+    p2_move = MoveAction(Player.PLAYER_2, 0)
+    p2_switch = SwitchIn(Player.PLAYER_2)
+    queue.add_event(p1_move, 1)
+    queue.add_event(p2_move, 2)
+    queue.add_event(p2_switch, 0)
+
+    assert [item.event for item in queue.find(Player.PLAYER_2, 0, "MoveAction")] == [p2_move]
+    assert queue.cancel(Player.PLAYER_2, 0, "MoveAction") == 1
+    assert queue.cancel(Player.PLAYER_2, 0, "MoveAction") == 0
+    queue.remove_event(lambda event: event is p1_move)
+    assert [item.event for item in queue.get_all_events()] == [p2_switch]
+    assert drain(queue) == [p2_switch]
+
+
+def test_peek_leaves_head_queued_and_skips_dead_items():
+    queue = EventQueue()
+    first = MoveAction(Player.PLAYER_1, 0)
+    second = MoveAction(Player.PLAYER_2, 0)
+    queue.add_event(first, 0)
+    queue.add_event(second, 1)
+
+    assert queue.peek() == (0, first)
+    assert queue.peek() == (0, first)
+    assert queue.cancel(Player.PLAYER_1) == 1
+    assert queue.peek() == (1, second)
+    assert drain(queue) == [second]
+
+
+def test_cancel_by_player_wildcard_and_predicate():
+    queue = EventQueue()
+    keep = MoveAction(Player.PLAYER_1, 0, move_idx=0)
+    drop = MoveAction(Player.PLAYER_1, 0, move_idx=1)
+    queue.add_event(keep, 0)
+    queue.add_event(drop, 1)
+    queue.add_event(SwitchIn(Player.PLAYER_2), 2)
+    assert queue.cancel(Player.PLAYER_1, 0, "MoveAction", lambda e: e.move_idx == 1) == 1
+    assert queue.cancel(Player.PLAYER_2) == 1
+    assert drain(queue) == [keep]
+
+
+def test_reprioritize_moves_item():
+    queue = EventQueue()
+    first = MoveAction(Player.PLAYER_1)
+    second = MoveAction(Player.PLAYER_2)
+    item = queue.add_event(first, 1)
+    queue.add_event(second, 2)
+    queue.reprioritize(item, 3)
+    assert len(queue) == 2
+    assert drain(queue) == [second, first]
+    with pytest.raises(ValueError):
+        queue.reprioritize(item, 0)
+
+
+def test_many_cancellations_compact_the_heap():
+    queue = EventQueue()
+    for i in range(200):
+        queue.add_event(MoveAction(Player.PLAYER_1, i), i)
+    queue.cancel(Player.PLAYER_1)
+    assert queue.empty()
+    assert len(queue._heap) < 200
+
+
+def test_priority_is_a_plain_tuple_key():
+    assert Priority(1, 50) < Priority(0, 300)  # higher bracket first
+    assert Priority(0, 300) < Priority(0, 50)  # then higher speed
+    assert Priority(0, 80) == Priority(0, 80)
+    assert sorted([Priority(0, 10), Priority(2, 5), Priority(0, 90)]) == [
+        Priority(2, 5), Priority(0, 90), Priority(0, 10),
+    ]
+    priority = Priority(3, 120)
+    assert (priority.bracket, priority.speed) == (3, 120)
+    assert pickle.loads(pickle.dumps(priority)) == priority
+    assert copy.deepcopy(priority).speed == 120
+
+
+def test_speed_ties_are_seeded_and_stable():
+    def tie_order(seed):
+        queue = EventQueue(tie_rng=BattleRng.seeded(seed))
+        events = [MoveAction(Player.PLAYER_1, move_idx=i) for i in range(8)]
+        for event in events:
+            queue.add_event(event, Priority(0, 100))
+        return [event.move_idx for event in drain(queue)]
+
+    assert tie_order(1) == tie_order(1)
+    assert len({tuple(tie_order(seed)) for seed in range(10)}) > 1
+
+
+def test_reprioritize_keeps_tiebreak():
+    queue = EventQueue(tie_rng=BattleRng.seeded(0))
+    item = queue.add_event(MoveAction(Player.PLAYER_1), Priority(0, 100))
+    moved = queue.reprioritize(item, Priority(1, 100))
+    assert moved.tiebreak == item.tiebreak
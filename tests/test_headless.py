@@ -0,0 +1,75 @@
+"""
+Tests for the headless batch engine: battles run to completion with policy
+callables, never touch stdin, and return a structured result.
+"""
+
+import builtins
+
+import pytest
+
+from src.actions.choose_action import ChoiceKind
+from src.sim.headless import run_battle, random_policy
+from src.state.pokestate_defs import Player
+
+
+TEAM_1 = (
+    ["Pikachu", "Bulbasaur"],
+    [["Thunderbolt", "Quick Attack"], ["Vine Whip", "Tackle"]],
+    [None, None],
+)
+TEAM_2 = (
+    ["Squirtle", "Rattata"],
+    [["Water Gun", "Tackle"], ["Quick Attack", "Tackle"]],
+    [None, None],
+)
+
+
+def first_move_policy(game_state, player, choices):
+    """Always attack with the first legal move, switching only when forced."""
+    moves = [c for c in choices if c.kind == ChoiceKind.MOVE]
+    return moves[0] if moves else choices[0]
+
+
+def withdraw_only_policy(game_state, player, choices):
+    return choices[0]
+
+
+@pytest.fixture(autouse=True)
+def no_stdin(monkeypatch):
+    def fail(*_args, **_kwargs):
+        raise AssertionError("headless battles must not read stdin")
+
+    monkeypatch.setattr(builtins, "input", fail)
+
+
+def test_battle_runs_to_completion_with_a_winner():
+    result = run_battle(TEAM_1, TEAM_2, first_move_policy, first_move_policy)
+
+    assert result.winner in (Player.PLAYER_1, Player.PLAYER_2)
+    assert result.turns == len(result.log)
+    loser = Player.opponent(result.winner)
+    assert all(hp == 0 for hp in result.log[-1].hp[loser])
+
+
+def test_turn_log_records_each_players_choices():
+    result = run_battle(TEAM_1, TEAM_2, random_policy, random_policy)
+
+    first_turn = result.log[0]
+    assert first_turn.turn == 0
+    assert len(first_turn.choices[Player.PLAYER_1]) >= 1
+    assert len(first_turn.choices[Player.PLAYER_2]) >= 1
+
+
+def test_turn_cap_ends_battle_as_draw():
+    stall = (["Squirtle"], [["Withdraw"]], [None])
+
+    result = run_battle(stall, stall, withdraw_only_policy, withdraw_only_policy, max_turns=5)
+
+    assert result.winner is None
+    assert result.turns == 5
+
+
+def test_battle_prints_nothing(capsys):
+    run_battle(TEAM_1, TEAM_2, first_move_policy, first_move_policy)
+
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,92 @@
+"""
+Tests for the module graph: engine code resolves its imports once at module
+level (only NumPy is deferred to the vectorized helpers that need it), every
+module imports on its own (no cycle relies on import order), the engine's
+entry points do not load NumPy, and the import-time report parses
+`-X importtime` output.
+"""
+
+import ast
+import os
+import subprocess
+import sys
+
+from src.sim.import_report import parse_importtime, subtree, total_ms
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_POINTS = ["main", "battle_manager_rewrite"]
+DEFERRED = {"numpy"}  # heavy optional dependencies, imported by the functions that use them
+
+
+def _engine_modules():
+    modules = list(ENTRY_POINTS)
+    for directory, _, files in os.walk(os.path.join(ROOT, "src")):
+        for file in sorted(files):
+            if file.endswith(".py"):
+                path = os.path.relpath(os.path.join(directory, file), ROOT)
+                modules.append(path[:-3].replace(os.sep, "."))
+    return modules
+
+
+def _path(module):
+    return os.path.join(ROOT, *module.split(".")) + ".py"
+
+
+def test_no_imports_inside_functions():
+    offenders = []
+    for module in _engine_modules():
+        with open(_path(module), encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        for function in ast.walk(tree):
+            if isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                offenders += [
+                    f"{module}:{node.lineno}"
+                    for node in ast.walk(function)
+                    if isinstance(node, ast.ImportFrom)
+                    or (isinstance(node, ast.Import) and {alias.name for alias in node.names} - DEFERRED)
+                ]
+    assert offenders == []
+
+
+def test_every_module_imports_on_its_own():
+    code = (
+        "import importlib, sys\n"
+        "for name in sys.argv[1:]:\n"
+        "    for loaded in [m for m in sys.modules if m.startswith('src.') or m in sys.argv[1:]]:\n"
+        "        del sys.modules[loaded]\n"
+        "    importlib.import_module(name)\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code, *_engine_modules()],
+        cwd=ROOT,
+        check=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+
+
+def test_entry_points_do_not_load_numpy():
+    code = "import sys, main, battle_manager_rewrite; assert 'numpy' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, env={**os.environ, "PYTHONPATH": ROOT})
+
+
+def test_parse_importtime_keeps_only_the_measured_subtree():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 | encodings",
+        "import time:        30 |         30 |     src.events.priority",
+        "import time:        50 |         80 |   src.events.phases",
+        "import time:         5 |          5 | src",
+        "import time:         4 |          4 | src.events",
+        "import time:       200 |        280 | src.events.game_state",
+    ])
+
+    timings = subtree(parse_importtime(stderr), "src.events.game_state")
+
+    assert [(t.name, t.depth) for t in timings] == [
+        ("src.events.priority", 2),
+        ("src.events.phases", 1),
+        ("src", 0),
+        ("src.events", 0),
+        ("src.events.game_state", 0),
+    ]
+    assert total_ms(timings) == 0.289
@@ -0,0 +1,84 @@
+"""
+Tests for bitmask legal-action generation: move and bench masks follow PP,
+disabled, faint and switch changes, and legal_choices agrees with a brute-force
+enumeration.
+"""
+
+from src.state.compact_state import CompactBattleState
+from src.state.legal_actions import CHOICE_TABLE, Choice, ChoiceKind, legal_choices
+from src.state.pokestate import create_default_battle_state
+from src.state.pokestate_defs import Status
+
+
+def make_state():
+    return create_default_battle_state(
+        ["Pikachu", "Bulbasaur", "Charmander"],
+        ["Squirtle"],
+        [["Thunderbolt", "Quick Attack", "Growl"], ["Tackle"], ["Ember"]],
+        [["Tackle"]],
+    )
+
+
+def brute_force(player_state, slot=0):
+    active_mon = player_state.get_active_mon(slot)
+    moves = [] if active_mon.fainted else [
+        Choice(ChoiceKind.MOVE, i) for i, m in enumerate(active_mon.moves) if m.pp > 0 and not m.disabled
+    ]
+    switches = [
+        Choice(ChoiceKind.SWITCH, i)
+        for i in player_state.in_play
+        if not player_state.pk_list[i].fainted and i not in player_state.active_mons
+    ]
+    return tuple(moves + switches)
+
+
+def test_move_mask_tracks_pp_and_disabled():
+    player = make_state().player_1
+    pikachu = player.pk_list[0]
+    assert pikachu.move_mask == 0b111
+
+    pikachu.moves[0].pp = 0
+    pikachu.moves[2].disabled = True
+    assert pikachu.move_mask == 0b010
+    assert not pikachu.valid_move(0) and pikachu.valid_move(1)
+
+    pikachu.moves[0].pp = 5
+    assert pikachu.move_mask == 0b011
+    assert legal_choices(player) == brute_force(player)
+
+
+def test_bench_mask_tracks_faint_and_switch():
+    player = make_state().player_1
+    assert player.bench_mask == 0b110
+
+    player.pk_list[1].hp = 0
+    assert player.get_available_pokemon() == [2]
+
+    player.switch_pokemon(0, 2)
+    assert player.bench_mask == 0b001
+    player.pk_list[1].hp = 10  # revived
+    player.pk_list[0].status = Status.FAINTED
+    assert player.bench_mask == 0b010
+    assert legal_choices(player) == brute_force(player)
+
+
+def test_legal_choices_are_shared_table_entries():
+    player = make_state().player_1
+
+    assert legal_choices(player) is CHOICE_TABLE[0b110][0b111]
+    player.get_active_mon().hp = 0
+    assert legal_choices(player) == (Choice(ChoiceKind.SWITCH, 1), Choice(ChoiceKind.SWITCH, 2))
+
+
+def test_compact_restore_refreshes_masks():
+    state = make_state()
+    compact = CompactBattleState.from_state(state)
+    snapshot = compact.snapshot()
+
+    state.player_1.pk_list[1].hp = 0
+    state.player_1.pk_list[0].moves[1].pp = 0
+    compact.restore(snapshot)
+    compact.apply_to(state)
+
+    assert state.player_1.bench_mask == 0b110
+    assert state.player_1.pk_list[0].move_mask == 0b111
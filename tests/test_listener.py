@@ -0,0 +1,96 @@
+"""
+Tests for ListenerManager dispatch: filter indexing, registration order,
+phases and handle-based removal.
+"""
+
+from src.dex.moves import get_move_by_name
+from src.events.event_queue import EventQueue
+from src.events.listener import Listener, ListenerFilter, ListenerManager
+from src.state.pokestate_defs import MoveHitEvent, Player, SwitchInEvent, Type
+
+
+class Recorder(Listener[MoveHitEvent]):
+    datatype = MoveHitEvent
+
+    def __init__(self, name, calls, listener_filter=ListenerFilter(), keep=True):
+        self.name = name
+        self.calls = calls
+        self._filter = listener_filter
+        self.keep = keep
+
+    def listener_filter(self):
+        return self._filter
+
+    def on_event(self, event, event_queue):
+        self.calls.append(self.name)
+        return self.keep
+
+
+def hit(attacker, move_name, target_slot=0):
+    return MoveHitEvent(
+        attacker=attacker, move=get_move_by_name(move_name),
+        src_mon=None, target_mon=None, damage=10, target_slot=target_slot,
+    )
+
+
+def test_filters_prune_dispatch():
+    manager, queue, calls = ListenerManager(), EventQueue(), []
+    manager.add_listener((Player.PLAYER_2, 0), Recorder(
+        "p2_electric", calls, ListenerFilter(player=Player.PLAYER_2, slot=0, move_type=Type.ELECTRIC)))
+    manager.add_listener((Player.PLAYER_2, 0), Recorder(
+        "fire_any", calls, ListenerFilter(move_type=Type.FIRE)))
+    manager.add_listener((Player.PLAYER_1, 0), Recorder("everything", calls))
+
+    manager.listen(hit(Player.PLAYER_1, "Thunderbolt"), queue)
+    assert calls == ["p2_electric", "everything"]
+
+    calls.clear()
+    manager.listen(hit(Player.PLAYER_2, "Thunderbolt"), queue)  # Player 1 is hit
+    assert calls == ["everything"]
+
+    calls.clear()
+    manager.listen(hit(Player.PLAYER_1, "Thunderbolt", target_slot=1), queue)
+    assert calls == ["everything"]
+
+    calls.clear()
+    manager.listen(hit(Player.PLAYER_2, "Ember"), queue)
+    assert calls == ["fire_any", "everything"]
+
+
+def test_registration_order_and_removal():
+    manager, queue, calls = ListenerManager(), EventQueue(), []
+    first = manager.add_listener((Player.PLAYER_1, 0), Recorder("a", calls))
+    manager.add_listener((Player.PLAYER_1, 0), Recorder(
+        "b", calls, ListenerFilter(move_type=Type.ELECTRIC), keep=False))
+    manager.add_listener((Player.PLAYER_2, 0), Recorder("c", calls))
+
+    manager.listen(hit(Player.PLAYER_1, "Thunderbolt"), queue)
+    assert calls == ["a", "b", "c"]
+    assert [l.name for l in manager.listeners[MoveHitEvent]] == ["a", "c"]  # b returned False
+
+    assert manager.remove_handle(first)
+    assert not manager.remove_handle(first)
+    manager.remove_listener((Player.PLAYER_2, 0), lambda listener: True)
+    assert manager.listeners[MoveHitEvent] == []
+
+
+def test_phase_filter():
+    manager, queue, calls = ListenerManager(), EventQueue(), []
+    manager.add_listener((Player.PLAYER_1, 0), Recorder("residual", calls, ListenerFilter(phases=("residual",))))
+    manager.add_listener((Player.PLAYER_1, 0), Recorder("always", calls))
+
+    manager.listen(hit(Player.PLAYER_1, "Tackle"), queue, phase="move")
+    assert calls == ["always"]
+    calls.clear()
+    manager.listen(hit(Player.PLAYER_1, "Tackle"), queue, phase="residual")
+    assert calls == ["residual", "always"]
+    calls.clear()
+    manager.listen(hit(Player.PLAYER_1, "Tackle"), queue)  # no phase: everyone
+    assert calls == ["residual", "always"]
+
+
+def test_unrelated_datatype_not_dispatched():
+    manager, queue, calls = ListenerManager(), EventQueue(), []
+    manager.add_listener((Player.PLAYER_1, 0), Recorder("hit", calls))
+    manager.listen(SwitchInEvent(Player.PLAYER_1, 0), queue)
+    assert calls == []
@@ -0,0 +1,95 @@
+"""
+Tests for the simultaneous-move MCTS: it respects its budget, leaves the
+searched position untouched, prefers the obviously winning move with either
+selection rule, and root-parallel searches merge their statistics, reuse
+their worker pool and finish within the caller's time limit.
+"""
+
+import time
+
+import pytest
+
+from src.actions.decision import Choice, ChoiceKind
+from src.events.event_queue import EventQueue
+from src.events.game_state import GameState
+from src.events.listener import ListenerManager
+from src.search.mcts import MCTS, DecoupledUCT, Exp3, MCTSProvider, clone_position
+from src.sim.headless import run_battle, random_policy
+from src.state.compact_state import CompactBattleState
+from src.state.pokestate import create_default_battle_state
+from src.state.pokestate_defs import Player
+from src.state.rng import BattleRng
+
+THUNDERBOLT = Choice(ChoiceKind.MOVE, 1)
+
+
+def make_game_state():
+    battle_state = create_default_battle_state(
+        ["Pikachu", "Bulbasaur"], ["Squirtle", "Rattata"],
+        [["Growl", "Thunderbolt"], ["Vine Whip", "Tackle"]],
+        [["Tackle", "Water Gun"], ["Tackle"]],
+    )
+    return GameState(battle_state, EventQueue(), ListenerManager())
+
+
+def test_search_runs_exactly_its_iterations_and_restores_the_position():
+    mcts = MCTS(seed=3)
+    position = clone_position(make_game_state(), BattleRng.seeded(3))
+    before = CompactBattleState.from_state(position.battle_state, position.field_state).buffer
+
+    result = mcts._search_position(position, iterations=50, deadline=None)
+
+    assert result.iterations == 50
+    assert sum(visits for visits, _ in result.root[Player.PLAYER_1].values()) == 50
+    assert CompactBattleState.from_state(position.battle_state, position.field_state).buffer == before
+    assert not position.listener_manager.listeners[position.battle_state.__class__]
+
+
+@pytest.mark.parametrize("rule", [DecoupledUCT(), Exp3()])
+def test_search_prefers_the_strong_move(rule):
+    result = MCTS(selection=rule, seed=1).search(make_game_state(), iterations=300)
+
+    assert result.best(Player.PLAYER_1) == THUNDERBOLT
+
+
+def test_search_requires_a_budget():
+    with pytest.raises(ValueError):
+        MCTS().search(make_game_state())
+
+
+def test_parallel_search_merges_worker_statistics():
+    with MCTS(seed=5) as mcts:
+        result = mcts.parallel_search(make_game_state(), workers=2, iterations=40)
+
+    assert result.iterations == 40
+    assert sum(visits for visits, _ in result.root[Player.PLAYER_2].values()) == 40
+
+
+def test_parallel_search_keeps_its_pool_until_closed():
+    with MCTS(seed=5) as mcts:
+        mcts.parallel_search(make_game_state(), workers=2, iterations=4)
+        pool = mcts._pool
+        mcts.parallel_search(make_game_state(), workers=2, iterations=4)
+        assert mcts._pool is pool
+
+    assert mcts._pool is None
+
+
+def test_parallel_time_limit_covers_the_whole_call():
+    with MCTS(seed=5) as mcts:
+        start = time.perf_counter()
+        result = mcts.parallel_search(make_game_state(), workers=2, time_limit=0.3)
+        elapsed = time.perf_counter() - start
+
+    assert result.iterations > 0
+    assert elapsed < 0.3 + 0.1  # pool start-up included
+
+
+def test_mcts_provider_beats_random_play():
+    team_1 = (["Pikachu"], [["Growl", "Thunderbolt"]], [None])
+    team_2 = (["Squirtle"], [["Tackle", "Tail Whip"]], [None])
+    provider = MCTSProvider(MCTS(seed=0, rollout_turns=5), iterations=30)
+
+    result = run_battle(team_1, team_2, provider, random_policy, seed=2)
+
+    assert result.winner == Player.PLAYER_1
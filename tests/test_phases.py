@@ -0,0 +1,79 @@
+"""
+Tests for the turn-phase scheduler: residual effects and sleep checks run
+exactly once per turn, statuses inflicted mid-turn still stop a slower
+target's move, a statused Pokemon cannot act even when it moves first, and
+fainted Pokemon do not act.
+"""
+
+from src.actions.choose_action import ChoiceKind
+from src.events.battle_log import MemorySink
+from src.sim.headless import run_battle
+from src.state.pokestate_defs import Player
+
+
+def first_move_policy(game_state, player, choices):
+    moves = [c for c in choices if c.kind == ChoiceKind.MOVE]
+    return moves[0] if moves else choices[0]
+
+
+def status_then_growl(game_state, player, choices):
+    """Use the status move on turn 0, then only Growl (the second move)."""
+    return choices[0] if game_state.battle_state.turn_count == 0 else choices[1]
+
+
+def messages(turn_record, text):
+    return [r.message for r in turn_record.events if text in r.message]
+
+
+def test_poison_damage_once_per_turn():
+    team_1 = (["Bulbasaur"], [["Poison Powder", "Growl"]], [None])
+    team_2 = (["Squirtle"], [["Tail Whip"]], [None])
+    result = run_battle(team_1, team_2, status_then_growl, first_move_policy,
+                        max_turns=12, seed=1, sink=MemorySink())
+    ticks = [len(messages(turn, "hurt by poison")) for turn in result.log]
+    # Poisoned during turn 0, first tick at its end, then exactly one tick per turn.
+    assert ticks == [1] * len(result.log)
+    assert result.log[-1].hp[Player.PLAYER_2] == [0]
+
+
+def test_sleep_inflicted_mid_turn_stops_slower_target():
+    team_1 = (["Jolteon"], [["Sleep Powder", "Growl"]], [None])
+    team_2 = (["Slowpoke"], [["Tackle"]], [None])
+    result = run_battle(team_1, team_2, status_then_growl, first_move_policy,
+                        max_turns=6, seed=2, sink=MemorySink())
+
+    assert not messages(result.log[0], "Slowpoke used")
+    for turn in result.log:
+        assert len(messages(turn, "fast asleep")) <= 1
+    asleep = sum(len(messages(turn, "fast asleep")) for turn in result.log)
+    woke = [i for i, turn in enumerate(result.log) if messages(turn, "woke up")]
+    # The 1-3 turn counter ticks once per turn, so Slowpoke skips 1-3 moves, then wakes.
+    assert woke and 1 <= asleep <= 3
+    assert woke[0] == asleep
+
+
+def test_sleeping_faster_pokemon_does_not_move():
+    team_1 = (["Jolteon"], [["Tackle"]], [None])
+    team_2 = (["Slowpoke"], [["Sleep Powder", "Growl"]], [None])
+    asleep = []
+    for seed in range(3):
+        result = run_battle(team_1, team_2, first_move_policy, status_then_growl,
+                            max_turns=6, seed=seed, sink=MemorySink())
+        # Jolteon already moved on turn 0, so there is no move left to skip.
+        assert messages(result.log[0], "Jolteon used") and not messages(result.log[0], "fast asleep")
+        asleep += [turn for turn in result.log if messages(turn, "fast asleep")]
+
+    assert asleep
+    for turn in asleep:
+        assert not messages(turn, "Jolteon used")
+        assert messages(turn, "Slowpoke used")
+
+
+def test_fainted_pokemon_does_not_move():
+    team_1 = (["Mewtwo"], [["Psychic"]], [None])
+    team_2 = (["Magikarp", "Caterpie"], [["Tackle"], ["Tackle"]], [None, None])
+    result = run_battle(team_1, team_2, first_move_policy, first_move_policy,
+                        seed=3, sink=MemorySink())
+    first_turn = result.log[0]
+    assert messages(first_turn, "Magikarp fainted")
+    assert not messages(first_turn, "Magikarp used")
@@ -0,0 +1,75 @@
+"""
+Tests for PokemonState construction and stats: stats are static class
+descriptors, the fast constructor builds the same state the field-by-field path
+would, and current stats are cached and computed exactly.
+"""
+
+import pytest
+
+from src.dex.stat_calculator import calculate_hp, calculate_other_stat
+import src.dex.gen1_dex as dex
+from src.events.battle_log import MemorySink, use_log_sink
+from src.state.pokestate import MoveState, PokemonState, Stat, StatAttribute
+
+
+def test_construction_leaves_class_untouched():
+    descriptors = {name: PokemonState.__dict__[name] for name in ("attack", "speed")}
+    PokemonState("Pikachu", 100, ["Thunderbolt"])
+    PokemonState("Bulbasaur", 50, ["Tackle"])
+    assert {name: PokemonState.__dict__[name] for name in ("attack", "speed")} == descriptors
+    assert isinstance(descriptors["attack"], StatAttribute)
+
+
+def test_fast_constructor_matches_dex():
+    mon = PokemonState("Pikachu", 50, ["Thunderbolt", "Quick Attack"], ability="Static")
+    info = dex.get_pokemon_by_name("Pikachu")
+    assert mon.hp == mon.hp_max == calculate_hp(info.hp, 50)
+    assert mon.speed == calculate_other_stat(info.speed, 50)
+    assert mon._speed._owner is mon
+    assert mon.ability == "Static"
+    assert mon.moves[1] == MoveState.from_dex("Quick Attack")
+    assert [(m._owner, m._slot) for m in mon.moves] == [(mon, 0), (mon, 1)]
+    assert mon.move_mask == 0b11
+    assert mon._hash is None
+
+    mon.moves[0].pp = 0
+    assert mon.move_mask == 0b10
+
+
+def test_unknown_species_is_refused():
+    with pytest.raises(ValueError, match="Unknown species: Agumon"):
+        PokemonState("Agumon", 100, ["Tackle"])
+
+
+def test_stat_assignment_boosts_and_resets():
+    mon = PokemonState("Pikachu", 100, ["Thunderbolt"])
+    base = mon.attack
+    mon.attack = "+2"
+    assert mon.attack == base * 2
+    mon.attack = "reset"
+    assert mon.attack == base
+
+    with use_log_sink(MemorySink()) as sink:
+        mon.defense = "-6"
+        mon.defense = "-1"
+    assert mon._defense._boost == -6
+    assert sink.messages() == ["Pikachu's defense won't go lower!"]
+
+
+def test_current_stat_cache_follows_base_boost_and_modifier():
+    stat = Stat.from_value(300)
+    assert stat.current_stat == 300
+    stat._boost = -1
+    assert stat.current_stat == 200  # exact 300 * 2 / 3, not a float just below it
+    stat.modifier = 0.25
+    assert stat.current_stat == 50
+    stat.base = 100
+    assert stat.current_stat == 16
+    stat.boost(3)
+    assert stat.current_stat == 50
+
+
+def test_boost_ratios_match_multipliers():
+    for boost, (numerator, denominator) in zip(range(-6, 7), Stat.BOOST_RATIOS):
+        multiplier = 1 + boost * Stat.BOOST_UNIT if boost >= 0 else 1 / (1 - boost * Stat.BOOST_UNIT)
+        assert numerator / denominator == pytest.approx(multiplier)
@@ -0,0 +1,64 @@
+"""
+Tests for the batched decision scheduler: battles play out exactly as the
+headless engine plays them, every round is a single policy call covering all
+waiting battles, and malformed policy answers are rejected.
+"""
+
+import pytest
+
+from src.sim.coroutine import BattleCoroutine
+from src.sim.headless import run_battle
+from src.sim.scheduler import BatchScheduler, batched, run_batched
+from src.state.pokestate import create_default_battle_state
+
+TEAM_1 = (
+    ["Pikachu", "Bulbasaur"],
+    [["Thunderbolt", "Quick Attack"], ["Vine Whip", "Tackle"]],
+    [None, None],
+)
+TEAM_2 = (
+    ["Squirtle", "Rattata"],
+    [["Water Gun", "Tackle"], ["Quick Attack", "Tackle"]],
+    [None, None],
+)
+
+
+def last_choice(game_state, player, choices):
+    return choices[-1]
+
+
+def test_batched_battles_match_headless_battles():
+    results = run_batched([(TEAM_1, TEAM_2), (TEAM_2, TEAM_1)] * 3, batched(last_choice), seed=20)
+
+    for i, result in enumerate(results):
+        teams = (TEAM_1, TEAM_2) if i % 2 == 0 else (TEAM_2, TEAM_1)
+        reference = run_battle(*teams, last_choice, last_choice, seed=20 + i)
+        assert (result.winner, result.turns) == (reference.winner, reference.turns)
+
+
+def test_each_round_is_one_policy_call_over_every_waiting_battle():
+    batch_sizes = []
+    answer = batched(last_choice)
+
+    def policy(requests):
+        batch_sizes.append(len(requests))
+        return answer(requests)
+
+    results = run_batched([(TEAM_1, TEAM_2)] * 8, policy, seed=0)
+
+    # Both players of all eight battles choose their leads' first moves together.
+    assert batch_sizes[0] == 16
+    assert len(batch_sizes) <= 2 * max(result.turns for result in results)
+    assert sum(batch_sizes) >= sum(2 * result.turns - 1 for result in results)
+
+
+def test_policy_must_answer_every_request():
+    names_1, moves_1, abilities_1 = TEAM_1
+    names_2, moves_2, abilities_2 = TEAM_2
+    scheduler = BatchScheduler(lambda requests: [requests[0].choices[0]])
+    scheduler.add(BattleCoroutine(
+        create_default_battle_state(names_1, names_2, moves_1, moves_2, abilities_1, abilities_2)
+    ))
+
+    with pytest.raises(ValueError):
+        scheduler.run()
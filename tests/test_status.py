@@ -324,6 +324,37 @@ def test_sleep_wears_off_after_turns_expire():
     assert rattata.status == Status.NONE
 
 
+def test_sleep_stays_with_a_non_lead_pokemon():
+    """Sleep inflicted on a switched-in Pokemon blocks its moves, not the next occupant's."""
+    gs = make_game_state(
+        ["Rattata", "Pikachu"], ["Bulbasaur", "Charmander"],
+        [["Quick Attack", "Tackle"], ["Thunderbolt", "Quick Attack"]],
+        [["Vine Whip", "Tackle"], ["Ember", "Scratch"]],
+    )
+    pikachu = gs.battle_state.get_player(Player.PLAYER_1).pk_list[1]
+    SwitchIn(Player.PLAYER_1, 1).execute(gs)
+
+    ApplyStatusAction(Player.PLAYER_1, 0, Status.SLEEP).execute(gs)
+
+    from src.events.status_listeners import SleepListener
+    [listener] = [l for l in gs.listener_manager.listeners[BattleState] if isinstance(l, SleepListener)]
+    assert listener.pokemon_idx == 1
+    assert pikachu.status == Status.SLEEP
+    listener.sleep_turns_remaining = 3
+
+    from src.events.priority import Priority
+    gs.event_queue.add_event(MoveAction(Player.PLAYER_1, 0, 0, 0), Priority(0, 100))
+    gs.listener_manager.listen(gs.battle_state, gs.event_queue)
+    assert not queue_has_move_for(gs, Player.PLAYER_1, 0)
+
+    # Benched, it keeps sleeping but leaves Rattata's move alone.
+    SwitchIn(Player.PLAYER_1, 0).execute(gs)
+    gs.event_queue.add_event(MoveAction(Player.PLAYER_1, 0, 0, 0), Priority(0, 100))
+    gs.listener_manager.listen(gs.battle_state, gs.event_queue)
+    assert queue_has_move_for(gs, Player.PLAYER_1, 0)
+    assert pikachu.status == Status.SLEEP
+
+
 # ---------------------------------------------------------------------------
 # Paralysis effects (ParalysisListener)
 # ---------------------------------------------------------------------------
@@ -347,8 +378,8 @@ def test_paralysis_reduces_speed_by_75_percent():
 def test_paralysis_can_prevent_move():
     """When paralysed, a Pokemon's queued MoveAction can be removed (chance-based).
 
-    Since move prevention is probabilistic, we mock random.random to always
-    return a value that triggers the paralysis check (< PARALYZE_CHANCE = 0.6).
+    Since move prevention is probabilistic, we mock the battle rng's chance()
+    so the paralysis check always succeeds.
     """
     gs = make_game_state(
         ["Rattata", "Pikachu"], ["Bulbasaur", "Charmander"],
@@ -367,8 +398,8 @@ def test_paralysis_can_prevent_move():
     )
     assert queue_has_move_for(gs, Player.PLAYER_1, 0)
 
-    # Force paralysis to trigger by making random.random return 0.0 (< 0.6).
-    with patch("src.events.status_listeners.random.random", return_value=0.0):
+    # Force paralysis to trigger: every roll comes from the battle's rng.
+    with patch.object(gs.rng, "chance", return_value=True):
         gs.listener_manager.listen(gs.battle_state, gs.event_queue)
 
     assert not queue_has_move_for(gs, Player.PLAYER_1, 0)
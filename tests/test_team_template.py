@@ -0,0 +1,67 @@
+"""
+Tests for precompiled team templates: instances match freshly built states,
+share nothing mutable with each other, and play identical seeded battles.
+"""
+
+from src.sim.headless import HeadlessBattle, random_policy, run_battle
+from src.state.pokestate import create_default_battle_state
+from src.state.rng import BattleRng
+from src.state.team_template import TeamTemplate, create_battle_state
+
+TEAM_1 = (
+    ["Pikachu", "Bulbasaur"],
+    [["Thunderbolt", "Thunder Wave"], ["Vine Whip", "Sleep Powder"]],
+    [None, None],
+)
+TEAM_2 = (
+    ["Squirtle", "Charmander"],
+    [["Water Gun", "Tackle"], ["Ember", "Scratch"]],
+    [None, None],
+)
+
+
+def test_instance_matches_default_battle_state():
+    fresh = create_default_battle_state(TEAM_1[0], TEAM_2[0], TEAM_1[1], TEAM_2[1])
+    cloned = create_battle_state(TeamTemplate.of(TEAM_1), TeamTemplate.of(TEAM_2))
+
+    assert cloned == fresh
+    for side in (cloned.player_1, cloned.player_2):
+        assert side.bench_mask == fresh.player_1.bench_mask
+        for i, mon in enumerate(side.pk_list):
+            assert (mon._side, mon._index) == (side, i)
+            assert all(move._owner is mon for move in mon.moves)
+            assert mon._attack._owner is mon
+
+
+def test_instances_are_independent():
+    template = TeamTemplate.of(TEAM_1)
+    first, second = template.player_state(), template.player_state()
+
+    first.pk_list[0].hp = 0
+    first.pk_list[0].attack = "+2"
+    first.pk_list[0].moves[0].pp = 0
+
+    mon = second.pk_list[0]
+    assert mon.hp == mon.hp_max
+    assert mon._attack._boost == 0
+    assert mon.moves[0].pp == mon.moves[0].pp_max
+    assert mon.move_mask == 0b11
+    assert template.player_state() == second
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / "team.txt"
+    path.write_text("Pikachu\nAbility: Static\n- Thunderbolt\n- Thunder Wave\n")
+
+    template = TeamTemplate.from_file(str(path))
+
+    assert template.names == ["Pikachu"]
+    assert template.player_state().pk_list[0].ability == "Static"
+
+
+def test_seeded_battle_matches_freshly_built_state():
+    templates = TeamTemplate.of(TEAM_1), TeamTemplate.of(TEAM_2)
+    for seed in range(5):
+        fresh = create_default_battle_state(TEAM_1[0], TEAM_2[0], TEAM_1[1], TEAM_2[1])
+        expected = HeadlessBattle(fresh, random_policy, random_policy, rng=BattleRng.seeded(seed)).run()
+        assert run_battle(*templates, seed=seed) == expected
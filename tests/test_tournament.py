@@ -0,0 +1,83 @@
+"""
+Tests for seeded battles and the round-robin tournament runner: identical
+seeds must give identical results, however the games are sharded.
+"""
+
+from src.sim.headless import random_policy, max_power_policy, run_battle
+from src.sim.tournament import derive_seed, make_entrants, run_tournament
+
+
+TEAM_A = """Pikachu
+- Thunderbolt
+- Quick Attack
+- Thunder Wave
+
+Bulbasaur
+- Vine Whip
+- Sleep Powder
+"""
+
+TEAM_B = """Squirtle
+- Water Gun
+- Tackle
+
+Charmander
+- Ember
+- Scratch
+"""
+
+TEAM_1 = (
+    ["Pikachu", "Bulbasaur"],
+    [["Thunderbolt", "Thunder Wave"], ["Vine Whip", "Sleep Powder"]],
+    [None, None],
+)
+TEAM_2 = (
+    ["Squirtle", "Charmander"],
+    [["Water Gun", "Tackle"], ["Ember", "Scratch"]],
+    [None, None],
+)
+
+
+def write_teams(tmp_path):
+    path_a = tmp_path / "team_a.txt"
+    path_b = tmp_path / "team_b.txt"
+    path_a.write_text(TEAM_A)
+    path_b.write_text(TEAM_B)
+    return [str(path_a), str(path_b)]
+
+
+def test_seeded_battle_is_reproducible():
+    first = run_battle(TEAM_1, TEAM_2, random_policy, random_policy, seed=1234)
+    second = run_battle(TEAM_1, TEAM_2, random_policy, random_policy, seed=1234)
+
+    assert first == second
+
+
+def test_derive_seed_depends_on_matchup_and_game():
+    assert derive_seed(0, (0, 1), 0) == derive_seed(0, (0, 1), 0)
+    assert derive_seed(0, (0, 1), 0) != derive_seed(0, (0, 1), 1)
+    assert derive_seed(0, (0, 1), 0) != derive_seed(0, (0, 2), 0)
+    assert derive_seed(0, (0, 1), 0) != derive_seed(1, (0, 1), 0)
+
+
+def test_tournament_matrix_is_complementary(tmp_path):
+    entrants = make_entrants(write_teams(tmp_path), {"random": random_policy})
+
+    result = run_tournament(entrants, games_per_matchup=10, max_workers=1)
+
+    matrix = result.matrix()
+    assert matrix[0][0] is None
+    assert matrix[0][1] + matrix[1][0] == 1.0
+    assert result.tallies[(0, 1)].games == 10
+
+
+def test_tournament_is_identical_across_shardings_and_workers(tmp_path):
+    entrants = make_entrants(
+        write_teams(tmp_path), {"random": random_policy, "max_power": max_power_policy}
+    )
+
+    serial = run_tournament(entrants, games_per_matchup=6, base_seed=7, max_workers=1, shard_size=6)
+    sharded = run_tournament(entrants, games_per_matchup=6, base_seed=7, max_workers=1, shard_size=2)
+    pooled = run_tournament(entrants, games_per_matchup=6, base_seed=7, max_workers=2, shard_size=3)
+
+    assert serial.matrix() == sharded.matrix() == pooled.matrix()
@@ -0,0 +1,49 @@
+"""
+Tests for the precomputed type chart: the flat tables must agree with the
+EFFECTIVENESS dict for every attacking/defending combination.
+"""
+
+import itertools
+
+import pytest
+
+from src.state.pokestate_defs import Type, get_effectiveness
+from src.state.type_chart import NO_TYPE, dual_effectiveness, effectiveness, type_index
+
+
+def test_matrix_matches_effectiveness_dict():
+    for attacking, defending in itertools.product(Type, Type):
+        assert effectiveness(attacking, defending) == get_effectiveness(attacking, defending)
+
+
+def test_dual_table_is_product_of_single_types():
+    defenders = list(Type) + [None]
+    for attacking, type1, type2 in itertools.product(Type, defenders, defenders):
+        expected = 1.0
+        for t in (type1, type2):
+            if t is not None:
+                expected *= get_effectiveness(attacking, t)
+        assert dual_effectiveness(attacking, type1, type2) == expected
+
+
+def test_dual_effectiveness_examples():
+    assert dual_effectiveness(Type.ELECTRIC, Type.WATER, Type.FLYING) == 4.0
+    assert dual_effectiveness(Type.ELECTRIC, Type.GROUND, Type.FLYING) == 0.0
+    assert dual_effectiveness(Type.FIRE, Type.GRASS, None) == 2.0
+    assert type_index(None) == NO_TYPE
+
+
+def test_vectorized_lookups_match_scalar():
+    np = pytest.importorskip("numpy")
+    from src.state.type_chart import dual_effectiveness_array, effectiveness_array
+
+    attacking = np.array([t.value for t in Type])
+    defending = np.array([t.value for t in Type])
+    matrix = effectiveness_array(attacking[:, None], defending[None, :])
+    for a, d in itertools.product(Type, Type):
+        assert matrix[a.value, d.value] == effectiveness(a, d)
+
+    type1 = np.array([Type.WATER.value, Type.GROUND.value, Type.GRASS.value])
+    type2 = np.array([Type.FLYING.value, Type.FLYING.value, NO_TYPE])
+    result = dual_effectiveness_array(Type.ELECTRIC.value, type1, type2)
+    assert result.tolist() == [4.0, 0.0, 0.5]
@@ -0,0 +1,137 @@
+"""
+Tests for the make/unmake undo log: executing actions in place and unmaking
+them restores Pokemon, field, queue, listeners and rng exactly, so a replay
+after unmake() plays out identically.
+"""
+
+from src.actions.actions import SwitchIn
+from src.actions.move_action import MoveAction
+from src.events.event_queue import EventQueue
+from src.events.game_state import GameState
+from src.events.listener import ListenerManager
+from src.events.phases import Phase
+from src.events.priority import Priority
+from src.state.compact_state import CompactBattleState
+from src.state.field import FieldSide, FieldState
+from src.state.pokestate import create_default_battle_state
+from src.state.pokestate_defs import Player
+from src.state.rng import BattleRng
+from src.state.undo import UndoLog
+
+
+def make_game_state():
+    battle_state = create_default_battle_state(
+        ["Pikachu", "Bulbasaur"], ["Squirtle", "Charmander"],
+        [["Thunder Wave", "Thunderbolt"], ["Vine Whip"]],
+        [["Spikes", "Tackle"], ["Ember"]],
+    )
+    return GameState(
+        battle_state=battle_state,
+        event_queue=EventQueue(),
+        listener_manager=ListenerManager(),
+        field_state=FieldState(player_1_side=FieldSide(hazards={}), player_2_side=FieldSide(hazards={})),
+        rng=BattleRng.seeded(7),
+    )
+
+
+def fingerprint(gs):
+    battle_state = gs.battle_state
+    return (
+        CompactBattleState.from_state(battle_state, gs.field_state).buffer.tolist(),
+        dict(gs.field_state.player_1_side.hazards),
+        sorted(
+            (item.priority, item.tiebreak, type(item.event).__name__, item.event.player)
+            for item in gs.event_queue.get_all_events()
+        ),
+        [(type(l).__name__, dict(vars(l))) for ls in gs.listener_manager.listeners.values() for l in ls],
+        [battle_state.get_player(p).bench_mask for p in Player],
+        [mon.move_mask for p in Player for mon in battle_state.get_player(p).pk_list],
+        gs.rng.getstate(),
+    )
+
+
+def play_turn(gs, p1_action, p2_action):
+    """Queue one action per side and run a turn: MOVE hooks, the queue, RESIDUAL hooks."""
+    for action in (p1_action, p2_action):
+        mon = gs.battle_state.get_player(action.player).get_active_mon(0)
+        gs.event_queue.add_event(action, Priority(6 if isinstance(action, SwitchIn) else 0, mon.speed))
+    gs.listener_manager.listen(gs.battle_state, gs.event_queue, Phase.MOVE)
+    while not gs.event_queue.empty():
+        _, action = gs.event_queue.get_next_event()
+        action.execute(gs)
+    gs.listener_manager.listen(gs.battle_state, gs.event_queue, Phase.RESIDUAL)
+    return fingerprint(gs)
+
+
+def test_unmake_restores_state_after_status_and_hazards():
+    gs = make_game_state()
+    undo = UndoLog()
+    undo.attach(gs)
+
+    before = fingerprint(gs)
+    mark = undo.mark()
+    play_turn(gs, MoveAction(Player.PLAYER_1, 0, 0, 0), MoveAction(Player.PLAYER_2, 0, 0, 0))
+    play_turn(gs, SwitchIn(Player.PLAYER_1, 1), MoveAction(Player.PLAYER_2, 1, 0, 0))
+    assert gs.battle_state.player_2.pk_list[0].status.name == "PARALYZED"
+    assert gs.field_state.player_1_side.hazards == {"Spikes": 1}
+
+    undo.unmake(mark)
+    assert len(undo) == mark
+    assert fingerprint(gs) == before
+
+
+def test_replay_after_unmake_is_identical():
+    gs = make_game_state()
+    undo = UndoLog()
+    undo.attach(gs)
+
+    def branch():
+        play_turn(gs, MoveAction(Player.PLAYER_1, 1, 0, 0), MoveAction(Player.PLAYER_2, 1, 0, 0))
+        return play_turn(gs, MoveAction(Player.PLAYER_1, 0, 0, 0), SwitchIn(Player.PLAYER_2, 1))
+
+    mark = undo.mark()
+    first = branch()
+    undo.unmake(mark)
+    mark = undo.mark()
+    assert branch() == first
+    undo.unmake(mark)
+
+
+def test_unmake_restores_cancelled_and_popped_queue_items_in_order():
+    queue = EventQueue(tie_rng=BattleRng.seeded(0))
+    undo = UndoLog()
+    queue.journal = undo
+    items = [queue.add_event(MoveAction(Player.PLAYER_1, i, 0, 0), Priority(0, 100 - i)) for i in range(3)]
+
+    mark = undo.mark()
+    queue.get_next_event()
+    queue.cancel(Player.PLAYER_1, 0, "MoveAction", lambda e: e.move_idx == 2)
+    queue.add_event(MoveAction(Player.PLAYER_2, 0, 0, 0), Priority(1, 1))
+    undo.unmake(mark)
+
+    assert queue.find(Player.PLAYER_1, 0, "MoveAction") == items
+    assert [queue.get_next_event()[1].move_idx for _ in range(3)] == [0, 1, 2]
+    assert queue.empty()
+
+
+def test_battle_state_record_saves_each_kind_of_state():
+    gs = make_game_state()
+    battle_state = gs.battle_state
+    pikachu = battle_state.player_1.pk_list[0]
+    hazards = gs.field_state.player_1_side.hazards
+
+    battle_state.record(pikachu)  # nothing attached: nothing to save, nothing raised
+    undo = UndoLog()
+    undo.attach(gs)
+    for obj in (pikachu, battle_state.player_1, hazards, gs.field_state):
+        battle_state.record(obj)
+    pikachu.hp = 1
+    battle_state.player_1.switch_pokemon(0, 1)
+    hazards["Spikes"] = 1
+    gs.field_state.weather = "sun"
+    undo.unmake()
+
+    assert len(undo) == 0
+    assert pikachu.hp == pikachu.hp_max
+    assert battle_state.player_1.active_mons == [0]
+    assert hazards == {} and gs.field_state.weather != "sun"
@@ -0,0 +1,136 @@
+"""
+Tests for the lockstep vectorized simulator: outcome rates agree with the
+reference BattleManager (damage, switching, stat changes, status moves and
+speed ties), stats floor the same way in both, finished battles stay frozen,
+and unsupported moves are refused.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.events.event_queue import EventQueue
+from src.events.game_state import GameState
+from src.events.listener import ListenerManager
+from src.sim import headless
+from src.sim.vectorized import PARALYZED, SPEED, VectorBattles, max_power_policy, random_policy
+from src.state.pokestate import create_default_battle_state
+from src.state.pokestate_defs import Player
+
+TEAM_1 = (
+    ["Pikachu", "Bulbasaur", "Charmander"],
+    [["Thunderbolt", "Quick Attack", "Seismic Toss"], ["Vine Whip", "Tackle", "Growth"],
+     ["Ember", "Scratch", "Growl", "Leer"]],
+    [None, None, None],
+)
+TEAM_2 = (
+    ["Squirtle", "Pidgey", "Rattata"],
+    [["Water Gun", "Tackle", "Bubble", "Withdraw"], ["Quick Attack", "Gust", "Sand Attack"],
+     ["Quick Attack", "Tackle", "Tail Whip"]],
+    [None, None, None],
+)
+
+
+def reference_rates(team_1, team_2, policy, n):
+    results = [headless.run_battle(team_1, team_2, policy, policy, seed=seed) for seed in range(n)]
+    wins = sum(result.winner == Player.PLAYER_1 for result in results) / n
+    return wins, sum(result.turns for result in results) / n
+
+
+@pytest.mark.parametrize("policies", [
+    (random_policy, headless.random_policy),
+    (max_power_policy, headless.max_power_policy),
+])
+def test_team_battles_agree_with_the_reference(policies):
+    vector_policy, reference_policy = policies
+    n = 600
+    wins, turns = reference_rates(TEAM_1, TEAM_2, reference_policy, n)
+
+    result = VectorBattles.from_teams(TEAM_1, TEAM_2, k=20000, seed=0).run(vector_policy, vector_policy)
+
+    assert result.win_rate(Player.PLAYER_1) == pytest.approx(wins, abs=4 * (0.25 / n) ** 0.5)
+    assert result.turns.mean() == pytest.approx(turns, rel=0.05)
+
+
+def test_status_moves_agree_with_the_reference():
+    team_1 = (["Pikachu"], [["Thunder Wave", "Tackle", "Growl"]], [None])
+    team_2 = (["Bulbasaur"], [["Sleep Powder", "Tackle", "Poison Powder"]], [None])
+    n = 1500
+    wins, turns = reference_rates(team_1, team_2, headless.random_policy, n)
+
+    result = VectorBattles.from_teams(team_1, team_2, k=20000, seed=0).run()
+
+    assert result.win_rate(Player.PLAYER_1) == pytest.approx(wins, abs=4 * (0.1 / n) ** 0.5)
+    assert result.turns.mean() == pytest.approx(turns, rel=0.05)
+
+
+def test_status_on_benched_and_replacement_pokemon_agrees_with_the_reference():
+    # Thunder Wave and Sleep Powder only come in after the lead, and statused
+    # Pokemon are switched out and back in.
+    team_1 = (
+        ["Charmander", "Pikachu", "Bulbasaur"],
+        [["Ember", "Scratch", "Growl", "Leer"], ["Thunderbolt", "Quick Attack", "Thunder Wave", "Seismic Toss"],
+         ["Vine Whip", "Tackle", "Growth", "Sleep Powder"]],
+        [None, None, None],
+    )
+    n = 1500
+    wins, turns = reference_rates(team_1, TEAM_2, headless.random_policy, n)
+
+    result = VectorBattles.from_teams(team_1, TEAM_2, k=20000, seed=0).run()
+
+    assert result.win_rate(Player.PLAYER_1) == pytest.approx(wins, abs=4 * (0.25 / n) ** 0.5)
+    assert result.turns.mean() == pytest.approx(turns, rel=0.05)
+
+
+def test_speed_ties_match_the_reference_queue():
+    battle_state = create_default_battle_state(
+        ["Rattata", "Pidgey"], ["Rattata"], [["Tackle"], ["Tackle"]], [["Tackle"]]
+    )
+    battle_state.player_1.pk_list[0].hp = 5
+    battle_state.player_2.pk_list[0].hp = 5
+    battles = VectorBattles.from_game_state(
+        GameState(battle_state, EventQueue(), ListenerManager()), k=30000, seed=4
+    )
+
+    battles.step(max_power_policy, max_power_policy)
+
+    p1_up, p2_up = battles.hp[:, 0, 0] > 0, battles.hp[:, 1, 0] > 0
+    # Same split as test_chance's exact enumeration of this position.
+    assert p1_up.mean() == pytest.approx(1 / 2, abs=0.015)
+    assert (p1_up != p2_up).all()
+
+
+def test_stats_floor_like_the_reference():
+    battles = VectorBattles.from_teams(TEAM_1, TEAM_2, k=13, seed=0)
+    rows = np.arange(13)
+    battles.boosts[rows, 0, 0, SPEED] = rows - 6
+    battles.status[7:, 0, 0] = PARALYZED
+    pikachu = create_default_battle_state(["Pikachu"], ["Squirtle"], [["Tackle"]], [["Tackle"]]).player_1.pk_list[0]
+
+    expected = []
+    for boost in range(-6, 7):
+        pikachu._speed._boost = boost
+        pikachu._speed.modifier = 0.25 if boost >= 1 else 1.0
+        expected.append(pikachu.speed)
+
+    assert battles._stat(rows, 0, 0, SPEED).tolist() == expected
+
+
+def test_finished_battles_are_frozen():
+    battles = VectorBattles.from_teams(TEAM_1, TEAM_2, k=64, seed=1)
+    while not battles.done.any():
+        battles.step(random_policy, random_policy)
+    done = battles.done.copy()
+    hp, turns, winner = battles.hp[done].copy(), battles.turns[done].copy(), battles.winner[done].copy()
+
+    battles.step(random_policy, random_policy)
+
+    assert (battles.hp[done] == hp).all()
+    assert (battles.turns[done] == turns).all()
+    assert (battles.winner[done] == winner).all()
+
+
+def test_unsupported_moves_are_refused():
+    team = (["Pikachu"], [["Thunderbolt", "Spikes"]], [None])
+    with pytest.raises(ValueError):
+        VectorBattles.from_teams(team, TEAM_2, k=4)
@@ -0,0 +1,77 @@
+"""
+Tests for Zobrist position hashing and the transposition table: equal
+positions hash equal, every covered feature changes the hash, the cached
+per-Pokemon shares never go stale, and the table's replacement policy keeps
+deep entries.
+"""
+
+from src.search.transposition import TranspositionTable
+from src.search.zobrist import position_hash
+from src.state.field import FieldSide, FieldState
+from src.state.pokestate import create_default_battle_state
+from src.state.pokestate_defs import Status
+
+
+def make_position():
+    battle_state = create_default_battle_state(
+        ["Pikachu", "Bulbasaur"], ["Squirtle"],
+        [["Thunderbolt", "Growl"], ["Tackle"]], [["Tackle"]],
+    )
+    return battle_state, FieldState(FieldSide(hazards={}), FieldSide(hazards={}))
+
+
+def uncached_hash(battle_state, field_state):
+    for player_state in (battle_state.player_1, battle_state.player_2):
+        for mon in player_state.pk_list:
+            mon._hash = None
+    return position_hash(battle_state, field_state)
+
+
+def test_equal_positions_hash_equal():
+    assert position_hash(*make_position()) == position_hash(*make_position())
+
+
+def test_every_feature_changes_the_hash_and_cache_stays_fresh():
+    battle_state, field_state = make_position()
+    pikachu = battle_state.player_1.pk_list[0]
+    mutations = [
+        lambda: setattr(pikachu, "hp", pikachu.hp // 2),
+        lambda: setattr(pikachu, "status", Status.PARALYZED),
+        lambda: pikachu._speed.boost(-1),
+        lambda: setattr(pikachu.moves[0], "pp", pikachu.moves[0].pp - 1),
+        lambda: battle_state.player_1.switch_pokemon(0, 1),
+        lambda: field_state.player_2_side.hazards.update({"Spikes": 1}),
+        lambda: setattr(field_state, "weather", "rain"),
+    ]
+    seen = {position_hash(battle_state, field_state)}
+    for mutate in mutations:
+        mutate()
+        h = position_hash(battle_state, field_state)
+        assert h not in seen
+        assert h == uncached_hash(battle_state, field_state)
+        seen.add(h)
+
+
+def test_small_hp_differences_share_a_bucket():
+    battle_state, field_state = make_position()
+    before = position_hash(battle_state, field_state)
+    battle_state.player_2.pk_list[0].hp -= 1
+
+    assert position_hash(battle_state, field_state) == before
+
+
+def test_transposition_table_prefers_depth_and_keeps_the_newest():
+    table = TranspositionTable(bits=1)
+    a, b, c = 0b10, 0b100, 0b1000  # all map to bucket 0
+
+    table.store(a, "deep", depth=5)
+    table.store(b, "shallow", depth=1)
+    assert table.get(a) == "deep" and table.get(b) == "shallow"
+
+    table.store(c, "newer", depth=0)  # evicts the always-replace entry, not the deep one
+    assert table.get(a) == "deep" and table.get(c) == "newer" and table.get(b) is None
+
+    table.new_search()
+    table.store(b, "fresh", depth=0)  # an old generation no longer protects depth
+    assert table.get(b) == "fresh" and table.get(a) == "deep"
+    assert len(table) == 2 and table.capacity == 4